@@ -0,0 +1,332 @@
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # agregasi kohort membutuhkan numpy
+    np = None
+
+ANALYTICS_FORMAT_VERSION = 1
+
+
+def _grow(values, length, axis=0):
+    """values padded with zeros along axis up to length"""
+    missing = length - values.shape[axis]
+    if missing <= 0:
+        return values
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (0, missing)
+    return np.pad(values, pad)
+
+
+class CohortAnalytics:
+    """Additive cohort aggregates over integer-coded careers and skills
+
+    State is a handful of count/sum arrays indexed by career (and career x skill
+    for the gap heatmap), so a new day's cohort is folded in with bincounts and
+    history is never rescanned. Sector averages are derived from the per-career
+    sums through the career -> industries incidence at report time.
+    """
+
+    def __init__(self, job_market):
+        self.careers = []
+        self.skills = []
+        self._career_codes = {}
+        self._skill_codes = {}
+        self.industries = {career: tuple(details.get('industries', ()))
+                           for career, details in job_market.items()}
+        for career in job_market:
+            self._career_code(career)
+
+        self.students = 0
+        self.students_with_budget = 0
+        self.students_top_feasible = 0
+        self.recommendations = np.zeros(len(self.careers), dtype=np.int64)
+        self.top_picks = np.zeros(len(self.careers), dtype=np.int64)
+        self.score_sum = np.zeros(len(self.careers), dtype=np.float64)
+        self.budget_known = np.zeros(len(self.careers), dtype=np.int64)
+        self.budget_feasible = np.zeros(len(self.careers), dtype=np.int64)
+        self.gap_counts = np.zeros((len(self.careers), 0), dtype=np.int64)
+        self.batches = []           # [{'label', 'catalog_version', 'profiles'}]
+
+    def _career_code(self, career):
+        code = self._career_codes.get(career)
+        if code is None:
+            code = self._career_codes[career] = len(self.careers)
+            self.careers.append(career)
+        return code
+
+    def _skill_code(self, skill):
+        code = self._skill_codes.get(skill)
+        if code is None:
+            code = self._skill_codes[skill] = len(self.skills)
+            self.skills.append(skill)
+        return code
+
+    def _recode(self, names, code_of):
+        """Lookup array translating a file's dictionary codes to ours"""
+        return np.array([code_of(name) for name in names], dtype=np.int64)
+
+    def _check_label(self, label):
+        if label is not None and any(batch['label'] == label for batch in self.batches):
+            raise ValueError(f"cohort '{label}' was already added")
+
+    def add_cohort(self, table, label=None):
+        """Fold in a CohortTable from career_columnar.open_cohort"""
+        self._check_label(label)
+        careers = self._recode(table.dictionaries['career'], self._career_code)
+        skills = self._recode(table.dictionaries['skill'], self._skill_code)
+        offsets, values = table.lists['missing_skills']
+        budget = np.asarray(table.columns['budget_idr'])
+        self._accumulate(
+            careers[table.columns['career']],
+            np.asarray(table.columns['rank']),
+            np.asarray(table.columns['score']),
+            ~np.isnan(budget),
+            np.asarray(table.columns['budget_feasible']).astype(bool),
+            np.asarray(offsets, dtype=np.int64),
+            skills[values] if len(values) else np.zeros(0, dtype=np.int64),
+            int(table.meta['profiles']))
+        self.batches.append({'label': label, 'catalog_version': table.meta['catalog_version'],
+                             'profiles': int(table.meta['profiles'])})
+
+    def add_results(self, results, label=None, catalog_version=None):
+        """Fold in career_batch result dicts (JSONL output); budgets are unknown there"""
+        self._check_label(label)
+        careers, ranks, scores, offsets, gaps = [], [], [], [0], []
+        profiles = 0
+        for result in results:
+            recommendations = result.get('recommendations')
+            if recommendations is None:
+                continue
+            profiles += 1
+            for rank, recommendation in enumerate(recommendations, 1):
+                careers.append(self._career_code(recommendation['career']))
+                ranks.append(rank)
+                scores.append(recommendation['score'])
+                gaps.extend(self._skill_code(skill) for skill in recommendation['missing_skills'])
+                offsets.append(len(gaps))
+        unknown = np.zeros(len(careers), dtype=bool)
+        self._accumulate(np.array(careers, dtype=np.int64), np.array(ranks, dtype=np.int64),
+                         np.array(scores, dtype=np.float64), unknown, unknown,
+                         np.array(offsets, dtype=np.int64), np.array(gaps, dtype=np.int64),
+                         profiles)
+        self.batches.append({'label': label, 'catalog_version': catalog_version,
+                             'profiles': profiles})
+
+    def _accumulate(self, careers, ranks, scores, budget_known, feasible,
+                    gap_offsets, gap_skills, profiles):
+        n_careers = len(self.careers)
+        n_skills = len(self.skills)
+        for name in ('recommendations', 'top_picks', 'score_sum', 'budget_known',
+                     'budget_feasible'):
+            setattr(self, name, _grow(getattr(self, name), n_careers))
+        self.gap_counts = _grow(_grow(self.gap_counts, n_careers, 0), n_skills, 1)
+
+        top = ranks == 1
+        self.recommendations += np.bincount(careers, minlength=n_careers)
+        self.top_picks += np.bincount(careers[top], minlength=n_careers)
+        self.score_sum += np.bincount(careers, weights=scores, minlength=n_careers)
+        self.budget_known += np.bincount(careers, weights=budget_known,
+                                         minlength=n_careers).astype(np.int64)
+        feasible_known = feasible & budget_known
+        self.budget_feasible += np.bincount(careers, weights=feasible_known,
+                                            minlength=n_careers).astype(np.int64)
+
+        # Heatmap: setiap skill yang hilang dihitung di sel (karir, skill)
+        if len(gap_skills):
+            gap_careers = np.repeat(careers, np.diff(gap_offsets))
+            cells = np.bincount(gap_careers * n_skills + gap_skills,
+                                minlength=n_careers * n_skills)
+            self.gap_counts += cells.reshape(n_careers, n_skills)
+
+        # Per siswa: apakah pilihan teratas terjangkau oleh budget-nya
+        self.students += profiles
+        self.students_with_budget += int(np.count_nonzero(top & budget_known))
+        self.students_top_feasible += int(np.count_nonzero(top & feasible_known))
+
+    def career_demand(self):
+        """Per-career rows sorted by how often the career was recommended"""
+        rows = []
+        for code in np.argsort(-self.recommendations, kind='stable'):
+            count = int(self.recommendations[code])
+            if not count:
+                continue
+            known = int(self.budget_known[code])
+            rows.append({
+                'career': self.careers[code],
+                'recommendations': count,
+                'top_picks': int(self.top_picks[code]),
+                'top_pick_share': (float(self.top_picks[code] / self.students)
+                                   if self.students else 0.0),
+                'avg_score': float(self.score_sum[code] / count),
+                'budget_coverage': float(self.budget_feasible[code] / known) if known else None,
+            })
+        return rows
+
+    def skill_gap_heatmap(self, top_skills=20, careers=None):
+        """(careers, skills, shares): share of a career's recommendations missing each skill
+
+        Columns are the top_skills skills missing most often over the chosen careers.
+        """
+        if careers is None:
+            codes = np.flatnonzero(self.recommendations)
+        else:
+            codes = np.array([self._career_codes[career] for career in careers
+                              if career in self._career_codes], dtype=np.int64)
+        counts = self.gap_counts[codes]
+        order = np.argsort(-counts.sum(axis=0), kind='stable')[:top_skills]
+        order = order[counts[:, order].sum(axis=0) > 0]
+        totals = np.maximum(self.recommendations[codes], 1)[:, None]
+        return ([self.careers[code] for code in codes],
+                [self.skills[code] for code in order],
+                counts[:, order] / totals)
+
+    def sector_match(self):
+        """{sector: average match score of recommendations in that sector}"""
+        sectors = sorted({sector for industries in self.industries.values()
+                          for sector in industries})
+        index = {sector: i for i, sector in enumerate(sectors)}
+        incidence = np.zeros((len(self.careers), len(sectors)))
+        for code, career in enumerate(self.careers):
+            for sector in self.industries.get(career, ()):
+                incidence[code, index[sector]] = 1.0
+        counts = self.recommendations @ incidence
+        sums = self.score_sum @ incidence
+        return {sector: float(sums[i] / counts[i])
+                for i, sector in enumerate(sectors) if counts[i]}
+
+    def budget_coverage(self):
+        """Share of students (with a known budget) who can afford their top pick"""
+        if not self.students_with_budget:
+            return None
+        return self.students_top_feasible / self.students_with_budget
+
+    def report(self, top_skills=10):
+        careers, skills, shares = self.skill_gap_heatmap(top_skills)
+        return {
+            'students': self.students,
+            'batches': list(self.batches),
+            'budget_coverage': self.budget_coverage(),
+            'careers': self.career_demand(),
+            'sector_match': self.sector_match(),
+            'skill_gaps': {
+                'skills': skills,
+                'careers': {career: [round(float(share), 4) for share in row]
+                            for career, row in zip(careers, shares)},
+            },
+        }
+
+    def save(self, path):
+        """Persist the aggregates so the next cohort can be added without history"""
+        meta = {'format_version': ANALYTICS_FORMAT_VERSION, 'students': self.students,
+                'students_with_budget': self.students_with_budget,
+                'students_top_feasible': self.students_top_feasible,
+                'batches': self.batches, 'industries': self.industries}
+        with open(path, 'wb') as f:
+            np.savez(f, careers=np.array(self.careers, dtype=str),
+                     skills=np.array(self.skills, dtype=str),
+                     recommendations=self.recommendations, top_picks=self.top_picks,
+                     score_sum=self.score_sum, budget_known=self.budget_known,
+                     budget_feasible=self.budget_feasible, gap_counts=self.gap_counts,
+                     meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path, job_market=None):
+        """Aggregates saved by save(); job_market adds careers/sectors from a newer catalog"""
+        with np.load(path) as saved:
+            meta = json.loads(str(saved['meta']))
+            if meta.get('format_version') != ANALYTICS_FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported analytics state format")
+            analytics = cls({})
+            analytics.industries = {career: tuple(industries)
+                                    for career, industries in meta['industries'].items()}
+            for career in saved['careers']:
+                analytics._career_code(str(career))
+            for skill in saved['skills']:
+                analytics._skill_code(str(skill))
+            for name in ('recommendations', 'top_picks', 'score_sum', 'budget_known',
+                         'budget_feasible', 'gap_counts'):
+                setattr(analytics, name, saved[name].copy())
+        for name in ('students', 'students_with_budget', 'students_top_feasible', 'batches'):
+            setattr(analytics, name, meta[name])
+        if job_market is not None:
+            for career, details in job_market.items():
+                analytics.industries[career] = tuple(details.get('industries', ()))
+                analytics._career_code(career)
+        return analytics
+
+
+def print_report(report, stream=None):
+    def out(text=""):
+        print(text, file=stream)
+
+    coverage = report['budget_coverage']
+    out(f"=== Cohort analytics: {report['students']:,} students, "
+        f"{len(report['batches'])} batches ===")
+    out("Top pick affordable: " + ("n/a (no budgets)" if coverage is None
+                                   else f"{coverage * 100:.1f}%"))
+    out()
+    out(f"{'career':<28} {'recs':>8} {'top%':>6} {'avg':>6} {'budget%':>8}")
+    for row in report['careers']:
+        budget = row['budget_coverage']
+        budget = "-" if budget is None else f"{budget * 100:.1f}"
+        out(f"{row['career']:<28} {row['recommendations']:>8,} "
+            f"{row['top_pick_share'] * 100:>6.1f} {row['avg_score']:>6.1f} {budget:>8}")
+    out()
+    out("Average match per sector:")
+    for sector, score in sorted(report['sector_match'].items(), key=lambda item: -item[1]):
+        out(f"  {sector:<20} {score:6.1f}")
+    gaps = report['skill_gaps']
+    if gaps['skills']:
+        out()
+        out("Missing-skill share per career (top skills):")
+        for career, shares in gaps['careers'].items():
+            cells = ", ".join(f"{skill} {share * 100:.0f}%"
+                              for skill, share in zip(gaps['skills'], shares) if share)
+            out(f"  {career}: {cells}")
+
+
+def _input_label(path):
+    """Resolved path plus content hash, e.g. '/data/day1.npz@3f2a...'"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return f"{Path(path).resolve()}@{digest.hexdigest()[:16]}"
+
+
+def update_analytics(inputs, state_path=None, job_market=None, progress_stream=None):
+    """Add cohort files (.npz/.arrow/.parquet) or batch JSONL output to saved state
+
+    Each input is labelled by its resolved path and content hash. An input whose
+    content was already added (under any path) is skipped and reported on
+    progress_stream (stderr by default), so re-running a day's update is harmless.
+    """
+    from career_columnar import open_cohort, FORMAT_SUFFIXES
+
+    stream = progress_stream if progress_stream is not None else sys.stderr
+    if state_path is not None and Path(state_path).exists():
+        analytics = CohortAnalytics.load(state_path, job_market)
+    else:
+        analytics = CohortAnalytics(job_market or {})
+    # Label lama (tanpa '@hash') tidak pernah cocok dengan hash konten
+    added = {batch['label'].rpartition('@')[2]: batch['label']
+             for batch in analytics.batches if batch['label']}
+    for path in inputs:
+        label = _input_label(path)
+        content = label.rpartition('@')[2]
+        if content in added:
+            print(f"[skip] {path}: already added as {added[content]}", file=stream)
+            continue
+        if Path(path).suffix.lower() in FORMAT_SUFFIXES:
+            analytics.add_cohort(open_cohort(path), label)
+        else:
+            with open(path, encoding='utf-8') as f:
+                analytics.add_results((json.loads(line) for line in f if line.strip()), label)
+        added[content] = label
+    if state_path is not None:
+        analytics.save(state_path)
+    return analytics
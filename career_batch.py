@@ -0,0 +1,272 @@
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+
+from career_cache import SQLiteResultCache
+from career_columnar import CohortWriter
+from career_tc import CareerPathAdvisor
+
+
+def iter_profiles(lines):
+    """Yield (line_no, profile dict or error message) for each non-empty JSONL line"""
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            profile = json.loads(line)
+        except ValueError as exc:
+            yield line_no, f"invalid JSON: {exc}"
+            continue
+        if not isinstance(profile, dict):
+            yield line_no, "profile must be a JSON object"
+            continue
+        yield line_no, profile
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items without materializing the whole input"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def serialize_recommendation(recommendation):
+    """JSON-friendly view of a recommend_paths entry (job details are dropped)"""
+    return {
+        'career': recommendation['career'],
+        'score': recommendation['score'],
+        'salary': recommendation['salary'],
+        'missing_skills': list(recommendation['missing_skills']),
+        'emerging_gaps': list(recommendation['emerging_gaps'])
+    }
+
+
+def score_profile_chunk(advisor, entries, top_n=3):
+    """Score one chunk of (line_no, profile) entries, returning result dicts in order"""
+    results = [None] * len(entries)
+    valid_positions = []
+    user_profiles = []
+    for position, (line_no, profile) in enumerate(entries):
+        if isinstance(profile, str):
+            results[position] = {'line': line_no, 'error': profile}
+            continue
+        try:
+            user_profiles.append(advisor.normalize_profile(profile))
+        except (AttributeError, TypeError, ValueError) as exc:
+            results[position] = {'line': line_no, 'id': profile.get('id'),
+                                 'error': f"invalid profile: {exc}"}
+            continue
+        valid_positions.append(position)
+
+    recommendations = advisor.recommend_paths_batch(user_profiles, top_n)
+    for position, recs in zip(valid_positions, recommendations):
+        line_no, profile = entries[position]
+        results[position] = {
+            'line': line_no,
+            'id': profile.get('id'),
+            'recommendations': [serialize_recommendation(rec) for rec in recs]
+        }
+    return results
+
+
+def score_stream(advisor, lines, top_n=3, chunk_size=1000):
+    """Lazily score JSONL lines chunk by chunk; memory stays bounded by chunk_size"""
+    for chunk in chunked(iter_profiles(lines), chunk_size):
+        yield from score_profile_chunk(advisor, chunk, top_n)
+
+
+# Advisor milik proses worker, dibuat sekali oleh _init_worker
+_worker_advisor = None
+
+
+def _init_worker(result_cache_path=None, ranking=None):
+    """ProcessPoolExecutor initializer: bind the worker's advisor once"""
+    global _worker_advisor
+    _worker_advisor = CareerPathAdvisor()
+    if ranking is not None:
+        _worker_advisor.ranking = ranking
+    if result_cache_path:
+        _worker_advisor.enable_result_cache(SQLiteResultCache(result_cache_path))
+
+
+def _score_entries_in_worker(entries, top_n):
+    return score_profile_chunk(_worker_advisor, entries, top_n)
+
+
+def _rank_profiles_in_worker(user_profiles, top_n):
+    # Kirim balik (career, score) saja; detail job direkonstruksi di parent
+    return [[(rec['career'], rec['score']) for rec in recs]
+            for recs in _worker_advisor.recommend_paths_batch(user_profiles, top_n)]
+
+
+def _process_pool(workers, result_cache_path=None, ranking=None):
+    """Worker pool that starts with the reference data already loaded"""
+    # Bangun snapshot di parent dulu: dengan fork, worker mewarisinya tanpa pickling
+    CareerPathAdvisor.shared_reference_data()
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker,
+                               initargs=(result_cache_path, ranking))
+
+
+def _ordered_results(pool, function, chunks, top_n, max_pending):
+    """Submit chunks with a bounded in-flight window, yielding results in input order"""
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(function, chunk, top_n))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def score_stream_parallel(lines, top_n=3, chunk_size=1000, workers=None,
+                          result_cache_path=None, ranking=None):
+    """Multiprocess score_stream: same output order, chunks fanned out to workers"""
+    workers = workers or os.cpu_count() or 1
+    with _process_pool(workers, result_cache_path, ranking) as pool:
+        chunks = chunked(iter_profiles(lines), chunk_size)
+        for results in _ordered_results(pool, _score_entries_in_worker, chunks,
+                                        top_n, max_pending=workers * 2):
+            yield from results
+
+
+def recommend_paths_parallel(user_profiles, top_n=3, chunk_size=1000,
+                             workers=None, advisor=None):
+    """recommend_paths for a list of normalized profiles across CPU cores"""
+    advisor = advisor if advisor is not None else CareerPathAdvisor()
+    user_profiles = list(user_profiles)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return advisor.recommend_paths_batch(user_profiles, top_n)
+
+    results = []
+    with _process_pool(workers, ranking=advisor.ranking) as pool:
+        chunks = chunked(user_profiles, chunk_size)
+        ranked_chunks = _ordered_results(pool, _rank_profiles_in_worker, chunks,
+                                         top_n, max_pending=workers * 2)
+        user_iter = iter(user_profiles)
+        for ranked_chunk in ranked_chunks:
+            for ranked in ranked_chunk:
+                user_skills = next(user_iter)['skills']
+                results.append([
+                    advisor._build_recommendation(advisor.job_index[career],
+                                                  user_skills, score)
+                    for career, score in ranked
+                ])
+    return results
+
+
+class ProgressCounter:
+    """Counts processed profiles and reports throughput every N items"""
+
+    def __init__(self, every=10000, stream=None):
+        self.every = every
+        self.stream = stream if stream is not None else sys.stderr
+        self.count = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+
+    def update(self, result):
+        self.count += 1
+        if 'error' in result:
+            self.errors += 1
+        if self.every and self.count % self.every == 0:
+            self.report()
+
+    @property
+    def rate(self):
+        elapsed = time.perf_counter() - self.started
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def report(self, final=False):
+        label = "done" if final else "progress"
+        print(f"[{label}] {self.count} profiles ({self.errors} errors) "
+              f"- {self.rate:,.0f} profiles/s", file=self.stream)
+
+
+def _open(path, mode, stack):
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return stack.enter_context(open(path, mode, encoding='utf-8'))
+
+
+def run_batch(input_path, output_path, top_n=3, chunk_size=1000,
+              progress_every=10000, advisor=None, progress_stream=None, workers=1,
+              result_cache_path=None, ranking=None):
+    """Stream profiles from JSONL input to JSONL results, writing incrementally"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    progress = ProgressCounter(progress_every, progress_stream)
+
+    with ExitStack() as stack:
+        source = _open(input_path, 'r', stack)
+        sink = _open(output_path, 'w', stack)
+        if workers == 1:
+            advisor = advisor if advisor is not None else CareerPathAdvisor()
+            if ranking is not None:
+                advisor.ranking = ranking
+            if result_cache_path:
+                advisor.enable_result_cache(SQLiteResultCache(result_cache_path))
+            results = score_stream(advisor, source, top_n, chunk_size)
+        else:
+            results = score_stream_parallel(source, top_n, chunk_size, workers,
+                                            result_cache_path, ranking)
+        for result in results:
+            sink.write(json.dumps(result, ensure_ascii=False) + '\n')
+            progress.update(result)
+        sink.flush()
+
+    if progress_every:
+        progress.report(final=True)
+    return progress
+
+
+def export_columnar(input_path, output_path, top_n=3, chunk_size=10000, format='auto',
+                    progress_every=10000, advisor=None, progress_stream=None, ranking=None):
+    """Score JSONL profiles into one columnar cohort file (see career_columnar)
+
+    Invalid lines are counted as errors and left out of the file; a profile's
+    optional "region" field becomes the region column.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    advisor = advisor if advisor is not None else CareerPathAdvisor()
+    if ranking is not None:
+        advisor.ranking = ranking
+    writer = CohortWriter(output_path, advisor, format)
+    progress = ProgressCounter(progress_every, progress_stream)
+
+    with ExitStack() as stack:
+        source = _open(input_path, 'r', stack)
+        for chunk in chunked(iter_profiles(source), chunk_size):
+            valid = []
+            for line_no, profile in chunk:
+                if isinstance(profile, str):
+                    progress.update({'error': profile})
+                    continue
+                try:
+                    valid.append((advisor.normalize_profile(profile), profile))
+                except (AttributeError, TypeError, ValueError) as exc:
+                    progress.update({'error': f"invalid profile: {exc}"})
+            recommendations = advisor.recommend_paths_batch(
+                [user_data for user_data, _ in valid], top_n)
+            for (user_data, profile), recs in zip(valid, recommendations):
+                writer.add(user_data, recs, profile.get('id'), profile.get('region'))
+                progress.update({})
+    writer.close()
+
+    if progress_every:
+        progress.report(final=True)
+    return writer
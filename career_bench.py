@@ -0,0 +1,291 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+from career_tc import CareerPathAdvisor, np
+
+# Nilai constraint yang dipakai profil sintetis (mendekati input nyata)
+SYNTHETIC_TIMELINES = (6, 12, 18, 24, 36, 48, 60)
+SYNTHETIC_HOURS = (2, 5, 8, 10, 15, 20, 30)
+SYNTHETIC_ENVIRONMENTS = ('office', 'remote', 'hybrid', 'flexible', 'field_work')
+
+
+def sample_profile():
+    """A fixed mid-level profile used by the roadmap benchmark"""
+    return {
+        'skills': {'python': 0.6, 'communication': 0.9, 'excel': 0.3},
+        'experience': {}, 'interests': [], 'career_goals': [],
+        'constraints': {'time_availability': 10, 'financial_investment': 20000000,
+                        'timeline_months': 24},
+        'preferences': {'work_environment': ['office', 'remote']}
+    }
+
+
+def synthetic_profiles(advisor, count, seed=0):
+    """Yield `count` seeded user_data dicts drawn from the advisor's real vocabularies
+
+    The same seed and catalog always give the same cohort, so runs are comparable.
+    """
+    rng = random.Random(seed)
+    skills = sorted(set(advisor.skill_ids) | set(advisor.graph_skill_ids))
+    levels = sorted(set(advisor.skill_level_mapping.values()))
+    # Budget di sekitar biaya karir nyata (0.1x - 2x), plus sebagian kecil gratis
+    costs = sorted({record.estimated_cost_idr for record in advisor.job_index.values()
+                    if record.estimated_cost_idr})
+    for _ in range(count):
+        chosen = rng.sample(skills, rng.randint(1, 8))
+        budget = 0.0 if rng.random() < 0.05 else round(
+            rng.choice(costs) * rng.uniform(0.1, 2.0), -5)
+        yield {
+            'skills': {skill: rng.choice(levels) for skill in chosen},
+            'experience': {}, 'interests': [], 'career_goals': [],
+            'constraints': {'time_availability': float(rng.choice(SYNTHETIC_HOURS)),
+                            'financial_investment': budget,
+                            'timeline_months': rng.choice(SYNTHETIC_TIMELINES)},
+            'preferences': {'work_environment': rng.sample(
+                SYNTHETIC_ENVIRONMENTS, rng.randint(0, 2))}
+        }
+
+
+def latency_stats(timings):
+    """Mean and p50/p95/p99/max of per-call timings, in microseconds"""
+    ordered = sorted(timings)
+    if not ordered:
+        return {'calls': 0}
+
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1e6
+
+    return {
+        'calls': len(ordered),
+        'mean_us': statistics.mean(ordered) * 1e6,
+        'p50_us': percentile(0.50),
+        'p95_us': percentile(0.95),
+        'p99_us': percentile(0.99),
+        'max_us': ordered[-1] * 1e6,
+    }
+
+
+def _time_roadmaps(advisor, user_data, recommendations, rounds, before_each=None):
+    """Time generate_learning_roadmap per call with stdout captured"""
+    timings = []
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for _ in range(rounds):
+            for recommendation in recommendations:
+                if before_each is not None:
+                    before_each()
+                start = time.perf_counter()
+                advisor.generate_learning_roadmap(user_data, recommendation)
+                timings.append(time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+    return timings
+
+
+def bench_roadmap(rounds=200):
+    """Per-roadmap latency with the resource database rebuilt vs cached"""
+    advisor = CareerPathAdvisor()
+    user_data = sample_profile()
+    recommendations = advisor.recommend_paths(user_data)
+
+    # "before": setiap roadmap membangun ulang database resources
+    uncached = _time_roadmaps(advisor, user_data, recommendations, rounds,
+                              before_each=CareerPathAdvisor.reload_learning_resources)
+    cached = _time_roadmaps(advisor, user_data, recommendations, rounds)
+
+    results = {}
+    for label, timings in (('rebuilt', uncached), ('cached', cached)):
+        results[label] = {
+            'roadmaps': len(timings),
+            'mean_us': statistics.mean(timings) * 1e6,
+            'median_us': statistics.median(timings) * 1e6,
+        }
+    return results
+
+
+def bench_calculate_score(advisor, profiles):
+    """Latency of one _calculate_score call (every profile against every job)"""
+    jobs = list(advisor.job_market.items())
+    timings = []
+    for user_data in profiles:
+        for job_key, details in jobs:
+            start = time.perf_counter()
+            advisor._calculate_score(user_data, job_key, details)
+            timings.append(time.perf_counter() - start)
+    return latency_stats(timings)
+
+
+def bench_recommend_paths(advisor, profiles, top_n=3):
+    """Per-profile recommend_paths latency"""
+    timings = []
+    for user_data in profiles:
+        start = time.perf_counter()
+        advisor.recommend_paths(user_data, top_n)
+        timings.append(time.perf_counter() - start)
+    return latency_stats(timings)
+
+
+def bench_learning_roadmap(advisor, profiles, top_n=3):
+    """Per-roadmap generate_learning_roadmap latency (console output discarded)"""
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        for user_data in profiles:
+            for recommendation in advisor.recommend_paths(user_data, top_n):
+                start = time.perf_counter()
+                advisor.generate_learning_roadmap(user_data, recommendation)
+                timings.append(time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+    return latency_stats(timings)
+
+
+def bench_throughput(advisor, size, chunk_size=10000, seed=0, top_n=3):
+    """recommend_paths_batch throughput over `size` profiles generated in chunks"""
+    profiles = synthetic_profiles(advisor, size, seed)
+    scored = 0
+    elapsed = 0.0
+    while scored < size:
+        chunk = [user_data for _, user_data in zip(range(chunk_size), profiles)]
+        # Hanya waktu scoring yang diukur, bukan pembuatan profil sintetis
+        start = time.perf_counter()
+        advisor.recommend_paths_batch(chunk, top_n)
+        elapsed += time.perf_counter() - start
+        scored += len(chunk)
+    return {
+        'profiles': scored,
+        'chunk_size': chunk_size,
+        'seconds': elapsed,
+        'profiles_per_second': scored / elapsed if elapsed else 0.0,
+    }
+
+
+def bench_construction(rounds=5):
+    """Advisor construction time: cold (snapshot rebuilt) vs warm (shared snapshot)"""
+    cold = []
+    warm = []
+    for _ in range(rounds):
+        CareerPathAdvisor.reload_reference_data()
+        start = time.perf_counter()
+        CareerPathAdvisor()
+        cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        CareerPathAdvisor()
+        warm.append(time.perf_counter() - start)
+    return {'cold': latency_stats(cold), 'warm': latency_stats(warm)}
+
+
+def bench_memory(batch_size=10000, seed=0):
+    """tracemalloc peaks: cold advisor construction and one batch of scoring"""
+    CareerPathAdvisor.reload_reference_data()
+    tracemalloc.start()
+    try:
+        advisor = CareerPathAdvisor()
+        _, construction_peak = tracemalloc.get_traced_memory()
+        profiles = list(synthetic_profiles(advisor, batch_size, seed))
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        advisor.recommend_paths_batch(profiles)
+        _, batch_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'construction_peak_bytes': construction_peak,
+        'batch_size': batch_size,
+        'batch_peak_bytes': batch_peak - baseline,
+    }
+
+
+def run_suite(profiles=1000, sizes=(1000, 100000, 1000000), seed=0,
+              chunk_size=10000, rounds=5):
+    """Run every benchmark and return one JSON-serializable report"""
+    construction = bench_construction(rounds)
+    memory = bench_memory(min(10000, max(sizes, default=10000)), seed)
+
+    advisor = CareerPathAdvisor()
+    cohort = list(synthetic_profiles(advisor, profiles, seed))
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__ if np is not None else None,
+            'platform': platform.platform(),
+            'catalog_version': advisor.catalog_version,
+            'jobs': len(advisor.job_index),
+            'seed': seed,
+            'profiles': profiles,
+        },
+        'construction': construction,
+        'memory': memory,
+        'latency': {
+            '_calculate_score': bench_calculate_score(advisor, cohort[:max(1, profiles // 10)]),
+            'recommend_paths': bench_recommend_paths(advisor, cohort),
+            'generate_learning_roadmap': bench_learning_roadmap(
+                advisor, cohort[:max(1, profiles // 10)]),
+        },
+        'throughput': {str(size): bench_throughput(advisor, size, chunk_size, seed)
+                       for size in sizes},
+    }
+    return report
+
+
+def print_report(report):
+    meta = report['meta']
+    print(f"=== Career advisor benchmarks (seed {meta['seed']}, {meta['jobs']} jobs, "
+          f"numpy {meta['numpy']}) ===")
+    for label, stats in report['construction'].items():
+        print(f"construction {label:>5}: p50 {stats['p50_us'] / 1000:8.2f} ms | "
+              f"max {stats['max_us'] / 1000:8.2f} ms")
+    memory = report['memory']
+    print(f"memory: construction peak {memory['construction_peak_bytes'] / 2**20:.1f} MiB | "
+          f"batch of {memory['batch_size']} peak {memory['batch_peak_bytes'] / 2**20:.1f} MiB")
+    for name, stats in report['latency'].items():
+        print(f"{name:>26}: p50 {stats['p50_us']:8.1f} us | p95 {stats['p95_us']:8.1f} us | "
+              f"p99 {stats['p99_us']:8.1f} us | n={stats['calls']}")
+    for size, stats in report['throughput'].items():
+        print(f"batch {int(size):>9,} profiles: {stats['profiles_per_second']:12,.0f} profiles/s "
+              f"({stats['seconds']:.2f} s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Career advisor benchmarks")
+    parser.add_argument('--profiles', type=int, default=1000,
+                        help="synthetic profiles for the latency benchmarks")
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        help="comma-separated batch sizes for the throughput benchmark")
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help="profiles per recommend_paths_batch call")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--construction-rounds', type=int, default=5)
+    parser.add_argument('--json', metavar='PATH',
+                        help="also write the full report as JSON (for regression diffs)")
+    parser.add_argument('--roadmap-cache', action='store_true',
+                        help="only run the rebuilt vs cached learning-resources benchmark")
+    parser.add_argument('--rounds', type=int, default=200,
+                        help="roadmap rounds for --roadmap-cache (each renders top-3 roadmaps)")
+    args = parser.parse_args()
+
+    if args.roadmap_cache:
+        results = bench_roadmap(args.rounds)
+        print("=== generate_learning_roadmap latency ===")
+        for label, stats in results.items():
+            print(f"{label:>8}: mean {stats['mean_us']:8.1f} us | "
+                  f"median {stats['median_us']:8.1f} us | n={stats['roadmaps']}")
+        speedup = results['rebuilt']['mean_us'] / results['cached']['mean_us']
+        print(f"Speedup: {speedup:.2f}x")
+    else:
+        sizes = tuple(int(size) for size in args.sizes.split(',') if size.strip())
+        report = run_suite(args.profiles, sizes, args.seed, args.chunk_size,
+                           args.construction_rounds)
+        print_report(report)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Report written to {args.json}")
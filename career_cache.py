@@ -0,0 +1,326 @@
+import hashlib
+import json
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+
+# Sentinel untuk membedakan "tidak ada di cache" dari nilai None
+MISS = object()
+
+# Level dibulatkan ke kelipatan 0.1 tanpa melewati ambang penalti skor (0.5)
+LEVEL_STEPS = 10
+LOW_LEVEL_THRESHOLD = 0.5
+
+
+def _quantize_level(level):
+    bucket = math.floor(level * LEVEL_STEPS)
+    if level < LOW_LEVEL_THRESHOLD:
+        return min(bucket, int(LOW_LEVEL_THRESHOLD * LEVEL_STEPS) - 1)
+    return max(bucket, int(LOW_LEVEL_THRESHOLD * LEVEL_STEPS))
+
+
+def fingerprint_spec(advisor):
+    """Thresholds and vocabularies that decide which profile details affect results"""
+    spec = advisor._shared_cache.get('fingerprint_spec')
+    if spec is not None:
+        return spec
+
+    # Semua batas budget yang dibandingkan dengan '>=' saat scoring & roadmap
+    thresholds = set()
+    for record in advisor.job_index.values():
+        cost = record.estimated_cost_idr
+        if cost:
+            thresholds.update((cost, cost * 0.5, cost * 0.25))
+    for uni in advisor.indonesian_universities.values():
+        total_degree_cost = uni.get('cost_per_semester', 0) * 8
+        if total_degree_cost:
+            thresholds.update((total_degree_cost, total_degree_cost * 0.5))
+
+    # Skill di skill_graph ikut menentukan skor lewat kredit parsial
+    skills = set(advisor.skill_ids) | set(advisor.graph_skill_ids)
+    for record in advisor.job_index.values():
+        skills.update(record.emerging_skills)
+    spec = {
+        'budget_thresholds': tuple(sorted(thresholds)),
+        'skills': frozenset(skills),
+        'environments': frozenset(env for record in advisor.job_index.values()
+                                  for env in record.environments),
+    }
+    advisor._shared_cache['fingerprint_spec'] = spec
+    return spec
+
+
+def canonical_profile(advisor, user_data):
+    """Normalized, order-independent view of the profile parts that affect results"""
+    spec = fingerprint_spec(advisor)
+    constraints = user_data['constraints']
+    budget = constraints.get('financial_investment', float('inf'))
+    envs = set(user_data['preferences'].get('work_environment', []))
+    return {
+        'skills': sorted((skill, _quantize_level(level))
+                         for skill, level in user_data['skills'].items()
+                         if skill in spec['skills']),
+        'budget_bucket': bisect_right(spec['budget_thresholds'], budget),
+        'timeline_months': constraints.get('timeline_months', 24),
+        # Env yang tidak dikenal tetap berarti "punya preferensi"
+        'environments': sorted(envs & spec['environments']),
+        'has_environment_preference': bool(envs),
+    }
+
+
+def profile_fingerprint(advisor, user_data, extra=None):
+    """Stable hex digest of canonical_profile (plus optional extra key parts)"""
+    canonical = canonical_profile(advisor, user_data)
+    if extra is not None:
+        canonical['extra'] = extra
+    encoded = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache with per-entry TTL, bound to one catalog version"""
+
+    def __init__(self, maxsize=10000, ttl=3600.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def bind_version(self, version):
+        """Drop every entry if the market data version changed"""
+        if version != self.version:
+            with self._lock:
+                if version != self.version:
+                    if self._entries:
+                        self.invalidations += 1
+                    self._entries.clear()
+                    self.version = version
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'version': self.version,
+        }
+
+
+class SQLiteResultCache:
+    """Persistent ResultCache backend in a SQLite file (WAL mode), shared by processes
+
+    Entries are keyed on (catalog version, cache key) so several worker processes and
+    deploys on one host reuse each other's results. Values are pickled; only point it
+    at a file written by this service.
+
+    Reads stay reads: a hit refreshes accessed_at (trim's LRU order) only when the
+    stored access time is older than touch_interval. A busy database ("database is
+    locked" after timeout) never fails a request: get() reports a miss and writes are
+    skipped.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS results ("
+        " version TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL,"
+        " expires_at REAL, accessed_at REAL NOT NULL,"
+        " PRIMARY KEY (version, key)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)",
+    )
+
+    def __init__(self, path, max_entries=1000000, ttl=None, timeout=5.0,
+                 trim_every=1000, touch_interval=None):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.timeout = timeout
+        self.trim_every = trim_every
+        # Default: sepersepuluh TTL, maksimal satu menit
+        if touch_interval is None:
+            touch_interval = min(60.0, ttl * 0.1) if ttl else 60.0
+        self.touch_interval = touch_interval
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.busy = 0
+        self._writes = 0
+        self._local = threading.local()
+        conn = self._connection()
+        for statement in self.SCHEMA:
+            conn.execute(statement)
+
+    def _connection(self):
+        """One connection per thread and process (connections must not cross a fork)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                   isolation_level=None, check_same_thread=True)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _encode_key(key):
+        return json.dumps(key, separators=(',', ':'))
+
+    def bind_version(self, version):
+        # Entry versi lain tetap tersimpan (proses lain mungkin masih memakainya);
+        # gunakan compact() untuk membuangnya
+        self.version = version
+
+    def get(self, key):
+        now = time.time()
+        conn = self._connection()
+        encoded = self._encode_key(key)
+        try:
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM results"
+                " WHERE version = ? AND key = ?", (self.version or '', encoded)).fetchone()
+        except sqlite3.OperationalError:
+            self.busy += 1
+            self.misses += 1
+            return MISS
+        if row is None:
+            self.misses += 1
+            return MISS
+        value, expires_at, accessed_at = row
+        if expires_at is not None and expires_at <= now:
+            self.expirations += 1
+            self.misses += 1
+            return MISS
+        if now - accessed_at >= self.touch_interval:
+            try:
+                conn.execute(
+                    "UPDATE results SET accessed_at = ? WHERE version = ? AND key = ?",
+                    (now, self.version or '', encoded))
+            except sqlite3.OperationalError:
+                # Urutan LRU sedikit basi lebih baik daripada request yang gagal
+                self.busy += 1
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, key, value):
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        conn = self._connection()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (version, key, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (self.version or '', self._encode_key(key),
+                 pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), expires_at, now))
+        except sqlite3.OperationalError:
+            self.busy += 1
+            return
+        self._writes += 1
+        if self.trim_every and self._writes % self.trim_every == 0:
+            self.trim()
+
+    def trim(self):
+        """Enforce max_entries by dropping the least recently used rows (0 if busy)"""
+        conn = self._connection()
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM results WHERE (version, key) IN (SELECT version, key"
+                    " FROM results ORDER BY accessed_at LIMIT ?)", (excess,))
+        except sqlite3.OperationalError:
+            self.busy += 1
+            return 0
+        return max(excess, 0)
+
+    def compact(self, keep_version=None):
+        """Drop expired rows and other catalog versions, enforce the cap, then VACUUM"""
+        keep_version = keep_version if keep_version is not None else self.version
+        conn = self._connection()
+        removed = conn.execute(
+            "DELETE FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),)).rowcount
+        if keep_version is not None:
+            removed += conn.execute(
+                "DELETE FROM results WHERE version != ?", (keep_version,)).rowcount
+        removed += self.trim()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        return removed
+
+    def clear(self):
+        self._connection().execute("DELETE FROM results")
+
+    def __len__(self):
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM results WHERE version = ?",
+            (self.version or '',)).fetchone()[0]
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'path': self.path,
+            'size': len(self),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'expirations': self.expirations,
+            'busy': self.busy,
+            'version': self.version,
+        }
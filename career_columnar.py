@@ -0,0 +1,308 @@
+import json
+import math
+import struct
+import zipfile
+from array import array
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # numpy dibutuhkan untuk format .npz dan agregasi
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pyarrow opsional; tanpa pyarrow dipakai fallback .npz
+    pa = None
+
+# 2: rank uint16, kode region uint32
+COHORT_FORMAT_VERSION = 2
+
+# Kolom per baris (satu baris = satu rekomendasi) -> kode array penampung
+ROW_COLUMNS = {
+    'profile_index': 'I',
+    'rank': 'H',                # 1 = top pick; maksimal MAX_RANK rekomendasi per profil
+    'career': 'H',              # kode -> dictionary 'career' (urutan job_market)
+    'score': 'd',
+    'budget_idr': 'd',          # NaN = profil tanpa financial_investment
+    'budget_feasible': 'B',
+    'region': 'I',              # kode -> dictionary 'region' (0 = tidak diisi)
+}
+MAX_RANK = 2 ** 16 - 1
+# Kolom list: offsets (panjang baris+1) + values berisi kode dictionary 'skill'
+LIST_COLUMNS = ('missing_skills', 'emerging_gaps')
+
+FORMAT_SUFFIXES = {'.arrow': 'arrow', '.ipc': 'arrow', '.feather': 'arrow',
+                   '.parquet': 'parquet', '.npz': 'npz'}
+
+
+def resolve_format(path, format='auto'):
+    """Pick the file format from the argument or the path suffix"""
+    if format == 'auto':
+        format = FORMAT_SUFFIXES.get(Path(path).suffix.lower())
+        if format is None:
+            format = 'arrow' if pa is not None else 'npz'
+    if format not in ('arrow', 'parquet', 'npz'):
+        raise ValueError(f"Unknown cohort format '{format}', choose arrow, parquet or npz")
+    if format in ('arrow', 'parquet') and pa is None:
+        raise ImportError(f"pyarrow is required for {format} output; use a .npz path instead")
+    if format == 'npz' and np is None:
+        raise ImportError("numpy is required for .npz output")
+    return format
+
+
+class CohortWriter:
+    """Accumulates scored profiles in typed arrays and writes one columnar file
+
+    Careers are coded by job index position and skills by a private extension
+    of the advisor's skill_vocabulary, so the file's dictionaries line up with
+    job_market without new names ever reaching the shared snapshot.
+    """
+
+    def __init__(self, path, advisor, format='auto'):
+        self.path = Path(path)
+        self.format = resolve_format(path, format)
+        self.advisor = advisor
+        self.vocabulary = advisor.skill_vocabulary.extended()
+        self.profiles = 0
+        self._rows = {name: array(code) for name, code in ROW_COLUMNS.items()}
+        self._lists = {name: (array('I', [0]), array('H')) for name in LIST_COLUMNS}
+        self._profile_ids = []
+        self._regions = {'': 0}
+
+    def add(self, user_data, recommendations, profile_id=None, region=None):
+        """Append one profile's recommend_paths output (dicts or serialized dicts)"""
+        if len(recommendations) > MAX_RANK:
+            raise ValueError(f"cohort files hold at most {MAX_RANK} recommendations per "
+                             f"profile, got {len(recommendations)}")
+        advisor = self.advisor
+        vocabulary = self.vocabulary
+        budget = user_data['constraints'].get('financial_investment')
+        region_code = self._regions.setdefault(region or '', len(self._regions))
+        profile_index = self.profiles
+        self.profiles += 1
+        self._profile_ids.append('' if profile_id is None else str(profile_id))
+
+        rows = self._rows
+        for rank, recommendation in enumerate(recommendations, 1):
+            record = advisor.job_index[recommendation['career']]
+            cost = record.estimated_cost_idr
+            rows['profile_index'].append(profile_index)
+            rows['rank'].append(rank)
+            rows['career'].append(advisor.job_ids[record.key])
+            rows['score'].append(recommendation['score'])
+            rows['budget_idr'].append(math.nan if budget is None else budget)
+            rows['budget_feasible'].append(cost == 0 or (budget is not None and budget >= cost))
+            rows['region'].append(region_code)
+            for name in LIST_COLUMNS:
+                offsets, values = self._lists[name]
+                values.extend(vocabulary.id_of(skill) for skill in recommendation[name])
+                offsets.append(len(values))
+
+    def meta(self):
+        return {
+            'format_version': COHORT_FORMAT_VERSION,
+            'catalog_version': self.advisor.catalog_version,
+            'profiles': self.profiles,
+            'rows': len(self._rows['rank']),
+        }
+
+    def dictionaries(self):
+        vocabulary = self.vocabulary
+        return {
+            'career': [record.key for record in self.advisor._job_records],
+            'skill': vocabulary.names(range(len(vocabulary))),
+            'region': list(self._regions),
+        }
+
+    def close(self):
+        """Write the file; returns its path"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == 'npz':
+            self._write_npz()
+        else:
+            self._write_arrow()
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def _write_npz(self):
+        arrays = {name: np.frombuffer(values, dtype=values.typecode)
+                  if len(values) else np.zeros(0, dtype=values.typecode)
+                  for name, values in self._rows.items()}
+        for name, (offsets, values) in self._lists.items():
+            arrays[f'{name}.offsets'] = np.frombuffer(offsets, dtype=offsets.typecode)
+            arrays[f'{name}.values'] = (np.frombuffer(values, dtype=values.typecode)
+                                        if len(values) else np.zeros(0, dtype='H'))
+        arrays['profile_id'] = np.array(self._profile_ids, dtype=str)
+        for name, entries in self.dictionaries().items():
+            arrays[f'dict.{name}'] = np.array(entries, dtype=str)
+        arrays['meta'] = np.array(json.dumps(self.meta()))
+        # savez (tanpa kompresi) menyimpan member ZIP_STORED -> bisa di-memmap
+        with open(self.path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    def _write_arrow(self):
+        dictionaries = self.dictionaries()
+        rows = self._rows
+
+        def coded(name, dictionary, index_type):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(rows[name], type=index_type), pa.array(dictionary, type=pa.string()))
+
+        skills = pa.array(dictionaries['skill'], type=pa.string())
+        columns = {
+            'profile_index': pa.array(rows['profile_index'], type=pa.uint32()),
+            'profile_id': pa.array([self._profile_ids[i] for i in rows['profile_index']],
+                                   type=pa.string()),
+            'rank': pa.array(rows['rank'], type=pa.uint16()),
+            'career': coded('career', dictionaries['career'], pa.uint16()),
+            'score': pa.array(rows['score'], type=pa.float64()),
+            'budget_idr': pa.array(rows['budget_idr'], type=pa.float64()),
+            'budget_feasible': pa.array([bool(v) for v in rows['budget_feasible']],
+                                        type=pa.bool_()),
+            'region': coded('region', dictionaries['region'], pa.uint32()),
+        }
+        for name, (offsets, values) in self._lists.items():
+            codes = pa.DictionaryArray.from_arrays(pa.array(values, type=pa.uint16()), skills)
+            columns[name] = pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), codes)
+        table = pa.table(columns).replace_schema_metadata(
+            {'career_cohort': json.dumps(self.meta())})
+        if self.format == 'parquet':
+            pa.parquet.write_table(table, self.path)
+        else:
+            with pa.OSFile(str(self.path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+
+def _npz_member_offsets(path):
+    """Byte offset of each stored .npy member's data inside an .npz archive"""
+    offsets = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as raw:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {info.filename} is compressed, cannot mmap")
+            raw.seek(info.header_offset)
+            header = raw.read(30)
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            offsets[info.filename] = info.header_offset + 30 + name_length + extra_length
+    return offsets
+
+
+def _mmap_npz(path):
+    """{name: read-only np.memmap} for every array in an uncompressed .npz"""
+    arrays = {}
+    with open(path, 'rb') as raw:
+        for member, offset in _npz_member_offsets(path).items():
+            raw.seek(offset)
+            version = np.lib.format.read_magic(raw)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(raw)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(raw)
+            name = member[:-4] if member.endswith('.npy') else member
+            if dtype.hasobject:
+                raise ValueError(f"{path}: {name} holds Python objects, cannot mmap")
+            if not math.prod(shape):
+                arrays[name] = np.zeros(shape, dtype=dtype)
+                continue
+            arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=raw.tell(),
+                                     shape=shape, order='F' if fortran else 'C')
+    return arrays
+
+
+class CohortTable:
+    """Memory-mapped cohort file: NumPy column views plus their dictionaries"""
+
+    def __init__(self, columns, lists, dictionaries, meta, source=None):
+        self.columns = columns          # nama -> array (kode untuk career/region)
+        self.lists = lists              # nama -> (offsets, values)
+        self.dictionaries = dictionaries
+        self.meta = meta
+        self._source = source           # jaga agar mmap Arrow tetap hidup
+
+    def __len__(self):
+        return len(self.columns['rank'])
+
+    def decode(self, dictionary, codes):
+        names = self.dictionaries[dictionary]
+        return [names[code] for code in codes]
+
+    def career_counts(self, rank=None):
+        """{career: rows}, optionally only recommendations at one rank (1 = top pick)"""
+        careers = self.columns['career']
+        if rank is not None:
+            careers = careers[self.columns['rank'] == rank]
+        counts = np.bincount(careers, minlength=len(self.dictionaries['career']))
+        return {career: int(n) for career, n in zip(self.dictionaries['career'], counts) if n}
+
+    def missing_skill_counts(self, top=None):
+        """Most common missing skills over all recommendations"""
+        values = self.lists['missing_skills'][1]
+        counts = np.bincount(values, minlength=len(self.dictionaries['skill']))
+        order = np.argsort(-counts, kind='stable')
+        ranked = [(self.dictionaries['skill'][i], int(counts[i])) for i in order if counts[i]]
+        return ranked[:top] if top is not None else ranked
+
+    def feasibility_by_region(self, rank=1):
+        """{region: share of rank-`rank` recommendations the profile can afford}"""
+        selected = self.columns['rank'] == rank
+        regions = self.columns['region'][selected]
+        feasible = self.columns['budget_feasible'][selected].astype(float)
+        totals = np.bincount(regions, minlength=len(self.dictionaries['region']))
+        hits = np.bincount(regions, weights=feasible, minlength=len(self.dictionaries['region']))
+        return {(region or None): float(hits[i] / totals[i])
+                for i, region in enumerate(self.dictionaries['region']) if totals[i]}
+
+
+def open_cohort(path, format='auto'):
+    """Open a cohort file written by CohortWriter without copying the column data"""
+    if np is None:
+        raise ImportError("numpy is required to read cohort files")
+    format = resolve_format(path, format)
+    if format == 'npz':
+        arrays = _mmap_npz(path)
+        columns = {name: arrays[name] for name in ROW_COLUMNS}
+        columns['profile_id'] = arrays['profile_id']
+        lists = {name: (arrays[f'{name}.offsets'], arrays[f'{name}.values'])
+                 for name in LIST_COLUMNS}
+        dictionaries = {name[len('dict.'):]: [str(value) for value in arrays[name]]
+                        for name in arrays if name.startswith('dict.')}
+        return CohortTable(columns, lists, dictionaries, json.loads(str(arrays['meta'])))
+
+    if format == 'parquet':
+        source = None
+        table = pa.parquet.read_table(path, memory_map=True)
+    else:
+        source = pa.memory_map(str(path), 'r')
+        table = pa.ipc.open_file(source).read_all()
+    table = table.combine_chunks()      # satu record batch: tidak menyalin data
+    meta = json.loads(table.schema.metadata[b'career_cohort'])
+
+    def primitive(name):
+        return table.column(name).chunk(0).to_numpy(zero_copy_only=False)
+
+    columns = {name: primitive(name) for name in
+               ('profile_index', 'rank', 'score', 'budget_idr', 'budget_feasible')}
+    columns['profile_id'] = primitive('profile_id')
+    dictionaries = {}
+    for name in ('career', 'region'):
+        chunk = table.column(name).chunk(0)
+        columns[name] = chunk.indices.to_numpy()
+        dictionaries[name] = chunk.dictionary.to_pylist()
+    lists = {}
+    for name in LIST_COLUMNS:
+        chunk = table.column(name).chunk(0)
+        codes = chunk.values
+        lists[name] = (chunk.offsets.to_numpy(), codes.indices.to_numpy())
+        dictionaries['skill'] = codes.dictionary.to_pylist()
+    return CohortTable(columns, lists, dictionaries, meta, source)
+
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+DATA_DIR = PACKAGE_DIR / 'data'
+SKILLS_DICT_PATH = PACKAGE_DIR / 'skills_dict.txt'
+
+# Naikkan jika format hasil loader berubah supaya cache lama tidak dipakai
+LOADER_FORMAT = 2
+
+# Nama katalog -> file JSON di DATA_DIR
+CATALOG_FILES = {
+    'job_market': 'job_market.json',
+    'skill_graph': 'skill_graph.json',
+    'industry_trends': 'industry_trends.json',
+    'indonesian_universities': 'indonesian_universities.json',
+    'education_costs_idr': 'education_costs_idr.json',
+    'major_recommendations': 'major_recommendations.json',
+    'major_keywords': 'major_keywords.json',
+    'learning_resources': 'learning_resources.json',
+}
+
+JOB_FIELDS = {
+    'demand_score': (int, float), 'growth_rate': (int, float),
+    'avg_salary': (int, float), 'required_skills': list,
+    'emerging_skills': list, 'industries': list, 'education_required': str,
+    'certification_required': bool, 'work_environment': list,
+    'indonesian_universities': list,
+}
+UNIVERSITY_FIELDS = {
+    'name': str, 'location': str, 'strengths': list, 'ranking': str,
+    'website': str, 'cost_per_semester': (int, float), 'type': str,
+}
+
+# version = sha256 dari semua file sumber, dipakai sebagai kunci cache
+Catalogs = namedtuple('Catalogs', ['version', 'data'])
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog data file is missing or malformed"""
+
+
+def _source_files(data_dir):
+    """(catalog name, path) pairs for every file the loader reads"""
+    sources = [(name, Path(data_dir) / filename)
+               for name, filename in CATALOG_FILES.items()]
+    # skills_dict.txt boleh di-override per data_dir, default dari root repo
+    skills_dict = Path(data_dir) / SKILLS_DICT_PATH.name
+    sources.append(('skills_dict', skills_dict if skills_dict.exists() else SKILLS_DICT_PATH))
+    return sources
+
+
+def catalog_version(sources):
+    """Content hash over all catalog files plus the loader format"""
+    digest = hashlib.sha256(f"format:{LOADER_FORMAT}".encode())
+    for name, raw in sources:
+        digest.update(name.encode())
+        digest.update(len(raw).to_bytes(8, 'little'))
+        digest.update(raw)
+    return digest.hexdigest()
+
+
+def _require(condition, message):
+    if not condition:
+        raise CatalogError(message)
+
+
+def _check_fields(where, entry, fields):
+    _require(isinstance(entry, dict), f"{where}: expected an object")
+    for field, expected in fields.items():
+        _require(field in entry, f"{where}: missing field '{field}'")
+        _require(isinstance(entry[field], expected),
+                 f"{where}.{field}: unexpected type {type(entry[field]).__name__}")
+
+
+def validate_catalogs(data):
+    """Check the structure of parsed catalogs, raising CatalogError on problems"""
+    for job_key, job in data['job_market'].items():
+        _check_fields(f"job_market.{job_key}", job, JOB_FIELDS)
+    for uni_key, uni in data['indonesian_universities'].items():
+        _check_fields(f"indonesian_universities.{uni_key}", uni, UNIVERSITY_FIELDS)
+    for skill, node in data['skill_graph'].items():
+        _check_fields(f"skill_graph.{skill}", node, {
+            'related_skills': list, 'prerequisites': list, 'weight': (int, float)})
+    for career, majors in data['major_recommendations'].items():
+        _check_fields(f"major_recommendations.{career}", majors, {
+            'recommended_majors': list, 'related_majors': list, 'priority': list})
+    keywords = data['major_keywords']
+    _check_fields("major_keywords", keywords, {'keyword_aliases': dict, 'stopwords': list})
+    for word, tokens in keywords['keyword_aliases'].items():
+        _require(isinstance(tokens, list) and all(isinstance(t, str) and t for t in tokens),
+                 f"major_keywords.keyword_aliases.{word}: expected a list of tokens")
+    _require(all(isinstance(word, str) and word for word in keywords['stopwords']),
+             "major_keywords.stopwords: expected a list of words")
+    for skill, resource in data['learning_resources'].items():
+        _check_fields(f"learning_resources.{skill}", resource, {
+            'steps': list, 'resources': list})
+    for level, value in data['skill_level_mapping'].items():
+        _require(isinstance(value, (int, float)) and 0.0 <= value <= 1.0,
+                 f"skill_levels.{level}: level must be a number in [0, 1]")
+    for synonym, skill in data['skill_synonyms'].items():
+        _require(synonym and skill, "skill_synonyms: empty synonym or skill name")
+    _require(isinstance(data['standard_skills'], list)
+             and all(isinstance(skill, str) and skill for skill in data['standard_skills']),
+             "all_standard_skills: expected a list of skill names")
+
+
+def parse_catalogs(raw_sources):
+    """Parse raw file contents into the catalog dicts used by CareerPathAdvisor"""
+    parsed = {}
+    for name, raw in raw_sources:
+        try:
+            parsed[name] = json.loads(raw.decode('utf-8'))
+        except ValueError as exc:
+            raise CatalogError(f"{name}: invalid JSON ({exc})") from exc
+
+    skills_dict = parsed.pop('skills_dict')
+    _require('skill_synonyms' in skills_dict and 'skill_levels' in skills_dict,
+             "skills_dict.txt: needs 'skill_synonyms' and 'skill_levels'")
+    # skills_dict.txt menyimpan skill -> [sinonim]; advisor butuh sinonim -> skill
+    parsed['skill_synonyms'] = {
+        synonym: skill
+        for skill, synonyms in skills_dict['skill_synonyms'].items()
+        for synonym in synonyms
+    }
+    parsed['skill_level_mapping'] = skills_dict['skill_levels']
+    parsed['standard_skills'] = skills_dict.get('all_standard_skills', [])
+
+    validate_catalogs(parsed)
+    return parsed
+
+
+def default_cache_dir(data_dir):
+    return Path(os.environ.get('CAREER_TC_CACHE_DIR', Path(data_dir) / '.cache'))
+
+
+def _write_cache(cache_path, catalogs):
+    """Atomically pickle catalogs; a read-only deployment just skips the cache"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(catalogs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        # Hapus cache versi lama
+        for stale in cache_path.parent.glob('catalogs-*.pickle'):
+            if stale != cache_path:
+                stale.unlink()
+    except OSError:
+        pass
+
+
+def load_catalogs(data_dir=None, cache_dir=None, use_cache=True):
+    """Load, validate and cache all catalogs; returns Catalogs(version, data)"""
+    data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+    raw_sources = []
+    for name, path in _source_files(data_dir):
+        try:
+            raw_sources.append((name, path.read_bytes()))
+        except OSError as exc:
+            raise CatalogError(f"{name}: cannot read {path} ({exc})") from exc
+
+    version = catalog_version(raw_sources)
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir(data_dir)
+    cache_path = cache_dir / f"catalogs-{version[:32]}.pickle"
+
+    if use_cache:
+        try:
+            with open(cache_path, 'rb') as f:
+                catalogs = pickle.load(f)
+            if isinstance(catalogs, Catalogs) and catalogs.version == version:
+                return catalogs
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Cache rusak/asing apa pun (ImportError, TypeError, ...) dibuang; data/
+            # tetap sumber kebenaran
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+
+    catalogs = Catalogs(version=version, data=parse_catalogs(raw_sources))
+    if use_cache:
+        _write_cache(cache_path, catalogs)
+    return catalogs
@@ -0,0 +1,137 @@
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+from bisect import bisect_left
+
+# Batas atas bucket histogram (detik) untuk export Prometheus
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05,
+                   0.1, 0.5, 1.0)
+
+# Method CareerPathAdvisor yang diukur saat instrumentation aktif
+INSTRUMENTED_STAGES = (
+    'normalize_profile',
+    'normalize_skill_name',
+    '_calculate_score',
+    '_score_record',
+    'recommend_paths',
+    'recommend_paths_batch',
+    'build_learning_resources',
+    'university_options',
+    'display_university_recommendations',
+    'build_roadmap',
+    'generate_learning_roadmap',
+)
+
+
+class StageStats:
+    """Call count, total/max seconds and a latency histogram for one stage"""
+
+    __slots__ = ('calls', 'errors', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_seconds': self.total,
+            'mean_us': self.total / self.calls * 1e6 if self.calls else 0.0,
+            'max_us': self.max * 1e6,
+        }
+
+
+class Instrumentation:
+    """Thread-safe per-stage timings collected by wrapped advisor methods
+
+    Timings are inclusive: recommend_paths also contains its _score_record calls.
+    """
+
+    def __init__(self, stages=INSTRUMENTED_STAGES):
+        self.stages = tuple(stages)
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, stage, seconds, failed=False):
+        with self._lock:
+            stats = self._stats.get(stage)
+            if stats is None:
+                stats = self._stats[stage] = StageStats()
+            stats.calls += 1
+            stats.errors += failed
+            stats.total += seconds
+            if seconds > stats.max:
+                stats.max = seconds
+            stats.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def wrap(self, stage, func):
+        """Timed version of func that reports to this instrumentation"""
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(stage, clock() - start, failed=True)
+                raise
+            record(stage, clock() - start)
+            return result
+        return timed
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def snapshot(self):
+        """{stage: {calls, errors, total_seconds, mean_us, max_us}}"""
+        with self._lock:
+            return {stage: stats.as_dict() for stage, stats in sorted(self._stats.items())}
+
+    def to_json(self, indent=None):
+        return json.dumps({'since': self.started_at, 'stages': self.snapshot()},
+                          indent=indent)
+
+    def to_prometheus(self, prefix='career_advisor_stage'):
+        """Prometheus text exposition format (histogram + call/error counters)"""
+        with self._lock:
+            items = sorted((stage, (stats.calls, stats.errors, stats.total, list(stats.buckets)))
+                           for stage, stats in self._stats.items())
+        lines = [
+            f"# HELP {prefix}_seconds Inclusive wall time per advisor stage.",
+            f"# TYPE {prefix}_seconds histogram",
+        ]
+        for stage, (calls, _, total, buckets) in items:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, buckets):
+                cumulative += count
+                lines.append(f'{prefix}_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_seconds_bucket{{stage="{stage}",le="+Inf"}} {calls}')
+            lines.append(f'{prefix}_seconds_sum{{stage="{stage}"}} {total!r}')
+            lines.append(f'{prefix}_seconds_count{{stage="{stage}"}} {calls}')
+        lines.append(f"# HELP {prefix}_errors_total Calls that raised an exception.")
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        for stage, (_, errors, _, _) in items:
+            lines.append(f'{prefix}_errors_total{{stage="{stage}"}} {errors}')
+        return "\n".join(lines) + "\n"
+
+
+def profile_call(func, *args, sort='cumulative', limit=30, **kwargs):
+    """Run func once under cProfile; returns (result, pstats report text)"""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+    return result, out.getvalue()
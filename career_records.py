@@ -0,0 +1,183 @@
+import threading
+from array import array
+from dataclasses import dataclass
+from sys import intern
+
+# Kode tipe array: id skill/job 16-bit, level float64 (round-trip eksak)
+ID_TYPECODE = 'H'
+LEVEL_TYPECODE = 'd'
+MAX_IDS = 1 << 16
+# Id cadangan untuk nama di luar vocabulary (tidak pernah dipakai skill lain)
+UNKNOWN_SKILL_ID = MAX_IDS - 1
+
+
+class SkillVocabulary:
+    """Stable skill name <-> integer id mapping for compact records
+
+    Known skills get ids in sorted order. The vocabulary is read-only (it lives in
+    the shared reference snapshot): unknown names map to UNKNOWN_SKILL_ID. Owners
+    that need ids for arbitrary names (e.g. a file writer) take a growable
+    extended() copy, which is private to them.
+    """
+
+    def __init__(self, skills, growable=False):
+        self._names = sorted(set(skills))
+        if len(self._names) > UNKNOWN_SKILL_ID:
+            raise ValueError(f"at most {UNKNOWN_SKILL_ID} skills fit in a vocabulary")
+        self._ids = {name: i for i, name in enumerate(self._names)}
+        self.growable = growable
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._names)
+
+    def extended(self):
+        """Growable private copy with the same ids for every known skill"""
+        vocabulary = SkillVocabulary((), growable=True)
+        vocabulary._names = list(self._names)
+        vocabulary._ids = dict(self._ids)
+        return vocabulary
+
+    def get(self, name):
+        """Id of a known skill, or None"""
+        return self._ids.get(name)
+
+    def id_of(self, name):
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            if not self.growable:
+                return UNKNOWN_SKILL_ID
+            with self._lock:
+                skill_id = self._ids.get(name)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    if skill_id >= UNKNOWN_SKILL_ID:
+                        return UNKNOWN_SKILL_ID
+                    self._names.append(intern(name))
+                    self._ids[self._names[-1]] = skill_id
+        return skill_id
+
+    def name_of(self, skill_id):
+        return self._names[skill_id]
+
+    def ids(self, names):
+        return array(ID_TYPECODE, [self.id_of(name) for name in names])
+
+    def names(self, skill_ids):
+        return [self._names[skill_id] for skill_id in skill_ids]
+
+
+def _interned(values):
+    return tuple(intern(str(value)) for value in values)
+
+
+def _coded(vocabulary, names):
+    """(ids, names that got UNKNOWN_SKILL_ID in order) for a sequence of skill names"""
+    ids = vocabulary.ids(names)
+    unknown = tuple(intern(str(name)) for name, skill_id in zip(names, ids)
+                    if skill_id == UNKNOWN_SKILL_ID)
+    return ids, unknown
+
+
+def _decoded(vocabulary, ids, unknown):
+    """Inverse of _coded: skill names in their original order"""
+    pending = iter(unknown)
+    return [next(pending) if skill_id == UNKNOWN_SKILL_ID else vocabulary.name_of(skill_id)
+            for skill_id in ids]
+
+
+@dataclass(slots=True)
+class CompactProfile:
+    """user_data in flat form: skill ids + parallel levels instead of nested dicts
+
+    Constraint fields are None when the profile did not set them. Skills outside
+    the vocabulary keep UNKNOWN_SKILL_ID in skill_ids and their names, in order,
+    in unknown_skills (likewise for experience).
+    """
+    skill_ids: array
+    levels: array
+    budget_idr: float = None
+    timeline_months: int = None
+    time_availability: float = None
+    environments: tuple = ()
+    experience_ids: array = None
+    experience_years: tuple = ()
+    interests: tuple = ()
+    career_goals: tuple = ()
+    profile_id: object = None
+    unknown_skills: tuple = ()
+    unknown_experience: tuple = ()
+
+    @classmethod
+    def from_dict(cls, vocabulary, user_data, profile_id=None):
+        skills = user_data['skills']
+        constraints = user_data.get('constraints', {})
+        experience = user_data.get('experience', {})
+        skill_ids, unknown_skills = _coded(vocabulary, list(skills))
+        experience_ids, unknown_experience = _coded(vocabulary, list(experience))
+        return cls(
+            skill_ids=skill_ids,
+            levels=array(LEVEL_TYPECODE, skills.values()),
+            budget_idr=constraints.get('financial_investment'),
+            timeline_months=constraints.get('timeline_months'),
+            time_availability=constraints.get('time_availability'),
+            environments=_interned(
+                user_data.get('preferences', {}).get('work_environment', ())),
+            experience_ids=experience_ids,
+            experience_years=tuple(experience.values()),
+            interests=_interned(user_data.get('interests', ())),
+            career_goals=_interned(user_data.get('career_goals', ())),
+            profile_id=profile_id,
+            unknown_skills=unknown_skills,
+            unknown_experience=unknown_experience
+        )
+
+    def to_dict(self, vocabulary):
+        """The user_data dict this record was built from"""
+        constraints = {}
+        for field, value in (('time_availability', self.time_availability),
+                             ('financial_investment', self.budget_idr),
+                             ('timeline_months', self.timeline_months)):
+            if value is not None:
+                constraints[field] = value
+        return {
+            'skills': dict(zip(_decoded(vocabulary, self.skill_ids, self.unknown_skills),
+                               self.levels)),
+            'experience': dict(zip(_decoded(vocabulary, self.experience_ids or (),
+                                            self.unknown_experience),
+                                   self.experience_years)),
+            'interests': list(self.interests),
+            'career_goals': list(self.career_goals),
+            'constraints': constraints,
+            'preferences': {'work_environment': list(self.environments)}
+        }
+
+
+@dataclass(slots=True)
+class CompactRecommendation:
+    """One recommend_paths entry referencing the job by position in the job index"""
+    job_id: int
+    score: float
+    missing_skill_ids: array
+    emerging_gap_ids: array
+
+    @classmethod
+    def from_dict(cls, vocabulary, job_ids, recommendation):
+        return cls(
+            job_id=job_ids[recommendation['career']],
+            score=recommendation['score'],
+            missing_skill_ids=vocabulary.ids(recommendation['missing_skills']),
+            emerging_gap_ids=vocabulary.ids(recommendation['emerging_gaps'])
+        )
+
+    def to_dict(self, vocabulary, job_records):
+        """The recommend_paths dict, with details taken from the shared job record"""
+        record = job_records[self.job_id]
+        return {
+            'career': record.key,
+            'score': self.score,
+            'salary': record.details['avg_salary'],
+            'missing_skills': vocabulary.names(self.missing_skill_ids),
+            'emerging_gaps': vocabulary.names(self.emerging_gap_ids),
+            'details': record.details
+        }
@@ -0,0 +1,333 @@
+import io
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+
+
+def format_idr(amount):
+    """Format an amount as Indonesian Rupiah, e.g. Rp 5.000.000"""
+    return f"Rp {amount:,.0f}".replace(',', '.')
+
+
+@dataclass
+class ProfileSummary:
+    skills: dict
+    budget_idr: float
+    timeline_months: int
+
+
+@dataclass
+class MajorRecommendation:
+    priority: list
+    other_majors: list
+    related_majors: list
+
+
+@dataclass
+class UniversityOption:
+    key: str
+    number: int                 # posisi di daftar indonesian_universities karir
+    name: str
+    type: str
+    location: str
+    ranking: str
+    website: str
+    cost_per_semester: float
+    total_degree_cost: float
+    affordability: str          # free | affordable | needs_scholarship | consider_alternatives
+    relevant_strengths: list = field(default_factory=list)
+    relevance: float = 0.0      # skor kecocokan kekuatan kampus dengan jurusan karir
+
+
+@dataclass
+class UniversityPage:
+    items: list                 # UniversityOption, nomor = posisi di daftar karir/katalog
+    total: int                  # jumlah hasil sebelum paging
+    page: int
+    page_size: int
+
+    @property
+    def pages(self):
+        return -(-self.total // self.page_size)
+
+
+@dataclass
+class SkillPlan:
+    skill: str
+    display_name: str
+    steps: list
+    resources: list
+    hours: float = 0.0
+    prerequisite_for: list = field(default_factory=list)    # kosong = skill inti karir
+
+    @property
+    def has_resources(self):
+        return bool(self.steps or self.resources)
+
+
+@dataclass
+class LearningMonth:
+    month: int
+    hours: float
+    skills: list
+
+
+@dataclass
+class Roadmap:
+    career: str
+    career_name: str
+    score: float
+    salary_idr: float
+    growth_rate: float
+    estimated_cost_idr: float
+    budget_status: str          # free | sufficient | limited | insufficient
+    majors: MajorRecommendation = None
+    universities: list = None   # None = karir tidak punya data universitas
+    skill_plans: list = field(default_factory=list)     # urut prasyarat (topological)
+    emerging_gaps: list = field(default_factory=list)
+    schedule: list = field(default_factory=list)        # LearningMonth per bulan
+    study_hours: float = 0.0
+    months_needed: int = None   # None = time_availability tidak diisi
+    timeline_months: int = None
+    dependency_cycles: list = field(default_factory=list)
+
+    @property
+    def fits_timeline(self):
+        if self.months_needed is None or self.timeline_months is None:
+            return None
+        return self.months_needed <= self.timeline_months
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _display(skill):
+    return skill.replace('_', ' ').title()
+
+
+BUDGET_STATUS_TEXT = {
+    'free': "🎓 GRATIS (Sekolah Kedinasan)",
+    'sufficient': "✅ Budget mencukupi",
+    'limited': "⚠️ Budget terbatas (perlu bantuan beasiswa)",
+    'insufficient': "❌ Budget tidak mencukupi (perlu alternatif)",
+}
+
+AFFORDABILITY_TEXT = {
+    'free': "🎓 GRATIS + TUNJANGAN",
+    'affordable': "✅ Terjangkau",
+    'needs_scholarship': "⚠️ Butuh beasiswa",
+    'consider_alternatives': "💡 Pertimbangkan alternatif",
+}
+
+
+class TextRenderer:
+    """Turns report objects into the advisor's console text, line by line"""
+
+    def profile_summary_lines(self, summary):
+        lines = ["\n" + "=" * 50, "📋 YOUR PROFILE SUMMARY", "=" * 50,
+                 f"\n📊 Skills ({len(summary.skills)}):"]
+        for skill, level in summary.skills.items():
+            lines.append(f"   • {skill.replace('_', ' ').title()}: {level:.1f}")
+        lines.append(f"\n⏰ Constraints: Budget {format_idr(summary.budget_idr)}, "
+                     f"Timeline {summary.timeline_months} bulan")
+        return lines
+
+    def major_lines(self, majors):
+        if majors is None:
+            return ["   📚 Rekomendasi jurusan: Informasi belum tersedia"]
+
+        lines = ["   📚 REKOMENDASI JURUSAN:", "   🎯 Jurusan Prioritas:"]
+        lines.extend(f"      {i}. {major}" for i, major in enumerate(majors.priority, 1))
+        lines.append("   📖 Jurusan Terkait Lainnya:")
+        lines.extend(f"      {i}. {major}" for i, major in enumerate(majors.other_majors, 1))
+        if majors.related_majors:
+            lines.append("   🔗 Jurusan Pendukung:")
+            lines.extend(f"      {i}. {major}"
+                         for i, major in enumerate(majors.related_majors, 1))
+        return lines
+
+    def university_lines(self, career, majors, universities):
+        career_name = career.replace('_', ' ').title()
+        lines = [f"\n🎓 REKOMENDASI UNIVERSITAS & JURUSAN UNTUK {career_name.upper()}:"]
+        lines.extend(self.major_lines(majors))
+        lines.append("\n   🏫 UNIVERSITAS TERKAIT:")
+        if universities is None:
+            lines.append("   ⚠️ Informasi universitas belum tersedia untuk karir ini")
+            return lines
+
+        for uni in universities:
+            lines.append(f"   {uni.number}. {uni.name} ({uni.type.title()})")
+            lines.append(f"      📍 {uni.location} | 🏆 {uni.ranking}")
+            lines.append(f"      💰 {format_idr(uni.cost_per_semester)}/semester - "
+                         f"{AFFORDABILITY_TEXT[uni.affordability]}")
+            if uni.relevant_strengths:
+                lines.append(f"      ⭐ Kekuatan: {', '.join(uni.relevant_strengths[:2])}")
+            lines.append(f"      🌐 {uni.website}")
+            lines.append("")
+        return lines
+
+    def roadmap_lines(self, roadmap):
+        lines = [f"\n🚀 ROADMAP TO: {roadmap.career_name} (Match: {roadmap.score}%)",
+                 "-" * 70,
+                 f"💰 OUTLOOK: Gaji {format_idr(roadmap.salary_idr)}/tahun | "
+                 f"Growth {roadmap.growth_rate*100:.1f}%",
+                 f"💰 ESTIMASI BIAYA: {format_idr(roadmap.estimated_cost_idr)} - "
+                 f"{BUDGET_STATUS_TEXT[roadmap.budget_status]}"]
+        lines.extend(self.university_lines(
+            roadmap.career, roadmap.majors, roadmap.universities))
+
+        if not roadmap.skill_plans:
+            lines.append("\n✅ You have all the core required skills!")
+            lines.append(f"👉 Focus on emerging skills: {', '.join(roadmap.emerging_gaps)}")
+        else:
+            lines.append(f"\n📋 DETAILED ACTION PLAN ({len(roadmap.skill_plans)} Skills to Learn):")
+            for i, plan in enumerate(roadmap.skill_plans, 1):
+                lines.append(f"\n   [{chr(64+i)}] SKILL: {plan.display_name}")
+                if plan.prerequisite_for:
+                    needed_by = ', '.join(_display(skill) for skill in plan.prerequisite_for)
+                    lines.append(f"       🔑 Prasyarat untuk: {needed_by}")
+                if plan.has_resources:
+                    lines.append("       🛠️  Steps to Master:")
+                    lines.extend(f"          {step_idx}. {step}"
+                                 for step_idx, step in enumerate(plan.steps, 1))
+                    lines.append("       📚 Recommended Resources:")
+                    lines.extend(f"          • {res}" for res in plan.resources)
+                else:
+                    lines.append("       ⚠️  General Advice:")
+                    lines.append(f"          1. Search for '{plan.display_name} beginner course' on Udemy/Coursera")
+                    lines.append(f"          2. Build a small project using {plan.display_name}")
+            lines.extend(self.schedule_lines(roadmap))
+
+        lines.append("-" * 70)
+        return lines
+
+    def schedule_lines(self, roadmap):
+        lines = []
+        if roadmap.dependency_cycles:
+            for cycle in roadmap.dependency_cycles:
+                lines.append("\n⚠️ Prasyarat melingkar di skill graph: "
+                             + " → ".join(_display(skill) for skill in cycle))
+        if roadmap.months_needed is None:
+            return lines
+
+        lines.append(f"\n🗓️ JADWAL BELAJAR (~{roadmap.study_hours:.0f} jam, "
+                     f"{roadmap.months_needed} bulan):")
+        # Bulan berurutan dengan skill yang sama digabung jadi satu baris
+        groups = []
+        for month in roadmap.schedule:
+            if groups and groups[-1][2] == month.skills:
+                groups[-1][1] = month.month
+            else:
+                groups.append([month.month, month.month, month.skills])
+        for first, last, skills in groups:
+            label = f"Bulan {first}" if first == last else f"Bulan {first}-{last}"
+            lines.append(f"   • {label}: {', '.join(_display(skill) for skill in skills)}")
+        if roadmap.fits_timeline is False:
+            lines.append(f"   ⚠️ Melebihi timeline {roadmap.timeline_months} bulan - "
+                         f"tambah jam belajar per minggu atau fokus ke skill inti")
+        return lines
+
+    def report_lines(self, summary, roadmaps):
+        lines = self.profile_summary_lines(summary) if summary is not None else []
+        for roadmap in roadmaps:
+            lines.extend(self.roadmap_lines(roadmap))
+        return lines
+
+    @staticmethod
+    def join(lines):
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class ConsoleRenderer(TextRenderer):
+    """Writes each section to stdout as soon as it is rendered (interactive use)"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def _write(self, lines):
+        # sys.stdout dibaca saat menulis supaya redirect_stdout tetap berlaku
+        (self.stream or sys.stdout).write(self.join(lines))
+
+    def render_profile_summary(self, summary):
+        self._write(self.profile_summary_lines(summary))
+
+    def render_majors(self, majors):
+        self._write(self.major_lines(majors))
+
+    def render_universities(self, career, majors, universities):
+        self._write(self.university_lines(career, majors, universities))
+
+    def render_roadmap(self, roadmap):
+        self._write(self.roadmap_lines(roadmap))
+
+    def render_report(self, summary, roadmaps):
+        self._write(self.report_lines(summary, roadmaps))
+
+
+class BufferedTextRenderer(TextRenderer):
+    """Collects a whole report in memory and emits it with a single write()"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self._buffer = io.StringIO()
+
+    def render_profile_summary(self, summary):
+        self._buffer.write(self.join(self.profile_summary_lines(summary)))
+
+    def render_roadmap(self, roadmap):
+        self._buffer.write(self.join(self.roadmap_lines(roadmap)))
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+    def flush(self):
+        text = self._buffer.getvalue()
+        self._buffer = io.StringIO()
+        if text:
+            (self.stream or sys.stdout).write(text)
+        return text
+
+    def render_report(self, summary, roadmaps):
+        (self.stream or sys.stdout).write(self.join(self.report_lines(summary, roadmaps)))
+
+
+class JsonRenderer:
+    """Serializes report objects as JSON (one document per report)"""
+
+    def __init__(self, stream=None, indent=None):
+        self.stream = stream
+        self.indent = indent
+
+    def dumps(self, value):
+        return json.dumps(value, ensure_ascii=False, indent=self.indent)
+
+    def _write(self, value):
+        (self.stream or sys.stdout).write(self.dumps(value) + "\n")
+
+    def render_profile_summary(self, summary):
+        self._write(asdict(summary))
+
+    def render_roadmap(self, roadmap):
+        self._write(asdict(roadmap))
+
+    def render_report(self, summary, roadmaps):
+        self._write({
+            'profile': asdict(summary) if summary is not None else None,
+            'roadmaps': [asdict(roadmap) for roadmap in roadmaps]
+        })
+
+
+RENDERERS = {
+    'console': ConsoleRenderer,
+    'text': BufferedTextRenderer,
+    'json': JsonRenderer,
+}
+
+
+def get_renderer(name, stream=None):
+    """Instantiate a registered renderer by name ('console', 'text' or 'json')"""
+    try:
+        renderer_class = RENDERERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown renderer '{name}', choose from {sorted(RENDERERS)}") from None
+    return renderer_class(stream=stream)
@@ -0,0 +1,221 @@
+import hashlib
+import json
+from itertools import islice
+
+from career_tc import SCORING_VERSION, _thaw, np
+
+STORE_FORMAT_VERSION = 1
+
+
+def job_fingerprint(record):
+    """Hash of the JobRecord fields _score_record reads
+
+    demand_score, avg_salary, industries etc. are left out: changing them does
+    not change a match score, only the recommendation details.
+    """
+    facts = [sorted(record.skills), sorted(record.environments),
+             record.estimated_cost_idr, record.timeline_limit, record.timeline_penalty]
+    return hashlib.sha256(json.dumps(facts).encode()).hexdigest()[:16]
+
+
+def scoring_context(advisor):
+    """Hash of everything outside job_market that every job's score depends on"""
+    graph = json.dumps(_thaw(advisor.skill_graph), sort_keys=True, default=sorted)
+    return hashlib.sha256(f"{SCORING_VERSION}:{graph}".encode()).hexdigest()[:16]
+
+
+def _chunks(items, size):
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _ranking_bonus(advisor):
+    bonus = advisor.ranking_bonus()
+    return np.array(bonus if bonus is not None else [0.0] * len(advisor._job_records))
+
+
+class ScoreStore:
+    """Per-profile score vectors over every job plus the stored top-N positions
+
+    rescore() compares the stored per-job fingerprints with an advisor's catalog
+    and recomputes only the columns of added or changed jobs; top-N lists are
+    re-ranked only for profiles a changed column can reach. Match scores are
+    stored without the ranking model's market prior, so a prior change (e.g. a
+    demand_score edit) only re-ranks.
+    """
+
+    def __init__(self, job_keys, job_fingerprints, context, scores, top, top_n,
+                 profiles, profile_ids, catalog_version, bonus=None):
+        self.job_keys = tuple(job_keys)
+        self.job_fingerprints = tuple(job_fingerprints)
+        self.context = context
+        self.scores = scores            # float64 [profiles, jobs], dibulatkan 0.1
+        self.top = top                  # posisi job [profiles, top_n], urut ranking
+        # Bonus prior per job (advisor.ranking_bonus) yang dipakai untuk top
+        self.bonus = bonus if bonus is not None else np.zeros(len(self.job_keys))
+        self.top_n = max(top_n, 0)
+        self.profiles = profiles        # user_data ternormalisasi
+        self.profile_ids = profile_ids
+        self.catalog_version = catalog_version
+
+    def __len__(self):
+        return len(self.profiles)
+
+    @classmethod
+    def build(cls, advisor, profiles, top_n=3, profile_ids=None, chunk_size=10000):
+        """Score normalized profiles against every job of the advisor's catalog"""
+        if np is None:
+            raise ImportError("numpy is required for the score store")
+        profiles = list(profiles)
+        records = advisor._job_records
+        blocks = [advisor._rounded_score_matrix(chunk)
+                  for chunk in _chunks(profiles, chunk_size)]
+        scores = np.vstack(blocks) if blocks else np.zeros((0, len(records)))
+        store = cls(
+            job_keys=[record.key for record in records],
+            job_fingerprints=[job_fingerprint(record) for record in records],
+            context=scoring_context(advisor),
+            scores=scores,
+            top=None,
+            top_n=top_n,
+            profiles=profiles,
+            profile_ids=list(profile_ids) if profile_ids is not None else [None] * len(profiles),
+            catalog_version=advisor.catalog_version,
+            bonus=_ranking_bonus(advisor))
+        store.top = store._rank(np.arange(len(profiles)))
+        return store
+
+    def _rank(self, rows):
+        # argsort stabil: skor sama mengikuti urutan katalog, sama seperti batch path
+        keys = self.scores[rows] + self.bonus
+        return np.argsort(-keys, axis=1, kind='stable')[:, :self.top_n]
+
+    def rescore(self, advisor, chunk_size=10000):
+        """Bring the store up to the advisor's catalog; returns what was recomputed"""
+        records = advisor._job_records
+        new_keys = tuple(record.key for record in records)
+        new_fingerprints = tuple(job_fingerprint(record) for record in records)
+        context = scoring_context(advisor)
+        bonus = _ranking_bonus(advisor)
+        full = context != self.context
+        old_positions = {key: position for position, key in enumerate(self.job_keys)}
+
+        new_positions = set(new_keys)
+        added = [key for key in new_keys if key not in old_positions]
+        removed = [key for key in self.job_keys if key not in new_positions]
+        changed = [key for key, fingerprint in zip(new_keys, new_fingerprints)
+                   if key in old_positions
+                   and (full or self.job_fingerprints[old_positions[key]] != fingerprint)]
+        stale = set(added) | set(changed)
+        stale_positions = [j for j, key in enumerate(new_keys) if key in stale]
+        kept_positions = [j for j, key in enumerate(new_keys) if key not in stale]
+        kept_sources = np.array([old_positions[new_keys[j]] for j in kept_positions], dtype=int)
+
+        n_profiles = len(self.profiles)
+        scores = np.empty((n_profiles, len(new_keys)))
+        scores[:, kept_positions] = self.scores[:, kept_sources]
+        if stale_positions:
+            row = 0
+            for chunk in _chunks(self.profiles, chunk_size):
+                scores[row:row + len(chunk), stale_positions] = advisor._rounded_score_matrix(
+                    chunk, stale_positions)
+                row += len(chunk)
+
+        # Profil perlu di-rank ulang jika top-N lamanya memuat job yang berubah/hilang,
+        # atau jika kolom baru/berubah bisa menyamai skor ke-N
+        old_top = self.top
+        if (full or np.any(np.diff(kept_sources) < 0)
+                or not np.array_equal(bonus[kept_positions], self.bonus[kept_sources])
+                or min(self.top_n, len(new_keys)) != old_top.shape[1] or not n_profiles):
+            rerank = np.ones(n_profiles, dtype=bool)
+        else:
+            dirty = np.zeros(len(self.job_keys), dtype=bool)
+            for key in set(removed) | set(changed):
+                dirty[old_positions[key]] = True
+            rerank = dirty[old_top].any(axis=1)
+            if stale_positions and old_top.shape[1]:
+                last = old_top[:, -1]
+                kth = self.scores[np.arange(n_profiles), last] + self.bonus[last]
+                fresh = scores[:, stale_positions] + bonus[stale_positions]
+                rerank |= (fresh >= kth[:, None]).any(axis=1)
+
+        remap = np.full(len(self.job_keys), -1, dtype=int)
+        remap[kept_sources] = kept_positions
+        top = remap[old_top] if old_top.shape[1] == min(self.top_n, len(new_keys)) else None
+        self.scores = scores
+        self.bonus = bonus
+        rows = np.flatnonzero(rerank)
+        if top is None:
+            top = self._rank(np.arange(n_profiles))
+        elif len(rows):
+            top[rows] = self._rank(rows)
+
+        self.top = top
+        self.job_keys = new_keys
+        self.job_fingerprints = new_fingerprints
+        self.context = context
+        self.catalog_version = advisor.catalog_version
+        return {
+            'full': full,
+            'added': added,
+            'removed': removed,
+            'changed': changed,
+            'rescored_cells': n_profiles * len(stale_positions),
+            'reranked_profiles': len(rows),
+        }
+
+    def _check_catalog(self, advisor):
+        if tuple(record.key for record in advisor._job_records) != self.job_keys:
+            raise ValueError("score store does not match this catalog; call rescore() first")
+
+    def top_careers(self, index):
+        """[(career, score), ...] stored for one profile"""
+        return [(self.job_keys[j], float(self.scores[index, j])) for j in self.top[index]]
+
+    def recommendations(self, advisor, index):
+        """recommend_paths-style entries for one stored profile"""
+        self._check_catalog(advisor)
+        user_skills = self.profiles[index]['skills']
+        records = advisor._job_records
+        return [advisor._build_recommendation(records[j], user_skills,
+                                              float(self.scores[index, j]))
+                for j in self.top[index].tolist()]
+
+    def save(self, path):
+        profiles = "\n".join(json.dumps(user_data, ensure_ascii=False)
+                             for user_data in self.profiles).encode('utf-8')
+        meta = {'format_version': STORE_FORMAT_VERSION, 'top_n': self.top_n,
+                'context': self.context, 'catalog_version': self.catalog_version,
+                'profile_ids': self.profile_ids}
+        with open(path, 'wb') as f:
+            np.savez(f, scores=self.scores, top=self.top.astype(np.int32), bonus=self.bonus,
+                     job_keys=np.array(self.job_keys, dtype=str),
+                     job_fingerprints=np.array(self.job_fingerprints, dtype=str),
+                     profiles=np.frombuffer(profiles, dtype=np.uint8),
+                     meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path):
+        if np is None:
+            raise ImportError("numpy is required for the score store")
+        with np.load(path) as saved:
+            meta = json.loads(str(saved['meta']))
+            if meta.get('format_version') != STORE_FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported score store format")
+            text = saved['profiles'].tobytes().decode('utf-8')
+            return cls(
+                job_keys=[str(key) for key in saved['job_keys']],
+                job_fingerprints=[str(value) for value in saved['job_fingerprints']],
+                context=meta['context'],
+                scores=saved['scores'],
+                top=saved['top'].astype(int),
+                top_n=meta['top_n'],
+                profiles=[json.loads(line) for line in text.split("\n")] if text else [],
+                profile_ids=meta['profile_ids'],
+                catalog_version=meta['catalog_version'],
+                # Store tanpa 'bonus' dibuat dengan ranking match saja
+                bonus=saved['bonus'] if 'bonus' in saved.files else None)
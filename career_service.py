@@ -0,0 +1,352 @@
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import asdict
+from http import HTTPStatus
+from urllib.parse import parse_qs
+
+from career_batch import serialize_recommendation
+from career_tc import CareerPathAdvisor
+
+MAX_BODY_BYTES = 1 << 20
+
+
+class ServiceOverloaded(Exception):
+    """Raised when the scoring queue is full (mapped to HTTP 503)"""
+
+
+class LatencyMetrics:
+    """Request counters plus latency percentiles over a sliding window"""
+
+    def __init__(self, window=10000):
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+
+    def observe(self, seconds, status):
+        self.requests += 1
+        if status >= 500 and status != HTTPStatus.SERVICE_UNAVAILABLE:
+            self.errors += 1
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.rejected += 1
+        self.latencies.append(seconds)
+
+    def observe_batch(self, size):
+        self.batch_sizes.append(size)
+
+    @staticmethod
+    def _percentile(ordered, fraction):
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def snapshot(self):
+        ordered = sorted(self.latencies)
+        batches = list(self.batch_sizes)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'rejected': self.rejected,
+            'latency_ms': {
+                'p50': self._percentile(ordered, 0.50) * 1000,
+                'p95': self._percentile(ordered, 0.95) * 1000,
+                'p99': self._percentile(ordered, 0.99) * 1000,
+                'max': (ordered[-1] if ordered else 0.0) * 1000,
+            },
+            'batches': len(batches),
+            'mean_batch_size': sum(batches) / len(batches) if batches else 0.0,
+        }
+
+
+class MicroBatcher:
+    """Coalesces concurrent scoring requests into one recommend_paths_batch call"""
+
+    def __init__(self, advisor, max_batch=256, max_delay=0.005, max_queue=4096,
+                 metrics=None):
+        self.advisor = advisor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.metrics = metrics
+        self._worker = None
+
+    def start(self):
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, user_data, top_n=3):
+        """Queue one profile and wait for its recommendations"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((user_data, top_n, future))
+        except asyncio.QueueFull:
+            raise ServiceOverloaded("scoring queue is full") from None
+        return await future
+
+    async def _collect(self):
+        """Wait for one request, then gather more until max_batch or max_delay"""
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_delay
+        while len(batch) < self.max_batch:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _score(self, batch):
+        """recommend_paths_batch once per distinct top_n in the batch
+
+        Scoring every request with the largest top_n would make one big request
+        inflate ranking and recommendation building for the whole batch.
+        """
+        groups = {}
+        for i, (_, top_n, _) in enumerate(batch):
+            groups.setdefault(top_n, []).append(i)
+        results = [None] * len(batch)
+        for top_n, indexes in groups.items():
+            profiles = [batch[i][0] for i in indexes]
+            for i, recommendations in zip(
+                    indexes, self.advisor.recommend_paths_batch(profiles, top_n)):
+                results[i] = recommendations
+        return results
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if self.metrics is not None:
+                self.metrics.observe_batch(len(batch))
+            try:
+                # Scoring CPU-bound; jalankan di executor agar event loop tetap responsif
+                results = await loop.run_in_executor(None, self._score, batch)
+            except Exception as exc:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, _, future), recommendations in zip(batch, results):
+                if not future.done():
+                    future.set_result(recommendations)
+
+
+class CareerService:
+    """HTTP-style front end: routes requests to the advisor and micro-batcher"""
+
+    def __init__(self, advisor=None, max_batch=256, max_delay=0.005, max_queue=4096,
+                 instrument=False):
+        self.advisor = advisor if advisor is not None else CareerPathAdvisor()
+        if instrument and self.advisor.instrumentation is None:
+            self.advisor.enable_instrumentation()
+        # Cache bersama diisi sekarang, supaya thread executor hanya membacanya
+        self.advisor.warm_caches()
+        self.metrics = LatencyMetrics()
+        self.batcher = MicroBatcher(self.advisor, max_batch, max_delay, max_queue,
+                                    metrics=self.metrics)
+        self._server = None
+
+    async def handle(self, method, path, body=b''):
+        """Process one request; returns (status, JSON-serializable payload)"""
+        started = time.perf_counter()
+        try:
+            route, _, query = path.partition('?')
+            status, payload = await self._dispatch(method, route, body, query)
+        except ServiceOverloaded as exc:
+            status, payload = HTTPStatus.SERVICE_UNAVAILABLE, {'error': str(exc)}
+        except Exception as exc:
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(exc)}
+        elapsed = time.perf_counter() - started
+        self.metrics.observe(elapsed, status)
+        if isinstance(payload, dict) and status == HTTPStatus.OK and path.startswith('/recommend'):
+            payload['latency_ms'] = elapsed * 1000
+        return int(status), payload
+
+    async def _dispatch(self, method, path, body, query=''):
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, {'status': 'ok', 'catalog_version': self.advisor.catalog_version}
+        if path == '/metrics' and method == 'GET':
+            snapshot = self.metrics.snapshot()
+            if self.advisor.instrumentation is not None:
+                snapshot['stages'] = self.advisor.instrumentation.snapshot()
+            return HTTPStatus.OK, snapshot
+        if path == '/metrics/prometheus' and method == 'GET':
+            if self.advisor.instrumentation is None:
+                return HTTPStatus.NOT_FOUND, {'error': "instrumentation is disabled"}
+            # Payload str dikirim apa adanya sebagai text/plain
+            return HTTPStatus.OK, self.advisor.instrumentation.to_prometheus()
+        if path == '/universities' and method == 'GET':
+            return self._universities(query)
+        if path == '/recommend':
+            if method != 'POST':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': "use POST"}
+            return await self._recommend(body)
+        return HTTPStatus.NOT_FOUND, {'error': f"no route for {method} {path}"}
+
+    async def _recommend(self, body):
+        try:
+            request = json.loads(body or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError("request body must be a JSON object")
+            profile = request.get('profile', request)
+            top_n = int(request.get('top_n', 3))
+            if top_n < 1:
+                raise ValueError("top_n must be at least 1")
+            include_roadmap = bool(request.get('roadmap', True))
+            user_data = self.advisor.normalize_profile(profile)
+        except (AttributeError, TypeError, ValueError) as exc:
+            return HTTPStatus.BAD_REQUEST, {'error': f"invalid profile: {exc}"}
+        if include_roadmap and 'financial_investment' not in user_data['constraints']:
+            return HTTPStatus.BAD_REQUEST, {
+                'error': "constraints.financial_investment is required for the roadmap"}
+
+        # Lebih dari jumlah job tidak mengubah hasil, tapi memecah micro-batch
+        top_n = min(top_n, len(self.advisor.job_index))
+        recommendations = await self.batcher.submit(user_data, top_n)
+        payload = {
+            'id': profile.get('id'),
+            'recommendations': [serialize_recommendation(rec) for rec in recommendations]
+        }
+        if include_roadmap:
+            payload['roadmaps'] = await asyncio.get_running_loop().run_in_executor(
+                None, self._roadmaps, user_data, recommendations)
+        return HTTPStatus.OK, payload
+
+    def _roadmaps(self, user_data, recommendations):
+        return [asdict(self.advisor.build_roadmap(user_data, rec)) for rec in recommendations]
+
+    def _universities(self, query):
+        """GET /universities?career=..&max_cost=..&type=negeri&location=..&strength=..&page=.."""
+        params = parse_qs(query)
+
+        def first(name, cast=str):
+            values = params.get(name)
+            return cast(values[0]) if values else None
+
+        try:
+            result = self.advisor.search_universities(
+                career=first('career'),
+                max_total_cost=first('max_cost', float),
+                min_total_cost=first('min_cost', float),
+                types=params.get('type'),
+                location=first('location'),
+                strengths=params.get('strength'),
+                sort=first('sort') or 'cost',
+                page=first('page', int) or 1,
+                page_size=min(first('page_size', int) or 10, 100),
+                user_budget=first('budget', float))
+        except ValueError as exc:
+            return HTTPStatus.BAD_REQUEST, {'error': str(exc)}
+        payload = asdict(result)
+        payload['pages'] = result.pages
+        return HTTPStatus.OK, payload
+
+    # --- asyncio streams HTTP/1.1 server ---
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, target, _version = request_line.decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY_BYTES:
+            raise ValueError("request body too large")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target, headers, body
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except (ValueError, asyncio.IncompleteReadError):
+                    status, payload, headers = HTTPStatus.BAD_REQUEST, {'error': "malformed request"}, {}
+                    request = None
+                    keep_alive = False
+                else:
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    status, payload = await self.handle(method, target, body)
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+
+                if isinstance(payload, str):
+                    data = payload.encode('utf-8')
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                else:
+                    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                    content_type = "application/json; charset=utf-8"
+                phrase = HTTPStatus(status).phrase
+                writer.write(
+                    f"HTTP/1.1 {int(status)} {phrase}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8080):
+        """Start listening; returns the asyncio Server (port 0 picks a free port)"""
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+
+class InProcessClient:
+    """Test client that calls CareerService.handle directly, without sockets"""
+
+    def __init__(self, service):
+        self.service = service
+
+    async def get(self, path):
+        return await self.service.handle('GET', path)
+
+    async def post(self, path, payload):
+        return await self.service.handle('POST', path, json.dumps(payload).encode('utf-8'))
+
+
+async def serve(host='127.0.0.1', port=8080, **options):
+    """Run the service until cancelled"""
+    service = CareerService(**options)
+    server = await service.start(host, port)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Career advisor service listening on {addresses}")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
@@ -0,0 +1,363 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict, deque
+from functools import lru_cache
+
+# Tanda baca yang dianggap pemisah kata: "machine-learning" == "machine learning"
+_SEPARATORS = re.compile(r"[\s\-./]+")
+
+# Prefix minimal agar "pyth" boleh dilengkapi menjadi "python"
+MIN_PREFIX_LENGTH = 4
+# Term sependek ini (aws, sql, excel -> hanya exact/prefix) tidak pernah di-fuzzy-match
+MAX_EXACT_ONLY_LENGTH = 4
+# Sampai panjang ini hanya huruf hilang/dobel yang dimaafkan, bukan huruf diganti
+# ('excell' -> excel, tapi 'expel' tetap kata lain)
+MAX_LENGTH_EDIT_ONLY = 5
+# Bagian minimal trigram yang harus sama sebelum edit distance dihitung
+MIN_TRIGRAM_SHARE = 0.3
+
+
+def skill_key(name):
+    """Canonical lookup key: lower case, separators collapsed to '_'"""
+    return _SEPARATORS.sub('_', str(name).lower().strip()).strip('_')
+
+
+def max_typo_distance(length):
+    """Edit distance tolerated for a query of this length"""
+    if length <= 3:
+        return 0
+    if length <= 5:
+        return 1
+    if length <= 10:
+        return 2
+    return 3
+
+
+def _trigrams(key):
+    padded = f"^{key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a, b, bound):
+    """Optimal string alignment distance (adjacent swaps count 1), or bound+1 if larger"""
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and char_a == b[j - 2] and a[i - 2] == char_b):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > bound:
+            return bound + 1
+        previous2, previous = previous, current
+    return min(previous[-1], bound + 1)
+
+
+class SkillNormalizer:
+    """Maps free-text skill names to canonical skills
+
+    Lookup order: exact term (canonical name or synonym), unique prefix in a trie,
+    then trigram candidates ranked by bounded edit distance. The indexes are built
+    once; results are memoized so repeated names cost one dict lookup.
+    """
+
+    def __init__(self, canonical_skills, synonyms, cache_size=65536):
+        # term -> skill kanonik; sinonim menang jika namanya juga skill kanonik
+        terms = {skill_key(skill): skill for skill in canonical_skills}
+        terms.update((skill_key(synonym), skill) for synonym, skill in synonyms.items())
+        terms.pop('', None)
+        self.terms = terms
+        self._term_list = sorted(terms)
+
+        # Trie: setiap node menyimpan skill kanonik jika semua term di bawahnya sama
+        self._trie = {}
+        for term in self._term_list:
+            node = self._trie
+            for char in term:
+                node = node.setdefault(char, {})
+                completion = node.get(None, terms[term])
+                node[None] = completion if completion == terms[term] else ''
+
+        self._trigram_index = defaultdict(list)
+        self._trigram_counts = []
+        for term_id, term in enumerate(self._term_list):
+            grams = _trigrams(term)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._trigram_index[gram].append(term_id)
+
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def normalize(self, name):
+        """Canonical skill for name; unknown names come back as their lookup key"""
+        key = skill_key(name)
+        return self.lookup(key)[0] or key
+
+    def match(self, name):
+        """(canonical skill or None, how) with how in exact|prefix|fuzzy|unknown"""
+        return self.lookup(skill_key(name))
+
+    def _lookup(self, key):
+        skill = self.terms.get(key)
+        if skill is not None:
+            return skill, 'exact'
+        skill = self._prefix_match(key)
+        if skill:
+            return skill, 'prefix'
+        skill = self._fuzzy_match(key)
+        if skill is not None:
+            return skill, 'fuzzy'
+        return None, 'unknown'
+
+    def _prefix_match(self, key):
+        if len(key) < MIN_PREFIX_LENGTH:
+            return None
+        node = self._trie
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node.get(None)
+
+    def _fuzzy_match(self, key):
+        """Closest term within the typo budget, or None
+
+        The budget comes from the shorter of query and term, so a long word is not
+        allowed many edits towards a short term. Short terms, terms with another
+        first letter (typos rarely hit it: 'readership' is not 'leadership'),
+        same-length near misses of 5-letter terms and terms sharing under
+        MIN_TRIGRAM_SHARE of their trigrams are never matched.
+        """
+        if len(key) <= MAX_EXACT_ONLY_LENGTH:
+            return None
+        query_grams = _trigrams(key)
+        shared = defaultdict(int)
+        for gram in query_grams:
+            for term_id in self._trigram_index.get(gram, ()):
+                shared[term_id] += 1
+
+        best = None
+        for term_id, common in shared.items():
+            term = self._term_list[term_id]
+            if len(term) <= MAX_EXACT_ONLY_LENGTH or term[0] != key[0]:
+                continue
+            grams = max(len(query_grams), self._trigram_counts[term_id])
+            shorter = min(len(key), len(term))
+            if shorter <= MAX_LENGTH_EDIT_ONLY and len(key) == len(term):
+                continue
+            bound = max_typo_distance(shorter)
+            # q-gram lemma: setiap edit merusak paling banyak 3 trigram
+            if common < MIN_TRIGRAM_SHARE * grams or common < grams - 3 * bound:
+                continue
+            distance = bounded_edit_distance(key, term, bound)
+            if distance > bound:
+                continue
+            rank = (distance, -common, term_id)
+            if best is None or rank < best[0]:
+                best = (rank, self.terms[term])
+        return best[1] if best is not None else None
+
+
+# Kata level dihubungkan ke skill jika berjarak paling jauh sekian karakter
+# (tidak melewati akhir kalimat/baris)
+LEVEL_WINDOW = 24
+_SENTENCE_BREAKS = re.compile(r"[.;!?](?=\s)|\n")
+_TEXT_SEPARATORS = re.compile(r"[^\w|]+|_+")
+
+
+class SkillExtractor:
+    """Single-pass Aho-Corasick scan of free text for skills and level words
+
+    Patterns are whole words: every term is matched as "_term_" against text whose
+    separators are folded to '_'. Overlapping matches resolve leftmost-longest
+    ("data analysis" beats "data"). Text can be fed in chunks of any size; the
+    automaton state and pending matches carry over between chunks.
+    """
+
+    def __init__(self, terms, levels, default_level=0.5):
+        # pattern -> ('skill', canonical) atau ('level', nilai)
+        patterns = {f"_{skill_key(word)}_": ('level', value) for word, value in levels.items()}
+        patterns.update((f"_{term}_", ('skill', skill)) for term, skill in terms.items())
+        self.default_level = default_level
+        self.max_pattern_length = max(map(len, patterns), default=0)
+        self._build_automaton(patterns)
+
+    def _build_automaton(self, patterns):
+        goto = [{}]
+        output = [None]
+        for pattern, value in patterns.items():
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    output.append(None)
+                state = nxt
+            output[state] = (len(pattern), value)
+
+        # BFS: failure links, lalu goto dilengkapi menjadi DFA penuh
+        alphabet = {char for pattern in patterns for char in pattern}
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        while queue:
+            state = queue.popleft()
+            # Simpan match terpanjang yang berakhir di state ini (lewat rantai fail)
+            if output[state] is None:
+                output[state] = output[fail[state]]
+            transitions = delta[state]
+            for char in alphabet:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    target = delta[fail[state]].get(char)
+                    if target:
+                        transitions[char] = target
+                else:
+                    fail[nxt] = delta[fail[state]].get(char, 0) if state else 0
+                    transitions[char] = nxt
+                    queue.append(nxt)
+        self._delta = delta
+        self._output = output
+
+    def scanner(self):
+        """Fresh streaming scan; feed() chunks, then finish() for the skills dict"""
+        return SkillScan(self)
+
+    def extract(self, text):
+        """Extract from a string or an iterable of string chunks"""
+        scan = self.scanner()
+        for chunk in ([text] if isinstance(text, str) else text):
+            scan.feed(chunk)
+        return scan.finish()
+
+    def extract_file(self, path, chunk_size=1 << 20, encoding='utf-8'):
+        """Extract from a text file without reading it into memory at once"""
+        with open(path, encoding=encoding, errors='replace') as f:
+            return self.extract(iter(lambda: f.read(chunk_size), ''))
+
+
+class SkillScan:
+    """Streaming state of one SkillExtractor pass"""
+
+    def __init__(self, extractor):
+        self.extractor = extractor
+        self.skills = {}
+        # Teks diawali '_' sebagai batas kata; posisi = offset di teks ternormalisasi
+        self._state = extractor._delta[0].get('_', 0)
+        self._position = 1
+        self._last_char = '_'
+        self._candidates = []       # (start, end, value), belum tentu final
+        self._covered_until = 0
+        self._pending = None        # [skill, end, level sebelum skill]
+        self._last_level = None     # (end, level) yang belum dipakai skill
+        self._breaks = []           # posisi '|' (akhir kalimat) yang masih relevan
+        self._carry = ''            # tanda baca di ujung chunk, menunggu karakter berikutnya
+
+    def feed(self, chunk):
+        chunk = self._carry + chunk
+        self._carry = ''
+        if chunk[-1:] in ('.', ';', '!', '?'):
+            chunk, self._carry = chunk[:-1], chunk[-1]
+        text = _SENTENCE_BREAKS.sub(' | ', chunk.lower())
+        text = _TEXT_SEPARATORS.sub('_', text)
+        if self._last_char == '_' and text.startswith('_'):
+            text = text[1:]
+        if not text:
+            return
+        offset = self._position
+        found = text.find('|')
+        while found != -1:
+            self._breaks.append(offset + found)
+            found = text.find('|', found + 1)
+        delta = self.extractor._delta
+        output = self.extractor._output
+        state = self._state
+        position = self._position
+        candidates = self._candidates
+        for char in text:
+            state = delta[state].get(char, 0)
+            position += 1
+            match = output[state]
+            if match is not None:
+                candidates.append((position - match[0], position, match[1]))
+        self._state = state
+        self._position = position
+        self._last_char = text[-1]
+        self._resolve(position - self.extractor.max_pattern_length)
+        if self._breaks:
+            # Batas yang lebih tua dari match terakhir tidak akan diperiksa lagi
+            keep_from = bisect_left(self._breaks, self._covered_until - LEVEL_WINDOW * 2)
+            del self._breaks[:keep_from]
+
+    def finish(self):
+        """Flush pending matches and return {skill: level}"""
+        if self._carry or self._last_char != '_':
+            self.feed(' ')
+        self._resolve(None)
+        self._finish_pending()
+        return self.skills
+
+    def _resolve(self, limit):
+        """Emit leftmost-longest matches that no later match can still contain"""
+        if not self._candidates:
+            return
+        # Match yang berawal <= limit sudah lengkap (semua pembungkusnya sudah terlihat)
+        ready = [c for c in self._candidates if limit is None or c[0] <= limit]
+        if not ready:
+            return
+        self._candidates = [c for c in self._candidates if limit is not None and c[0] > limit]
+        ready.sort(key=lambda c: (c[0], -c[1]))
+        for start, end, value in ready:
+            # Batas '_' boleh dipakai bersama oleh dua match yang berdampingan
+            if start + 1 < self._covered_until:
+                continue
+            self._covered_until = end
+            self._on_match(start, end, value)
+
+    def _crosses_break(self, begin, end):
+        index = bisect_left(self._breaks, begin)
+        return index < len(self._breaks) and self._breaks[index] < end
+
+    def _on_match(self, start, end, value):
+        kind, payload = value
+        window = LEVEL_WINDOW
+        pending = self._pending
+        if pending is not None and (start - pending[1] > window
+                                    or self._crosses_break(pending[1], start)):
+            self._finish_pending()
+            pending = None
+        if kind == 'level':
+            if pending is not None:
+                # "python advanced": level sesudah skill
+                self._finish_pending(payload)
+            else:
+                self._last_level = (end, payload)
+            return
+        self._finish_pending()
+        before = None
+        if (self._last_level is not None and start - self._last_level[0] <= window
+                and not self._crosses_break(self._last_level[0], start)):
+            before = self._last_level[1]        # "advanced python"
+        self._last_level = None
+        self._pending = [payload, end, before]
+
+    def _finish_pending(self, level=None):
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        skill, _, before = pending
+        if level is None:
+            level = before if before is not None else self.extractor.default_level
+        self.skills[skill] = max(level, self.skills.get(skill, 0.0))
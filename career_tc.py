@@ -1,232 +1,349 @@
+import argparse
+import hashlib
+import heapq
 import json
 import math
-from collections import defaultdict, deque
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque, namedtuple
 from datetime import datetime
+from types import MappingProxyType
 import statistics
+import threading
+from contextlib import contextmanager
+
+from career_cache import (MISS, ResultCache, SQLiteResultCache, fingerprint_spec,
+                          profile_fingerprint)
+from career_data import load_catalogs
+from career_metrics import Instrumentation, profile_call
+from career_records import CompactProfile, CompactRecommendation, SkillVocabulary
+from career_report import (ConsoleRenderer, LearningMonth, MajorRecommendation,
+                           ProfileSummary, Roadmap, SkillPlan, UniversityOption,
+                           UniversityPage)
+from career_skills import SkillExtractor, SkillNormalizer
+
+try:
+    import numpy as np
+except ImportError:  # numpy hanya dibutuhkan untuk batch scoring
+    np = None
+
+
+# Estimasi biaya pendidikan (IDR) per jenis pendidikan yang dibutuhkan
+EDUCATION_COST_IDR = {
+    'kedinasan': 0,                 # Sekolah kedinasan - gratis
+    'doctorate': 150000000,         # 150 juta untuk S3
+    'law_degree': 80000000,         # 80 juta untuk pendidikan hukum
+    'bachelor_degree': 50000000,    # 50 juta untuk S1
+    'associate_degree': 25000000,   # 25 juta untuk D3
+    'culinary_school': 30000000,    # 30 juta untuk sekolah kuliner
+    'apprenticeship': 5000000,      # 5 juta untuk pemagangan
+}
+DEFAULT_EDUCATION_COST_IDR = 10000000   # 10 juta default
+CERTIFICATION_COST_IDR = 5000000        # +5 juta untuk sertifikasi
+
+# Minimum timeline (bulan) dan penalti skor jika timeline user lebih pendek
+TIMELINE_RULES = {
+    'doctorate': (60, -5),
+    'law_degree': (48, -3),
+    'bachelor_degree': (36, -2),
+    'associate_degree': (24, -1),
+}
+TIMELINE_BONUS = 5
+
+# Skor maksimum job tanpa satu pun skill yang cocok: budget + timeline + preferensi
+NO_SKILL_MATCH_SCORE_BOUND = 10 + TIMELINE_BONUS + 10
+# Skor dibulatkan ke 0.1, jadi batas atas pruning diberi kelonggaran
+PRUNING_ROUNDING_MARGIN = 0.1
+
+# Partial credit lewat skill_graph: kredit per edge dikali weight node pemilik edge
+RELATED_SKILL_CREDIT = 0.5
+PREREQUISITE_CREDIT = 0.25
+SKILL_GRAPH_MAX_HOPS = 2
+# Kredit dibulatkan ke bawah ke kelipatan 1/1024 supaya penjumlahan float selalu
+# eksak (urutan penjumlahan scalar vs NumPy tidak mengubah skor)
+SIMILARITY_RESOLUTION = 1024
+
+# Bobot relevansi berdasarkan daftar jurusan tempat kekuatan itu cocok
+MAJOR_RELEVANCE_WEIGHTS = (('priority', 1.0), ('recommended_majors', 0.6),
+                           ('related_majors', 0.3))
+
+# Kekuatan universitas yang relevan untuk satu karir, dihitung sekali dari data statis
+UniversityRelevance = namedtuple('UniversityRelevance', ['strengths', 'score'])
+
+# Universitas diurutkan menurut total biaya kuliah; costs dipakai untuk bisect
+UniversityCostIndex = namedtuple('UniversityCostIndex', ['costs', 'numbers', 'keys'])
+DEGREE_SEMESTERS = 8    # 8 semester for bachelor
+
+# Estimasi jam belajar per skill untuk jadwal roadmap
+STUDY_HOURS_PER_STEP = 10
+DEFAULT_SKILL_STUDY_HOURS = 40
+WEEKS_PER_MONTH = 52 / 12
+
+# Prior pasar per job: komponen dinormalisasi ke 0..1 saat katalog dibangun
+TREND_SCORES = {'up': 1.0, 'stable': 0.5, 'down': 0.0}
+DEFAULT_TREND_SCORE = 0.5
+# Prior 1.0 bernilai sekian poin skor saat prior_weight = 1
+PRIOR_SCALE = 100
+
+# Ranking = match score + prior_weight * PRIOR_SCALE * prior job. Bobot komponen
+# menentukan prior; prior_weight 0 berarti ranking murni berdasarkan match score.
+RankingModel = namedtuple('RankingModel',
+                          ['prior_weight', 'demand', 'growth', 'salary', 'trend'],
+                          defaults=(0.0, 0.4, 0.3, 0.1, 0.2))
+
+# Naikkan jika rumus skor atau isi Roadmap berubah supaya hasil lama di result cache
+# persisten tidak dipakai (3: roadmap urut prasyarat + jadwal bulanan,
+# 4: relevant_strengths dari tabel relevansi universitas)
+SCORING_VERSION = 4
+
+# Precompiled, read-only view of one job_market entry
+JobRecord = namedtuple('JobRecord', [
+    'key', 'details', 'skills', 'skill_mask', 'required_count',
+    'emerging_skills', 'environments', 'estimated_cost_idr',
+    'timeline_limit', 'timeline_penalty', 'position'
+], defaults=(None,))     # position di _job_records; None untuk record di luar index
+
+# Per-request facts about a user profile, derived once before scoring jobs
+UserContext = namedtuple('UserContext', [
+    'skills', 'skill_mask', 'low_mask', 'partial_credit', 'job_credit', 'budget_idr',
+    'timeline_months', 'environments'
+])
+
+
+# Graf prasyarat satu karir: skill diurutkan topologis (prasyarat lebih dulu)
+LearningDag = namedtuple('LearningDag', ['career', 'order', 'prerequisites', 'cycles'])
+
+
+# Katalog referensi -> method builder; dibangun sekali dan dibagi semua advisor
+REFERENCE_CATALOGS = {
+    'skill_graph': 'build_skill_graph',
+    'job_market': 'initialize_comprehensive_market_data',
+    'industry_trends': 'load_industry_trends',
+    'skill_synonyms': 'build_skill_synonyms',
+    'skill_level_mapping': 'build_skill_level_mapping',
+    'standard_skills': 'build_standard_skills',
+    'indonesian_universities': 'load_indonesian_universities',
+    'education_costs_idr': 'load_education_costs_idr',
+    'major_recommendations': 'build_major_recommendations',
+    'major_keywords': 'build_major_keywords',
+}
+
+
+def _location_tokens(location):
+    """Lower-case words of a location ('Depok & Jakarta' -> {'depok', 'jakarta'})"""
+    return {token for token in re.split(r"[^\w]+", location.lower()) if token}
+
+
+def _freeze(value):
+    """Recursively convert dicts/lists/sets into read-only equivalents"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value):
+    """Recursively copy frozen reference data back into plain dicts/lists/sets"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return set(value)
+    return value
 
 
 class CareerPathAdvisor:
+    # Direktori file katalog JSON (None = data/ bawaan, lihat career_data.py)
+    data_dir = None
+    # Snapshot data referensi read-only, dibangun sekali per proses
+    _reference_data_cache = None
+    _reference_data_lock = threading.Lock()
+    # Database learning resources dibangun sekali per proses (lihat get_learning_resources)
+    _learning_resources_cache = None
+    _learning_resources_lock = threading.Lock()
+    # Optional ResultCache (career_cache) di depan recommend_paths & build_roadmap
+    result_cache = None
+    instrumentation = None
+    # (skills, constraints, environments, UserContext) terakhir dari _calculate_score
+    _last_user_context = None
+    # Blend match score dengan prior pasar (lihat RankingModel); default = match saja
+    ranking = RankingModel()
+
     def __init__(self):
-        self.skill_graph = self.build_skill_graph()
-        self.job_market = self.initialize_comprehensive_market_data()
-        self.industry_trends = self.load_industry_trends()
-        self.skill_synonyms = self.build_skill_synonyms()
-        self.skill_level_mapping = self.build_skill_level_mapping()
-        self.indonesian_universities = self.load_indonesian_universities()
-        self.education_costs_idr = self.load_education_costs_idr()
-        # TAMBAHAN BARU: Database jurusan
-        self.major_recommendations = self.build_major_recommendations()
+        # Semua katalog & index menunjuk ke snapshot bersama (tanpa copy)
+        self.__dict__.update(self.shared_reference_data())
+
+    @classmethod
+    def shared_reference_data(cls):
+        """Process-wide read-only snapshot of catalogs and compiled indexes"""
+        snapshot = cls.__dict__.get('_reference_data_cache')
+        if snapshot is None:
+            with cls._reference_data_lock:
+                snapshot = cls.__dict__.get('_reference_data_cache')
+                if snapshot is None:
+                    snapshot = cls._build_reference_data()
+                    cls._reference_data_cache = snapshot
+        return snapshot
+
+    @classmethod
+    def _build_reference_data(cls):
+        """Build every catalog once, freeze it and compile the derived indexes"""
+        builder = cls.__new__(cls)
+        builder._loaded_catalogs = load_catalogs(cls.data_dir)
+        for name, method in REFERENCE_CATALOGS.items():
+            setattr(builder, name, _freeze(getattr(builder, method)()))
+        # Versi konten katalog (hash file data) untuk invalidasi cache hasil
+        builder.catalog_version = builder._loaded_catalogs.version
+        del builder._loaded_catalogs
+        builder._compile_reference_indexes()
+        return MappingProxyType(dict(builder.__dict__))
+
+    @classmethod
+    def reload_reference_data(cls):
+        """Drop the shared snapshot; advisors created afterwards rebuild it"""
+        with cls._reference_data_lock:
+            cls._reference_data_cache = None
+        cls.reload_learning_resources()
+
+    def _compile_reference_indexes(self):
+        """Rebuild every index derived from the reference catalogs"""
+        # Cache turunan (mis. matriks NumPy) dibagi oleh advisor dengan index yang sama
+        self._shared_cache = {}
+        self._last_user_context = None
+        self.compile_job_index()
+        self.compile_job_priors()
+        self.compile_skill_similarity()
+        self.compile_skill_normalizer()
+        self.compile_record_vocabulary()
+        self.compile_university_relevance()
+        self.compile_university_index()
+
+    def warm_caches(self):
+        """Fill the lazily built shared caches up front
+
+        _shared_cache is filled without a lock; call this before scoring from
+        several threads (e.g. the service executor) so they only read it.
+        """
+        fingerprint_spec(self)
+        self.skill_extractor()
+        self.job_priors()
+        self.ranking_bonus()
+        if np is not None:
+            self._build_job_matrices()
+        for career_key in self.job_market:
+            self.learning_dag(career_key)
+        self.get_learning_resources()
+
+    @contextmanager
+    def edit_catalog(self, name):
+        """Copy-on-write edit of one reference catalog for this advisor only"""
+        if name not in REFERENCE_CATALOGS:
+            raise KeyError(f"Unknown reference catalog: {name}")
+        catalog = _thaw(getattr(self, name))
+        yield catalog
+        setattr(self, name, _freeze(catalog))
+        # Katalog privat berbeda dari file data, jadi versinya juga berbeda
+        edited = json.dumps(catalog, sort_keys=True, default=sorted)
+        self.catalog_version = hashlib.sha256(
+            f"{self.catalog_version}:{name}:{edited}".encode()).hexdigest()
+        self._compile_reference_indexes()
+
+    def _catalog(self, name):
+        """Fresh, writable copy of one catalog loaded from the data files"""
+        catalogs = getattr(self, '_loaded_catalogs', None)
+        if catalogs is None:
+            catalogs = load_catalogs(self.data_dir)
+        return _thaw(catalogs.data[name])
 
     def build_major_recommendations(self):
         """Database rekomendasi jurusan untuk setiap karir"""
-        return {
-            'software_developer': {
-                'recommended_majors': ['Teknik Informatika', 'Ilmu Komputer', 'Sistem Informasi', 'Teknik Komputer'],
-                'related_majors': ['Matematika', 'Teknik Elektro', 'Statistika'],
-                'priority': ['Ilmu Komputer', 'Teknik Informatika']
-            },
-            'data_scientist': {
-                'recommended_majors': ['Ilmu Komputer', 'Statistika', 'Matematika', 'Fisika'],
-                'related_majors': ['Teknik Industri', 'Ekonomi', 'Aktuaria'],
-                'priority': ['Statistika', 'Ilmu Komputer']
-            },
-            'product_manager': {
-                'recommended_majors': ['Manajemen', 'Teknik Industri', 'Sistem Informasi', 'Psikologi'],
-                'related_majors': ['Komunikasi', 'Marketing', 'Ekonomi'],
-                'priority': ['Manajemen', 'Teknik Industri']
-            },
-            'digital_marketer': {
-                'recommended_majors': ['Marketing', 'Komunikasi', 'Manajemen', 'Ilmu Komunikasi'],
-                'related_majors': ['Psikologi', 'Sosiologi', 'Desain Komunikasi Visual'],
-                'priority': ['Marketing', 'Ilmu Komunikasi']
-            },
-            'registered_nurse': {
-                'recommended_majors': ['Ilmu Keperawatan', 'Kedokteran', 'Kesehatan Masyarakat'],
-                'related_majors': ['Psikologi', 'Gizi', 'Farmasi'],
-                'priority': ['Ilmu Keperawatan']
-            },
-            'electrician': {
-                'recommended_majors': ['Teknik Elektro', 'Teknik Listrik', 'Teknik Energi'],
-                'related_majors': ['Teknik Mesin', 'Teknik Fisika'],
-                'priority': ['Teknik Elektro']
-            },
-            'graphic_designer': {
-                'recommended_majors': ['Desain Komunikasi Visual', 'Seni Rupa', 'Desain Grafis'],
-                'related_majors': ['Arsitektur', 'Ilmu Komunikasi'],
-                'priority': ['Desain Komunikasi Visual']
-            },
-            'secondary_teacher': {
-                'recommended_majors': ['Pendidikan Matematika', 'Pendidikan Bahasa Inggris', 'Pendidikan IPA', 'Pendidikan IPS'],
-                'related_majors': ['Psikologi', 'Sosiologi'],
-                'priority': ['Pendidikan Sesuai Bidang']
-            },
-            'financial_analyst': {
-                'recommended_majors': ['Manajemen', 'Akuntansi', 'Ekonomi', 'Matematika'],
-                'related_majors': ['Statistika', 'Teknik Industri'],
-                'priority': ['Manajemen', 'Akuntansi']
-            },
-            'sustainability_specialist': {
-                'recommended_majors': ['Teknik Lingkungan', 'Kehutanan', 'Ilmu Lingkungan', 'Agroteknologi'],
-                'related_majors': ['Biologi', 'Kimia', 'Geografi'],
-                'priority': ['Teknik Lingkungan', 'Ilmu Lingkungan']
-            },
-            'legal_consultant': {
-                'recommended_majors': ['Ilmu Hukum'],
-                'related_majors': ['Hubungan Internasional', 'Administrasi Negara'],
-                'priority': ['Ilmu Hukum']
-            },
-            'chef': {
-                'recommended_majors': ['Tata Boga', 'Teknologi Pangan', 'Pariwisata'],
-                'related_majors': ['Manajemen', 'Kewirausahaan'],
-                'priority': ['Tata Boga']
-            },
-            'police_officer': {
-                'recommended_majors': ['Ilmu Hukum', 'Kriminologi', 'Administrasi Negara'],
-                'related_majors': ['Psikologi', 'Sosiologi'],
-                'priority': ['Ilmu Hukum', 'Kriminologi']
-            },
-            'detective': {
-                'recommended_majors': ['Kriminologi', 'Ilmu Hukum', 'Psikologi'],
-                'related_majors': ['Sosiologi', 'Antropologi'],
-                'priority': ['Kriminologi']
-            },
-            'military_officer': {
-                'recommended_majors': ['Teknik Mesin', 'Teknik Elektro', 'Ilmu Komputer', 'Manajemen'],
-                'related_majors': ['Geografi', 'Hubungan Internasional'],
-                'priority': ['Teknik Mesin', 'Teknik Elektro']
-            },
-            'intelligence_analyst': {
-                'recommended_majors': ['Ilmu Komputer', 'Matematika', 'Hubungan Internasional', 'Psikologi'],
-                'related_majors': ['Statistika', 'Sosiologi'],
-                'priority': ['Ilmu Komputer', 'Hubungan Internasional']
-            },
-            'attorney': {
-                'recommended_majors': ['Ilmu Hukum'],
-                'related_majors': ['Ekonomi', 'Psikologi'],
-                'priority': ['Ilmu Hukum']
-            },
-            'paralegal': {
-                'recommended_majors': ['Ilmu Hukum', 'Administrasi Perkantoran'],
-                'related_majors': ['Komunikasi', 'Manajemen'],
-                'priority': ['Ilmu Hukum']
-            },
-            'farm_manager': {
-                'recommended_majors': ['Agroteknologi', 'Agribisnis', 'Peternakan', 'Kehutanan'],
-                'related_majors': ['Biologi', 'Manajemen'],
-                'priority': ['Agroteknologi', 'Agribisnis']
-            },
-            'agricultural_specialist': {
-                'recommended_majors': ['Agroteknologi', 'Ilmu Tanah', 'Horticulture', 'Proteksi Tanaman'],
-                'related_majors': ['Biologi', 'Kimia'],
-                'priority': ['Agroteknologi']
-            },
-            'livestock_manager': {
-                'recommended_majors': ['Peternakan', 'Veteriner', 'Teknologi Hasil Ternak'],
-                'related_majors': ['Biologi', 'Manajemen'],
-                'priority': ['Peternakan']
-            },
-            'restaurant_manager': {
-                'recommended_majors': ['Manajemen Perhotelan', 'Pariwisata', 'Tata Boga', 'Manajemen'],
-                'related_majors': ['Komunikasi', 'Kewirausahaan'],
-                'priority': ['Manajemen Perhotelan', 'Pariwisata']
-            }
-        }
+        return self._catalog('major_recommendations')
 
-    def display_major_recommendations(self, career_key):
-        """Menampilkan rekomendasi jurusan untuk karir tertentu"""
+    def build_major_keywords(self):
+        """Kata nama jurusan -> token kekuatan universitas (Inggris), plus stopword"""
+        keywords = self._catalog('major_keywords')
+        keywords['stopwords'] = set(keywords['stopwords'])
+        return keywords
+
+    def major_recommendation(self, career_key):
+        """Rekomendasi jurusan untuk karir tertentu (None jika belum tersedia)"""
         if career_key not in self.major_recommendations:
-            print("   📚 Rekomendasi jurusan: Informasi belum tersedia")
-            return
+            return None
 
         major_info = self.major_recommendations[career_key]
+        return MajorRecommendation(
+            priority=list(major_info['priority']),
+            other_majors=[m for m in major_info['recommended_majors']
+                          if m not in major_info['priority']],
+            related_majors=list(major_info['related_majors'])
+        )
 
-        print("   📚 REKOMENDASI JURUSAN:")
-        print("   🎯 Jurusan Prioritas:")
-        for i, major in enumerate(major_info['priority'], 1):
-            print(f"      {i}. {major}")
-
-        print("   📖 Jurusan Terkait Lainnya:")
-        other_majors = [m for m in major_info['recommended_majors']
-                        if m not in major_info['priority']]
-        for i, major in enumerate(other_majors, 1):
-            print(f"      {i}. {major}")
-
-        if major_info['related_majors']:
-            print("   🔗 Jurusan Pendukung:")
-            for i, major in enumerate(major_info['related_majors'], 1):
-                print(f"      {i}. {major}")
+    def display_major_recommendations(self, career_key):
+        """Menampilkan rekomendasi jurusan untuk karir tertentu"""
+        ConsoleRenderer().render_majors(self.major_recommendation(career_key))
 
     def build_skill_synonyms(self):
         """Build a mapping of synonyms to standard skill names"""
-        return {
-            # Programming related
-            'coding': 'programming', 'code': 'programming', 'software_development': 'programming',
-            'developing': 'programming', 'web_development': 'programming', 'app_development': 'programming',
-            'kode': 'programming', 'koding': 'programming',
-            # Python related
-            'py': 'python', 'python_programming': 'python', 'python_code': 'python',
-            'code_python': 'python', 'kode_python': 'python', 'koding_python': 'python',
-            # Data related
-            'data_science': 'data_analysis', 'analytics': 'data_analysis', 'big_data': 'data_analysis',
-            'data_analytics': 'data_analysis', 'analisis_data': 'data_analysis', 'data_analisis': 'data_analysis',
-            # Machine Learning
-            'ml': 'machine_learning', 'ai': 'machine_learning', 'artificial_intelligence': 'machine_learning',
-            'deep_learning': 'machine_learning',
-            # Management
-            'managing': 'project_management', 'team_lead': 'project_management', 'coordination': 'project_management',
-            'manager': 'project_management', 'management': 'project_management', 'pemimpin': 'project_management',
-            # Communication
-            'speaking': 'communication', 'presentation': 'communication', 'public_speaking': 'communication',
-            'writing': 'communication', 'berbicara': 'communication', 'publik_speaking': 'communication',
-            # Problem Solving
-            'troubleshooting': 'problem_solving', 'debugging': 'problem_solving', 'critical_thinking': 'problem_solving',
-            'analytical_thinking': 'problem_solving', 'memecahkan_masalah': 'problem_solving', 'pemecahan_masalah': 'problem_solving',
-            # Technical skills
-            'cloud': 'cloud_computing', 'aws': 'cloud_computing', 'azure': 'cloud_computing',
-            'security': 'cybersecurity', 'cyber_security': 'cybersecurity', 'netsec': 'cybersecurity',
-            # Healthcare
-            'nursing': 'patient_care', 'medical': 'medical_knowledge', 'healthcare': 'medical_knowledge',
-            'clinical_skills': 'patient_care', 'pharmacy': 'medical_knowledge',
-            # Electricity
-            'electrical': 'electrical_systems', 'wiring': 'electrical_systems', 'construction': 'electrical_systems',
-            'technical_drawing': 'blueprint_reading',
-            # Creative
-            'design': 'design_software', 'graphic_design': 'design_software', 'adobe': 'design_software', 'photoshop': 'design_software',
-            # Education
-            'teaching': 'classroom_management', 'instruction': 'classroom_management', 'pedagogy': 'classroom_management',
-            'mengajar': 'classroom_management', 'guru': 'classroom_management',
-            # Business
-            'finance': 'financial_analysis', 'accounting': 'financial_analysis', 'excel_skills': 'excel', 'spreadsheets': 'excel',
-            # Green energy
-            'solar': 'solar_technology', 'renewable': 'solar_technology', 'green_energy': 'solar_technology',
-            # Legal skills
-            'law': 'legal_research', 'litigation': 'legal_writing', 'court': 'legal_procedures',
-            'attorney': 'legal_analysis', 'advocacy': 'legal_writing',
-            # Law enforcement
-            'policing': 'law_enforcement', 'patrol': 'law_enforcement', 'investigation': 'criminal_investigation',
-            'detective': 'criminal_investigation', 'enforcement': 'law_enforcement',
-            # Military
-            'soldier': 'military_operations', 'combat': 'military_training', 'defense': 'national_security', 'tactical': 'military_strategy',
-            # Culinary
-            'cooking': 'culinary_skills', 'baking': 'culinary_skills', 'food_preparation': 'culinary_skills', 'kitchen': 'culinary_management',
-            # Agriculture
-            'farming': 'agricultural_production', 'crop': 'crop_management', 'livestock': 'animal_husbandry',
-            'harvest': 'agricultural_production'
-        }
+        return self._catalog('skill_synonyms')
 
     def build_skill_level_mapping(self):
         """Map text skill levels to numerical values"""
-        return {
-            'beginner': 0.3, 'low': 0.3, 'basic': 0.3, 'novice': 0.3,
-            'intermediate': 0.6, 'medium': 0.6, 'average': 0.6, 'competent': 0.6,
-            'advanced': 0.9, 'high': 0.9, 'expert': 0.9, 'proficient': 0.9, 'excellent': 0.9,
-            'master': 1.0, 'professional': 0.8
-        }
+        return self._catalog('skill_level_mapping')
+
+    def build_standard_skills(self):
+        """Canonical skill names listed in skills_dict.txt"""
+        return self._catalog('standard_skills')
+
+    def compile_skill_normalizer(self):
+        """Index every known skill and synonym for fuzzy name lookups"""
+        canonical = set(self.standard_skills) | set(self.skill_graph)
+        for node in self.skill_graph.values():
+            canonical.update(node.get('related_skills', ()))
+            canonical.update(node.get('prerequisites', ()))
+        for details in self.job_market.values():
+            canonical.update(details['required_skills'])
+            canonical.update(details.get('emerging_skills', ()))
+        self.skill_normalizer = SkillNormalizer(sorted(canonical), self.skill_synonyms)
+
+    def compile_record_vocabulary(self):
+        """Skill and job ids used by the compact profile/recommendation records"""
+        # Semua nama yang bisa muncul di output rekomendasi harus punya id tetap
+        emerging = {skill for record in self._job_records for skill in record.emerging_skills}
+        self.skill_vocabulary = SkillVocabulary(
+            set(self.skill_normalizer.terms.values()) | set(self.skill_ids) | emerging)
+        self.job_ids = MappingProxyType(
+            {record.key: position for position, record in enumerate(self._job_records)})
+
+    def compact_profile(self, user_data, profile_id=None):
+        """user_data dict -> CompactProfile (see career_records)"""
+        return CompactProfile.from_dict(self.skill_vocabulary, user_data, profile_id)
+
+    def expand_profile(self, profile):
+        """CompactProfile -> user_data dict"""
+        return profile.to_dict(self.skill_vocabulary)
+
+    def compact_recommendations(self, recommendations):
+        return [CompactRecommendation.from_dict(self.skill_vocabulary, self.job_ids, rec)
+                for rec in recommendations]
+
+    def expand_recommendations(self, recommendations):
+        return [rec.to_dict(self.skill_vocabulary, self._job_records)
+                for rec in recommendations]
+
+    def recommend_paths_compact(self, profiles, top_n=3):
+        """recommend_paths_batch for CompactProfile (or dict) inputs, compact outputs"""
+        profiles = [self.expand_profile(profile) if isinstance(profile, CompactProfile)
+                    else profile for profile in profiles]
+        return [self.compact_recommendations(recommendations)
+                for recommendations in self.recommend_paths_batch(profiles, top_n)]
 
     def normalize_skill_name(self, skill_name):
-        """Convert synonym to standard skill name"""
-        skill_name_lower = skill_name.lower().strip().replace(' ', '_')
-        return self.skill_synonyms.get(skill_name_lower, skill_name_lower)
+        """Convert synonym (or a close misspelling) to standard skill name"""
+        return self.skill_normalizer.normalize(skill_name)
 
     def normalize_skill_level(self, level_input):
         """Convert text level to numerical value"""
@@ -235,459 +352,80 @@ class CareerPathAdvisor:
         level_str = str(level_input).lower().strip()
         return self.skill_level_mapping.get(level_str, 0.5)
 
+    def skill_extractor(self):
+        """Aho-Corasick extractor over skills, synonyms and level words (built once)"""
+        extractor = self._shared_cache.get('skill_extractor')
+        if extractor is None:
+            extractor = SkillExtractor(self.skill_normalizer.terms, self.skill_level_mapping)
+            self._shared_cache['skill_extractor'] = extractor
+        return extractor
+
+    def extract_skills(self, text):
+        """user_data['skills'] dict from free text (a string or an iterable of chunks)"""
+        return self.skill_extractor().extract(text)
+
+    def normalize_profile(self, profile):
+        """Build a user_data dict (same shape as get_user_input) from a raw profile"""
+        user_data = {
+            'skills': {}, 'experience': {}, 'interests': [],
+            'career_goals': [], 'constraints': {}, 'preferences': {}
+        }
+
+        # Skill dari teks CV bebas; skill yang diisi eksplisit di bawah menimpanya
+        if profile.get('cv_text'):
+            user_data['skills'].update(self.extract_skills(profile['cv_text']))
+
+        # Skills: {"python": "advanced"} atau ["python advanced", ...]
+        skills = profile.get('skills', {})
+        if isinstance(skills, dict):
+            skill_items = skills.items()
+        else:
+            skill_items = []
+            for entry in skills:
+                parts = str(entry).split()
+                if len(parts) >= 2:
+                    skill_items.append((' '.join(parts[:-1]), parts[-1]))
+                elif parts:
+                    skill_items.append((parts[0], None))
+        for skill_name, level_input in skill_items:
+            normalized_skill = self.normalize_skill_name(skill_name)
+            user_data['skills'][normalized_skill] = self.normalize_skill_level(level_input)
+
+        for skill_name, years in profile.get('experience', {}).items():
+            user_data['experience'][self.normalize_skill_name(skill_name)] = float(years)
+        user_data['interests'] = list(profile.get('interests', []))
+        user_data['career_goals'] = list(profile.get('career_goals', []))
+
+        constraints = profile.get('constraints', {})
+        for field, cast in (('time_availability', float),
+                            ('financial_investment', float),
+                            ('timeline_months', int)):
+            if constraints.get(field) is not None:
+                user_data['constraints'][field] = cast(constraints[field])
+
+        envs = profile.get('preferences', {}).get('work_environment', [])
+        user_data['preferences']['work_environment'] = [
+            env.strip().lower().replace(' ', '_') for env in envs if env.strip()]
+        return user_data
+
     def load_education_costs_idr(self):
         """Realistic education costs in Indonesian Rupiah for different career paths"""
-        return {
-            # Formal University Education (per semester)
-            'negeri_bachelor_semester': 5000000,      # 5 juta per semester PTN
-            'swasta_bachelor_semester': 15000000,     # 15 juta per semester PTS
-            'kedinasan_semester': 2000000,           # 2 juta per semester sekolah kedinasan
-
-            # Bootcamps & Intensive Courses
-            'programming_bootcamp': 25000000,        # 25 juta untuk bootcamp programming
-            'digital_marketing_course': 5000000,     # 5 juta kursus digital marketing
-            'design_course': 8000000,                # 8 juta kursus design
-
-            # Certification Costs
-            'professional_certification': 3000000,   # 3 juta untuk sertifikasi profesional
-            'technical_certification': 1500000,      # 1.5 juta sertifikasi teknis
-            'language_certification': 1000000,       # 1 juta sertifikasi bahasa
-
-            # Vocational Training
-            'vocational_course': 5000000,           # 5 juta kursus vokasi
-            'apprenticeship_fee': 2000000,          # 2 juta biaya magang/pemagangan
-
-            # Online Courses & Self-Study
-            'online_course_basic': 500000,          # 500rb kursus online dasar
-            'online_course_advanced': 2000000,      # 2 juta kursus online lanjutan
-            'book_materials': 500000,               # 500rb untuk buku & materi
-
-            # Specific Career Training
-            'culinary_school': 15000000,            # 15 juta sekolah masak
-            # Gratis (dibiayai pemerintah)
-            'police_academy': 0,
-            # Gratis (dibiayai pemerintah)
-            'military_academy': 0,
-            'teacher_certification': 5000000,       # 5 juta sertifikasi guru
-            'nursing_school': 8000000,              # 8 juta sekolah perawat
-        }
+        return self._catalog('education_costs_idr')
 
     def load_indonesian_universities(self):
         """Database of Indonesian universities and their strengths"""
-        return {
-            # Top Public Universities
-            'universitas_indonesia': {
-                'name': 'Universitas Indonesia (UI)',
-                'location': 'Depok & Jakarta',
-                'strengths': ['medicine', 'law', 'engineering', 'computer_science', 'business'],
-                'ranking': 'QS World: 237',
-                'website': 'ui.ac.id',
-                'cost_per_semester': 7500000,  # 7.5 juta
-                'type': 'negeri'
-            },
-            'institut_teknologi_bandung': {
-                'name': 'Institut Teknologi Bandung (ITB)',
-                'location': 'Bandung',
-                'strengths': ['engineering', 'architecture', 'computer_science', 'physics', 'mathematics'],
-                'ranking': 'QS World: 235',
-                'website': 'itb.ac.id',
-                'cost_per_semester': 8000000,  # 8 juta
-                'type': 'negeri'
-            },
-            'universitas_gadjah_mada': {
-                'name': 'Universitas Gadjah Mada (UGM)',
-                'location': 'Yogyakarta',
-                'strengths': ['medicine', 'law', 'engineering', 'agriculture', 'social_sciences'],
-                'ranking': 'QS World: 254',
-                'website': 'ugm.ac.id',
-                'cost_per_semester': 5000000,  # 5 juta
-                'type': 'negeri'
-            },
-            'institut_pertanian_bogor': {
-                'name': 'Institut Pertanian Bogor (IPB)',
-                'location': 'Bogor',
-                'strengths': ['agriculture', 'veterinary', 'food_science', 'forestry', 'marine_science'],
-                'ranking': 'QS World: 374',
-                'website': 'ipb.ac.id',
-                'cost_per_semester': 6000000,  # 6 juta
-                'type': 'negeri'
-            },
-            'universitas_airlangga': {
-                'name': 'Universitas Airlangga (UNAIR)',
-                'location': 'Surabaya',
-                'strengths': ['medicine', 'dentistry', 'pharmacy', 'public_health', 'law'],
-                'ranking': 'QS World: 465',
-                'website': 'unair.ac.id',
-                'cost_per_semester': 5500000,  # 5.5 juta
-                'type': 'negeri'
-            },
-
-            # Technology & Engineering Focus
-            'universitas_telkom': {
-                'name': 'Universitas Telkom',
-                'location': 'Bandung',
-                'strengths': ['telecommunications', 'computer_science', 'electrical_engineering', 'business_digital'],
-                'ranking': 'QS Asia: 301-350',
-                'website': 'telkomuniversity.ac.id',
-                'cost_per_semester': 15000000,  # 15 juta
-                'type': 'swasta'
-            },
-            'institut_teknologi_sepuluh_nopember': {
-                'name': 'Institut Teknologi Sepuluh Nopember (ITS)',
-                'location': 'Surabaya',
-                'strengths': ['engineering', 'maritime_technology', 'computer_science', 'robotics'],
-                'ranking': 'QS World: 800-1000',
-                'website': 'its.ac.id',
-                'cost_per_semester': 6500000,  # 6.5 juta
-                'type': 'negeri'
-            },
-
-            # Business & Management
-            'prasetya_mulya_business_school': {
-                'name': 'Universitas Prasetya Mulya',
-                'location': 'Jakarta',
-                'strengths': ['business_administration', 'marketing', 'finance', 'entrepreneurship'],
-                'ranking': 'Top Business School in Indonesia',
-                'website': 'prasetiyamulya.ac.id',
-                'cost_per_semester': 25000000,  # 25 juta
-                'type': 'swasta'
-            },
-            'universitas_bina_nusantara': {
-                'name': 'Bina Nusantara University (BINUS)',
-                'location': 'Jakarta',
-                'strengths': ['computer_science', 'business', 'design', 'communication'],
-                'ranking': 'QS World: 1001-1200',
-                'website': 'binus.ac.id',
-                'cost_per_semester': 20000000,  # 20 juta
-                'type': 'swasta'
-            },
-
-            # Creative & Design
-            'institut_seni_indonesia': {
-                'name': 'Institut Seni Indonesia (ISI)',
-                'location': 'Yogyakarta, Denpasar, Surakarta',
-                'strengths': ['fine_arts', 'design', 'performing_arts', 'music', 'dance'],
-                'ranking': 'Top Arts University',
-                'website': 'isi.ac.id',
-                'cost_per_semester': 4500000,  # 4.5 juta
-                'type': 'negeri'
-            },
-
-            # Education & Teaching
-            'universitas_pendidikan_indonesia': {
-                'name': 'Universitas Pendidikan Indonesia (UPI)',
-                'location': 'Bandung',
-                'strengths': ['education', 'teaching', 'educational_technology', 'curriculum_development'],
-                'ranking': 'Top Education University',
-                'website': 'upi.edu',
-                'cost_per_semester': 4000000,  # 4 juta
-                'type': 'negeri'
-            },
-
-            # Law & Legal Studies
-            'universitas_padjadjaran': {
-                'name': 'Universitas Padjadjaran (UNPAD)',
-                'location': 'Bandung',
-                'strengths': ['law', 'medicine', 'social_sciences', 'communication'],
-                'ranking': 'QS World: 601-650',
-                'website': 'unpad.ac.id',
-                'cost_per_semester': 7000000,  # 7 juta
-                'type': 'negeri'
-            },
-
-            # Health & Medical
-            'universitas_hasanuddin': {
-                'name': 'Universitas Hasanuddin (UNHAS)',
-                'location': 'Makassar',
-                'strengths': ['medicine', 'public_health', 'engineering', 'agriculture'],
-                'ranking': 'QS World: 800-1000',
-                'website': 'unhas.ac.id',
-                'cost_per_semester': 3500000,  # 3.5 juta
-                'type': 'negeri'
-            },
-
-            # Agriculture & Environmental
-            'universitas_brawijaya': {
-                'name': 'Universitas Brawijaya (UB)',
-                'location': 'Malang',
-                'strengths': ['agriculture', 'animal_husbandry', 'engineering', 'economics'],
-                'ranking': 'QS World: 801-1000',
-                'website': 'ub.ac.id',
-                'cost_per_semester': 4800000,  # 4.8 juta
-                'type': 'negeri'
-            },
-
-            # Kedinasan (Government Schools)
-            'akademi_kepolisian': {
-                'name': 'Akademi Kepolisian (AKPOL)',
-                'location': 'Semarang',
-                'strengths': ['law_enforcement', 'criminal_investigation', 'leadership', 'public_safety'],
-                'ranking': 'Top Police Academy',
-                'website': 'akpol.ac.id',
-                'cost_per_semester': 0,  # Gratis + dapat gaji
-                'type': 'kedinasan'
-            },
-            'akademi_militer': {
-                'name': 'Akademi Militer (AKMIL)',
-                'location': 'Magelang',
-                'strengths': ['military_operations', 'leadership', 'strategy', 'national_security'],
-                'ranking': 'Top Military Academy',
-                'website': 'akmil.ac.id',
-                'cost_per_semester': 0,  # Gratis + dapat gaji
-                'type': 'kedinasan'
-            },
-            'universitas_pertahanan': {
-                'name': 'Universitas Pertahanan',
-                'location': 'Bogor',
-                'strengths': ['national_security', 'defense_studies', 'military_strategy', 'intelligence'],
-                'ranking': 'Specialized Defense University',
-                'website': 'idu.ac.id',
-                'cost_per_semester': 0,  # Gratis
-                'type': 'kedinasan'
-            }
-        }
+        return self._catalog('indonesian_universities')
 
     def build_skill_graph(self):
         """Create a graph of skills and their relationships"""
-        base_graph = {
-            'programming': {'related_skills': ['python', 'javascript', 'java', 'problem_solving', 'algorithms'], 'prerequisites': ['logic', 'mathematics'], 'weight': 0.9},
-            'data_analysis': {'related_skills': ['statistics', 'python', 'sql', 'excel', 'visualization'], 'prerequisites': ['mathematics', 'critical_thinking'], 'weight': 0.85},
-            'project_management': {'related_skills': ['leadership', 'communication', 'planning', 'agile'], 'prerequisites': ['organization', 'communication'], 'weight': 0.8},
-            'digital_marketing': {'related_skills': ['seo', 'content_creation', 'analytics', 'social_media'], 'prerequisites': ['creativity', 'communication'], 'weight': 0.75},
-            'python': {'related_skills': ['programming', 'data_analysis', 'machine_learning'], 'prerequisites': ['logic'], 'weight': 0.85},
-            'machine_learning': {'related_skills': ['python', 'statistics', 'linear_algebra'], 'prerequisites': ['python', 'statistics'], 'weight': 0.9},
-            'patient_care': {'related_skills': ['empathy', 'communication', 'medical_knowledge'], 'prerequisites': ['biology', 'communication'], 'weight': 0.8},
-            'electrical_systems': {'related_skills': ['safety_protocols', 'troubleshooting', 'blueprint_reading'], 'prerequisites': ['mathematics', 'physics'], 'weight': 0.75},
-            'design_software': {'related_skills': ['creativity', 'visual_communication', 'typography'], 'prerequisites': ['artistic_skills', 'computer_literacy'], 'weight': 0.7},
-            'classroom_management': {'related_skills': ['communication', 'patience', 'organization'], 'prerequisites': ['communication', 'subject_knowledge'], 'weight': 0.8},
-            'financial_analysis': {'related_skills': ['excel', 'data_interpretation', 'reporting'], 'prerequisites': ['mathematics', 'analytical_thinking'], 'weight': 0.85},
-            'solar_technology': {'related_skills': ['electrical_systems', 'safety_protocols', 'installation'], 'prerequisites': ['electrical_systems', 'physics'], 'weight': 0.8},
-            # Legal skills - ADDED
-            'legal_research': {'related_skills': ['legal_writing', 'case_analysis', 'legal_analysis'], 'prerequisites': ['critical_thinking', 'research_skills'], 'weight': 0.85},
-            'legal_writing': {'related_skills': ['legal_research', 'communication', 'litigation'], 'prerequisites': ['writing_skills', 'legal_research'], 'weight': 0.8},
-            'legal_analysis': {'related_skills': ['critical_thinking', 'case_analysis', 'legal_research'], 'prerequisites': ['analytical_thinking', 'legal_research'], 'weight': 0.85},
-            'litigation': {'related_skills': ['trial_advocacy', 'evidence_law', 'legal_writing'], 'prerequisites': ['legal_research', 'public_speaking'], 'weight': 0.9},
-            'contract_law': {'related_skills': ['negotiation', 'business_law', 'legal_writing'], 'prerequisites': ['legal_research'], 'weight': 0.8},
-            'legal_procedures': {'related_skills': ['court_procedures', 'document_filing', 'legal_research'], 'prerequisites': ['attention_to_detail', 'organization'], 'weight': 0.75},
-            # Law enforcement skills - ADDED
-            'law_enforcement': {'related_skills': ['criminal_investigation', 'public_safety', 'criminal_law'], 'prerequisites': ['physical_fitness', 'communication'], 'weight': 0.8},
-            'criminal_investigation': {'related_skills': ['forensics', 'evidence_collection', 'interview_techniques'], 'prerequisites': ['analytical_thinking', 'attention_to_detail'], 'weight': 0.85},
-            # Military skills - ADDED
-            'military_operations': {'related_skills': ['military_strategy', 'physical_fitness', 'teamwork'], 'prerequisites': ['discipline', 'physical_fitness'], 'weight': 0.85},
-            'military_training': {'related_skills': ['physical_fitness', 'weapons_training', 'first_aid'], 'prerequisites': ['discipline', 'physical_fitness'], 'weight': 0.8},
-            'military_strategy': {'related_skills': ['tactical_planning', 'risk_assessment', 'leadership'], 'prerequisites': ['critical_thinking', 'decision_making'], 'weight': 0.9},
-            'national_security': {'related_skills': ['intelligence_analysis', 'risk_assessment', 'security_protocols'], 'prerequisites': ['analytical_thinking', 'attention_to_detail'], 'weight': 0.85},
-            # Culinary skills - EXPANDED
-            'culinary_skills': {'related_skills': ['food_safety', 'knife_skills', 'menu_planning'], 'prerequisites': ['creativity', 'attention_to_detail'], 'weight': 0.7},
-            'menu_planning': {'related_skills': ['nutrition', 'cost_control', 'culinary_skills'], 'prerequisites': ['culinary_skills'], 'weight': 0.75},
-            'food_safety': {'related_skills': ['sanitation_procedures', 'temperature_control', 'hygiene_practices'], 'prerequisites': ['attention_to_detail'], 'weight': 0.9},
-            'culinary_management': {'related_skills': ['team_management', 'inventory_control', 'cost_management'], 'prerequisites': ['culinary_skills', 'leadership'], 'weight': 0.8},
-            # Agriculture skills - ADDED
-            'agricultural_production': {'related_skills': ['crop_management', 'soil_science', 'harvest_techniques'], 'prerequisites': ['biology', 'problem_solving'], 'weight': 0.75},
-            'crop_management': {'related_skills': ['pest_control', 'irrigation_systems', 'soil_fertility'], 'prerequisites': ['biology', 'analytical_thinking'], 'weight': 0.7},
-            'animal_husbandry': {'related_skills': ['livestock_management', 'veterinary_care', 'breeding_techniques'], 'prerequisites': ['biology', 'empathy'], 'weight': 0.75},
-            # Additional foundational skills
-            'physical_fitness': {'related_skills': ['endurance', 'strength_training', 'discipline'], 'prerequisites': [], 'weight': 0.6},
-            'discipline': {'related_skills': ['self_control', 'focus', 'reliability'], 'prerequisites': [], 'weight': 0.7},
-            'research_skills': {'related_skills': ['information_gathering', 'analysis', 'documentation'], 'prerequisites': ['critical_thinking'], 'weight': 0.7},
-            'forensics': {'related_skills': ['evidence_analysis', 'crime_scene_management', 'scientific_methods'], 'prerequisites': ['attention_to_detail', 'analytical_thinking'], 'weight': 0.85}
-        }
-        return base_graph
+        return self._catalog('skill_graph')
 
     def initialize_comprehensive_market_data(self):
         """Comprehensive career database across multiple industries"""
-        base_market = {
-            'software_developer': {
-                'demand_score': 0.9, 'growth_rate': 0.22, 'avg_salary': 85000,
-                'required_skills': ['programming', 'algorithms', 'problem_solving'],
-                'emerging_skills': ['cloud_computing', 'ai_ml'],
-                'industries': ['tech', 'finance'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['office', 'remote'],
-                'indonesian_universities': ['institut_teknologi_bandung', 'universitas_indonesia', 'universitas_telkom', 'institut_teknologi_sepuluh_nopember', 'universitas_gadjah_mada']
-            },
-            'data_scientist': {
-                'demand_score': 0.95, 'growth_rate': 0.31, 'avg_salary': 95000,
-                'required_skills': ['python', 'statistics', 'machine_learning'],
-                'emerging_skills': ['deep_learning', 'big_data'],
-                'industries': ['tech', 'research'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['office', 'remote'],
-                'indonesian_universities': ['institut_teknologi_bandung', 'universitas_indonesia', 'universitas_gadjah_mada', 'universitas_bina_nusantara', 'universitas_telkom']
-            },
-            'product_manager': {
-                'demand_score': 0.85, 'growth_rate': 0.18, 'avg_salary': 105000,
-                'required_skills': ['project_management', 'communication', 'strategy'],
-                'emerging_skills': ['product_analytics', 'user_research'],
-                'industries': ['tech'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['office', 'remote'],
-                'indonesian_universities': ['universitas_indonesia', 'universitas_gadjah_mada', 'prasetya_mulya_business_school', 'universitas_bina_nusantara', 'institut_teknologi_bandung']
-            },
-            'digital_marketer': {
-                'demand_score': 0.8, 'growth_rate': 0.15, 'avg_salary': 65000,
-                'required_skills': ['digital_marketing', 'analytics', 'content_creation'],
-                'emerging_skills': ['ai_marketing', 'video_content'],
-                'industries': ['marketing'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['office', 'remote'],
-                'indonesian_universities': ['universitas_indonesia', 'prasetya_mulya_business_school', 'universitas_padjadjaran', 'universitas_bina_nusantara', 'universitas_gadjah_mada']
-            },
-            'registered_nurse': {
-                'demand_score': 0.92, 'growth_rate': 0.09, 'avg_salary': 75000,
-                'required_skills': ['patient_care', 'medical_knowledge', 'communication', 'empathy'],
-                'emerging_skills': ['telehealth', 'data_analysis'],
-                'industries': ['healthcare'], 'education_required': 'associate_degree',
-                'certification_required': True, 'work_environment': ['hospital', 'clinic'],
-                'indonesian_universities': ['universitas_indonesia', 'universitas_airlangga', 'universitas_gadjah_mada', 'universitas_hasanuddin', 'universitas_padjadjaran']
-            },
-            'electrician': {
-                'demand_score': 0.85, 'growth_rate': 0.10, 'avg_salary': 56000,
-                'required_skills': ['electrical_systems', 'safety_protocols', 'blueprint_reading', 'troubleshooting'],
-                'emerging_skills': ['smart_home_technology', 'renewable_energy_systems'],
-                'industries': ['construction', 'energy'], 'education_required': 'apprenticeship',
-                'certification_required': True, 'work_environment': ['construction_sites', 'residential'],
-                'indonesian_universities': ['institut_teknologi_bandung', 'institut_teknologi_sepuluh_nopember', 'universitas_gadjah_mada', 'universitas_indonesia', 'universitas_brawijaya']
-            },
-            'graphic_designer': {
-                'demand_score': 0.75, 'growth_rate': 0.05, 'avg_salary': 52000,
-                'required_skills': ['design_software', 'creativity', 'visual_communication'],
-                'emerging_skills': ['ui_ux_design', 'motion_graphics'],
-                'industries': ['advertising', 'media'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['agency', 'freelance'],
-                'indonesian_universities': ['institut_seni_indonesia', 'institut_teknologi_bandung', 'universitas_bina_nusantara', 'universitas_indonesia', 'universitas_pendidikan_indonesia']
-            },
-            'secondary_teacher': {
-                'demand_score': 0.78, 'growth_rate': 0.07, 'avg_salary': 62000,
-                'required_skills': ['subject_knowledge', 'classroom_management', 'lesson_planning'],
-                'emerging_skills': ['digital_learning_tools', 'inclusive_education'],
-                'industries': ['education'], 'education_required': 'bachelor_degree',
-                'certification_required': True, 'work_environment': ['school'],
-                'indonesian_universities': ['universitas_pendidikan_indonesia', 'universitas_negeri_jakarta', 'universitas_negeri_yogyakarta', 'universitas_negeri_surabaya', 'universitas_pendidikan_ganesha']
-            },
-            'financial_analyst': {
-                'demand_score': 0.80, 'growth_rate': 0.11, 'avg_salary': 85000,
-                'required_skills': ['financial_analysis', 'excel', 'data_interpretation'],
-                'emerging_skills': ['fintech', 'predictive_analytics'],
-                'industries': ['finance'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['office', 'corporate'],
-                'indonesian_universities': ['universitas_indonesia', 'universitas_gadjah_mada', 'prasetya_mulya_business_school', 'universitas_airlangga', 'universitas_padjadjaran']
-            },
-            'sustainability_specialist': {
-                'demand_score': 0.85, 'growth_rate': 0.28, 'avg_salary': 72000,
-                'required_skills': ['environmental_regulations', 'sustainability_principles', 'data_analysis', 'project_management'],
-                'emerging_skills': ['carbon_accounting', 'circular_economy', 'esg_reporting'],
-                'industries': ['corporate', 'government', 'consulting'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['office', 'field_work'],
-                'indonesian_universities': ['institut_pertanian_bogor', 'universitas_gadjah_mada', 'universitas_indonesia', 'institut_teknologi_bandung', 'universitas_brawijaya']
-            },
-            'legal_consultant': {
-                'demand_score': 0.75, 'growth_rate': 0.08, 'avg_salary': 95000,
-                'required_skills': ['legal_research', 'contract_law', 'communication'],
-                'emerging_skills': ['legal_tech', 'privacy_law'],
-                'industries': ['legal', 'corporate'], 'education_required': 'law_degree',
-                'certification_required': True, 'work_environment': ['office', 'court'],
-                'indonesian_universities': ['universitas_indonesia', 'universitas_gadjah_mada', 'universitas_padjadjaran', 'universitas_airlangga', 'universitas_hasanuddin']
-            },
-            'chef': {
-                'demand_score': 0.70, 'growth_rate': 0.10, 'avg_salary': 50000,
-                'required_skills': ['culinary_skills', 'menu_planning', 'food_safety'],
-                'emerging_skills': ['sustainable_cooking', 'dietary_specialization'],
-                'industries': ['hospitality', 'tourism'], 'education_required': 'culinary_school',
-                'certification_required': False, 'work_environment': ['kitchen', 'restaurant'],
-                'indonesian_universities': ['akademi_kuliner_indonesia', 'sekolah_tinggi_parawisata', 'universitas_pelita_harapan', 'universitas_bina_nusantara']
-            },
-            # NEW CAREERS ADDED:
-            'police_officer': {
-                'demand_score': 0.80, 'growth_rate': 0.07, 'avg_salary': 65000,
-                'required_skills': ['law_enforcement', 'communication', 'physical_fitness', 'problem_solving'],
-                'emerging_skills': ['community_policing', 'digital_forensics'],
-                'industries': ['law_enforcement', 'public_safety'], 'education_required': 'kedinasan',
-                'certification_required': True, 'work_environment': ['field_work', 'patrol'],
-                'indonesian_universities': ['akademi_kepolisian', 'universitas_indonesia', 'universitas_gadjah_mada', 'universitas_padjadjaran']
-            },
-            'detective': {
-                'demand_score': 0.75, 'growth_rate': 0.05, 'avg_salary': 83000,
-                'required_skills': ['criminal_investigation', 'analytical_thinking', 'communication', 'attention_to_detail'],
-                'emerging_skills': ['digital_investigation', 'behavioral_analysis'],
-                'industries': ['law_enforcement'], 'education_required': 'kedinasan',
-                'certification_required': True, 'work_environment': ['field_work', 'office'],
-                'indonesian_universities': ['akademi_kepolisian', 'universitas_indonesia', 'universitas_gadjah_mada', 'universitas_padjadjaran', 'universitas_airlangga']
-            },
-            'military_officer': {
-                'demand_score': 0.85, 'growth_rate': 0.08, 'avg_salary': 70000,
-                'required_skills': ['military_operations', 'leadership', 'physical_fitness', 'discipline'],
-                'emerging_skills': ['cyber_warfare', 'drone_operations'],
-                'industries': ['military', 'defense'], 'education_required': 'kedinasan',
-                'certification_required': True, 'work_environment': ['military_base', 'field_operations'],
-                'indonesian_universities': ['akademi_militer', 'universitas_pertahanan', 'institut_teknologi_bandung', 'universitas_gadjah_mada']
-            },
-            'intelligence_analyst': {
-                'demand_score': 0.82, 'growth_rate': 0.12, 'avg_salary': 78000,
-                'required_skills': ['national_security', 'analytical_thinking', 'research_skills', 'attention_to_detail'],
-                'emerging_skills': ['data_mining', 'threat_assessment'],
-                'industries': ['military', 'government'], 'education_required': 'kedinasan',
-                'certification_required': True, 'work_environment': ['office', 'secure_facility'],
-                'indonesian_universities': ['universitas_pertahanan', 'universitas_indonesia', 'institut_teknologi_bandung', 'universitas_gadjah_mada', 'universitas_airlangga']
-            },
-            'attorney': {
-                'demand_score': 0.78, 'growth_rate': 0.06, 'avg_salary': 120000,
-                'required_skills': ['legal_research', 'legal_writing', 'litigation', 'communication'],
-                'emerging_skills': ['legal_technology', 'esg_law'],
-                'industries': ['legal', 'corporate'], 'education_required': 'law_degree',
-                'certification_required': True, 'work_environment': ['office', 'court'],
-                'indonesian_universities': ['universitas_indonesia', 'universitas_gadjah_mada', 'universitas_padjadjaran', 'universitas_airlangga', 'universitas_hasanuddin']
-            },
-            'paralegal': {
-                'demand_score': 0.80, 'growth_rate': 0.10, 'avg_salary': 55000,
-                'required_skills': ['legal_research', 'legal_writing', 'organization', 'attention_to_detail'],
-                'emerging_skills': ['e_discovery', 'legal_software'],
-                'industries': ['legal'], 'education_required': 'associate_degree',
-                'certification_required': False, 'work_environment': ['office'],
-                'indonesian_universities': ['universitas_indonesia', 'universitas_gadjah_mada', 'universitas_padjadjaran', 'universitas_airlangga']
-            },
-            'farm_manager': {
-                'demand_score': 0.75, 'growth_rate': 0.04, 'avg_salary': 68000,
-                'required_skills': ['agricultural_production', 'crop_management', 'problem_solving', 'business_management'],
-                'emerging_skills': ['precision_agriculture', 'sustainable_farming'],
-                'industries': ['agriculture'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['farm', 'field_work'],
-                'indonesian_universities': ['institut_pertanian_bogor', 'universitas_brawijaya', 'universitas_gadjah_mada', 'universitas_hasanuddin', 'universitas_lampung']
-            },
-            'agricultural_specialist': {
-                'demand_score': 0.72, 'growth_rate': 0.08, 'avg_salary': 52000,
-                'required_skills': ['crop_management', 'soil_science', 'problem_solving'],
-                'emerging_skills': ['organic_farming', 'agritech'],
-                'industries': ['agriculture', 'research'], 'education_required': 'bachelor_degree',
-                'certification_required': False, 'work_environment': ['field_work', 'lab'],
-                'indonesian_universities': ['institut_pertanian_bogor', 'universitas_brawijaya', 'universitas_gadjah_mada', 'universitas_hasanuddin', 'universitas_sriwijaya']
-            },
-            'livestock_manager': {
-                'demand_score': 0.70, 'growth_rate': 0.03, 'avg_salary': 48000,
-                'required_skills': ['animal_husbandry', 'veterinary_care', 'problem_solving'],
-                'emerging_skills': ['animal_welfare', 'sustainable_practices'],
-                'industries': ['agriculture'], 'education_required': 'associate_degree',
-                'certification_required': False, 'work_environment': ['farm', 'field_work'],
-                'indonesian_universities': ['institut_pertanian_bogor', 'universitas_brawijaya', 'universitas_gadjah_mada', 'universitas_hasanuddin', 'universitas_mataram']
-            },
-            'restaurant_manager': {
-                'demand_score': 0.75, 'growth_rate': 0.09, 'avg_salary': 58000,
-                'required_skills': ['culinary_management', 'communication', 'leadership', 'customer_service'],
-                'emerging_skills': ['digital_ordering', 'sustainability'],
-                'industries': ['hospitality'], 'education_required': 'associate_degree',
-                'certification_required': False, 'work_environment': ['restaurant'],
-                'indonesian_universities': ['universitas_pelita_harapan', 'universitas_bina_nusantara', 'sekolah_tinggi_parawisata', 'universitas_pancasila']
-            }
-        }
-        return base_market
+        return self._catalog('job_market')
 
     def load_industry_trends(self):
-        return {
-            'tech': {'trend': 'up', 'hot_topics': ['AI', 'Blockchain']},
-            'healthcare': {'trend': 'stable', 'hot_topics': ['Telehealth']},
-            'green_energy': {'trend': 'up', 'hot_topics': ['Solar', 'Wind']},
-            'law_enforcement': {'trend': 'stable', 'hot_topics': ['Community Policing', 'Technology Integration']},
-            'military': {'trend': 'stable', 'hot_topics': ['Cybersecurity', 'Drone Technology']},
-            'legal': {'trend': 'stable', 'hot_topics': ['Legal Tech', 'Remote Law']},
-            'agriculture': {'trend': 'up', 'hot_topics': ['Precision Farming', 'Sustainable Practices']},
-            'hospitality': {'trend': 'stable', 'hot_topics': ['Sustainability', 'Digital Ordering']}
-        }
+        return self._catalog('industry_trends')
 
     def get_user_input(self):
         """Interactive user input system - UPDATED FOR INDONESIA"""
@@ -784,70 +522,261 @@ class CareerPathAdvisor:
 
         return user_data
 
+    def profile_summary(self, user_data):
+        """Structured summary of the user's input"""
+        return ProfileSummary(
+            skills=dict(user_data['skills']),
+            budget_idr=user_data['constraints']['financial_investment'],
+            timeline_months=user_data['constraints']['timeline_months']
+        )
+
     def display_user_profile_summary(self, user_data):
         """Show a summary of the user's input - UPDATED FOR INDONESIA"""
-        print("\n" + "="*50)
-        print("📋 YOUR PROFILE SUMMARY")
-        print("="*50)
-        print(f"\n📊 Skills ({len(user_data['skills'])}):")
-        for skill, level in user_data['skills'].items():
-            print(f"   • {skill.replace('_', ' ').title()}: {level:.1f}")
-
-        budget_idr = user_data['constraints']['financial_investment']
-        budget_formatted = f"Rp {budget_idr:,.0f}".replace(',', '.')
-        print(f"\n⏰ Constraints: Budget {budget_formatted}, "
-              f"Timeline {user_data['constraints']['timeline_months']} bulan")
-
-    def _calculate_score(self, user_data, job_key, job_details):
-        """Calculates compatibility score (0-100) based on skills, preferences, constraints - INDONESIA CONTEXT"""
+        ConsoleRenderer().render_profile_summary(self.profile_summary(user_data))
+
+    def compile_job_index(self):
+        """Precompute per-job scoring facts from job_market into read-only records"""
+        skill_vocab = sorted({skill for details in self.job_market.values()
+                              for skill in details['required_skills']})
+        self.skill_ids = MappingProxyType(
+            {skill: i for i, skill in enumerate(skill_vocab)})
+        self.job_index = MappingProxyType({
+            job_key: self._compile_job_record(job_key, details, position)
+            for position, (job_key, details) in enumerate(self.job_market.items())
+        })
+        self._job_records = tuple(self.job_index.values())
+
+        # Inverted index: skill -> posisi job yang membutuhkan skill tersebut
+        skill_to_jobs = defaultdict(list)
+        for position, record in enumerate(self._job_records):
+            for skill in record.skills:
+                skill_to_jobs[skill].append(position)
+        self.skill_to_jobs = MappingProxyType(
+            {skill: tuple(positions) for skill, positions in skill_to_jobs.items()})
+        # Job tanpa required_skills selalu bisa mencapai skor tinggi
+        self._unconditional_jobs = tuple(
+            position for position, record in enumerate(self._job_records)
+            if not record.required_count)
+
+        # Penalti level dijumlahkan 0.1 per skill (sama seperti loop lama)
+        max_required = max((record.required_count
+                            for record in self.job_index.values()), default=0)
+        penalty_steps = [0]
+        for _ in range(max_required):
+            penalty_steps.append(penalty_steps[-1] + 0.1)
+        self._penalty_steps = tuple(penalty_steps)
+
+    def compile_job_priors(self):
+        """Per-job market components (demand, growth, salary, trend), each in 0..1
+
+        Growth and salary are scaled against the catalog's range; trend is the mean
+        industry_trends score over the job's industries.
+        """
+        records = self._job_records
+        growth = [record.details.get('growth_rate', 0.0) for record in records]
+        low, high = min(growth, default=0.0), max(growth, default=0.0)
+        top_salary = max((record.details.get('avg_salary', 0) for record in records),
+                         default=0)
+        components = []
+        for record, growth_rate in zip(records, growth):
+            details = record.details
+            trends = [TREND_SCORES.get(self.industry_trends.get(industry, {}).get('trend'),
+                                       DEFAULT_TREND_SCORE)
+                      for industry in details.get('industries', ())]
+            components.append((
+                min(1.0, max(0.0, details.get('demand_score', 0.0))),
+                (growth_rate - low) / (high - low) if high > low else 0.0,
+                details.get('avg_salary', 0) / top_salary if top_salary else 0.0,
+                sum(trends) / len(trends) if trends else DEFAULT_TREND_SCORE,
+            ))
+        self.job_prior_components = tuple(components)
+
+    def job_priors(self, ranking=None):
+        """Market prior (0..1) per job position under a ranking model (cached)"""
+        ranking = ranking or self.ranking
+        weights = (ranking.demand, ranking.growth, ranking.salary, ranking.trend)
+        key = ('job_priors', weights)
+        priors = self._shared_cache.get(key)
+        if priors is None:
+            total = sum(weights)
+            priors = self._shared_cache[key] = tuple(
+                sum(w * c for w, c in zip(weights, components)) / total if total else 0.0
+                for components in self.job_prior_components)
+        return priors
+
+    def job_prior(self, career, ranking=None):
+        return self.job_priors(ranking)[self.job_ids[career]]
+
+    def ranking_bonus(self, ranking=None):
+        """Points added to each job's match score for ranking, or None (match only)"""
+        ranking = ranking or self.ranking
+        if not ranking.prior_weight:
+            return None
+        key = ('ranking_bonus', tuple(ranking))
+        bonus = self._shared_cache.get(key)
+        if bonus is None:
+            scale = ranking.prior_weight * PRIOR_SCALE
+            bonus = self._shared_cache[key] = tuple(
+                scale * prior for prior in self.job_priors(ranking))
+        return bonus
+
+    def _skill_graph_edges(self):
+        """Undirected skill_graph edges with their per-hop credit"""
+        edges = defaultdict(dict)
+        for skill, node in self.skill_graph.items():
+            weight = node.get('weight', 1.0)
+            for kind, credit in (('related_skills', RELATED_SKILL_CREDIT),
+                                 ('prerequisites', PREREQUISITE_CREDIT)):
+                for other in node.get(kind, ()):
+                    if other == skill:
+                        continue
+                    factor = credit * weight
+                    for a, b in ((skill, other), (other, skill)):
+                        if factor > edges[a].get(b, 0.0):
+                            edges[a][b] = factor
+        return edges
+
+    def compile_skill_similarity(self):
+        """Precompute the dense skill_graph similarity matrix used for partial credit
+
+        Rows are every skill in skill_graph (graph_skill_ids), columns are the
+        required-skill vocabulary (skill_ids). Entry [u][r] is the best product of
+        edge credits over paths of at most SKILL_GRAPH_MAX_HOPS from u to r.
+        """
+        edges = self._skill_graph_edges()
+        vocab = sorted(set(edges) | set(self.skill_ids))
+        self.graph_skill_ids = MappingProxyType(
+            {skill: i for i, skill in enumerate(vocab)})
+
+        rows = []
+        for source in vocab:
+            best = {source: 1.0}
+            queue = deque([(source, 0, 1.0)])
+            while queue:
+                skill, hops, similarity = queue.popleft()
+                if hops == SKILL_GRAPH_MAX_HOPS or similarity < best.get(skill, 0.0):
+                    continue
+                for other, factor in edges.get(skill, {}).items():
+                    candidate = similarity * factor
+                    if candidate > best.get(other, 0.0):
+                        best[other] = candidate
+                        queue.append((other, hops + 1, candidate))
+            row = [0.0] * len(self.skill_ids)
+            for skill, skill_id in self.skill_ids.items():
+                if skill != source and skill in best:
+                    row[skill_id] = (math.floor(best[skill] * SIMILARITY_RESOLUTION)
+                                     / SIMILARITY_RESOLUTION)
+            rows.append(tuple(row))
+        self.skill_similarity = tuple(rows)
+        # Versi sparse per skill graph untuk path scalar: ((required_skill, kredit), ...)
+        skill_names = tuple(self.skill_ids)
+        self.skill_credit = MappingProxyType({
+            source: tuple((skill_names[skill_id], credit)
+                          for skill_id, credit in enumerate(row) if credit)
+            for source, row in zip(vocab, rows)})
+
+    def _compile_job_record(self, job_key, job_details, position=None):
+        """Build the JobRecord for a single job_market entry"""
+        skills = frozenset(job_details['required_skills'])
+        skill_mask = 0
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                skill_mask |= 1 << skill_id
+        timeline_limit, timeline_penalty = TIMELINE_RULES.get(
+            job_details.get('education_required'), (None, TIMELINE_BONUS))
+
+        return JobRecord(
+            key=job_key,
+            details=job_details,
+            skills=skills,
+            skill_mask=skill_mask,
+            required_count=len(skills),
+            emerging_skills=tuple(job_details.get('emerging_skills', [])),
+            environments=frozenset(job_details.get('work_environment', [])),
+            estimated_cost_idr=self.estimate_career_cost(job_details),
+            timeline_limit=timeline_limit,
+            timeline_penalty=timeline_penalty,
+            position=position
+        )
+
+    def _job_record(self, job_key, job_details):
+        """Return the compiled record, recompiling if job_details is not indexed"""
+        record = self.job_index.get(job_key)
+        if record is None or record.details is not job_details:
+            record = self._compile_job_record(job_key, job_details)
+        return record
+
+    def _user_context(self, user_data):
+        """Derive the per-user facts needed by _score_record once per request"""
+        skills = user_data['skills']
+        skill_mask = 0
+        low_mask = 0
+        for skill, level in skills.items():
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                skill_mask |= 1 << skill_id
+                if level < 0.5:
+                    low_mask |= 1 << skill_id
+        constraints = user_data['constraints']
+        partial_credit = self._partial_credit(skills)
+        return UserContext(
+            skills=frozenset(skills),
+            skill_mask=skill_mask,
+            low_mask=low_mask,
+            partial_credit=partial_credit,
+            job_credit=self._job_credit(partial_credit),
+            budget_idr=constraints.get('financial_investment', float('inf')),
+            timeline_months=constraints.get('timeline_months', 24),
+            environments=frozenset(
+                user_data['preferences'].get('work_environment', []))
+        )
+
+    def _partial_credit(self, skills):
+        """Best graph credit per required skill the user does not have (non-zero only)"""
+        credit = {}
+        best = credit.get
+        row_of = self.skill_credit.get
+        for skill in skills:
+            for required, similarity in row_of(skill, ()):
+                if similarity > best(required, 0.0) and required not in skills:
+                    credit[required] = similarity
+        return MappingProxyType(credit)
+
+    def _job_credit(self, partial_credit):
+        """Summed partial credit per job position (one list lookup in _score_record)"""
+        totals = [0.0] * len(self._job_records)
+        jobs_of = self.skill_to_jobs.get
+        for skill, credit in partial_credit.items():
+            for position in jobs_of(skill, ()):
+                totals[position] += credit
+        return totals
+
+    def _score_record(self, record, user_context):
+        """Score one compiled job against a prepared user context"""
         score = 0.0
 
         # --- 1. Skill Match (Weight: 60%) ---
-        required_skills = set(job_details['required_skills'])
-        user_skills = set(user_data['skills'].keys())
-        matching_skills = required_skills.intersection(user_skills)
-
-        if not required_skills:
+        if not record.required_count:
             skill_score = 1.0
         else:
-            skill_score = len(matching_skills) / len(required_skills)
+            matched = (record.skill_mask & user_context.skill_mask).bit_count()
+            # Skill yang belum dimiliki tapi terkait di skill_graph dapat kredit parsial
+            if record.position is not None:
+                matched += user_context.job_credit[record.position]
+            elif user_context.partial_credit:
+                partial_credit = user_context.partial_credit
+                matched += sum(partial_credit.get(skill, 0.0) for skill in record.skills)
+            skill_score = matched / record.required_count
             # Check Skill Levels penalty
-            level_penalty = 0
-            for skill in matching_skills:
-                user_level = user_data['skills'][skill]
-                if user_level < 0.5:
-                    level_penalty += 0.1
+            level_penalty = self._penalty_steps[
+                (record.skill_mask & user_context.low_mask).bit_count()]
             skill_score = max(0, skill_score - (level_penalty * 0.2))
         score += skill_score * 60
 
-        # --- 2. Constraint Match (Weight: 20%) - UPDATED FOR INDONESIA ---
-        user_budget_idr = user_data['constraints'].get(
-            'financial_investment', float('inf'))
-
-        # Estimate realistic costs in Indonesian Rupiah
-        if job_details.get('education_required') == 'kedinasan':
-            # Government schools - free or very low cost
-            estimated_cost_idr = 0
-        elif job_details.get('education_required') == 'doctorate':
-            estimated_cost_idr = 150000000  # 150 juta untuk S3
-        elif job_details.get('education_required') == 'law_degree':
-            estimated_cost_idr = 80000000   # 80 juta untuk pendidikan hukum
-        elif job_details.get('education_required') == 'bachelor_degree':
-            estimated_cost_idr = 50000000   # 50 juta untuk S1
-        elif job_details.get('education_required') == 'associate_degree':
-            estimated_cost_idr = 25000000   # 25 juta untuk D3
-        elif job_details.get('education_required') == 'culinary_school':
-            estimated_cost_idr = 30000000   # 30 juta untuk sekolah kuliner
-        elif job_details.get('education_required') == 'apprenticeship':
-            estimated_cost_idr = 5000000    # 5 juta untuk pemagangan
-        else:
-            estimated_cost_idr = 10000000   # 10 juta default
-
-        # Add certification costs if required
-        if job_details.get('certification_required'):
-            estimated_cost_idr += 5000000  # +5 juta untuk sertifikasi
-
-        # Budget scoring logic
+        # --- 2. Constraint Match (Weight: 20%) ---
+        user_budget_idr = user_context.budget_idr
+        estimated_cost_idr = record.estimated_cost_idr
         if estimated_cost_idr == 0:
             # Free education path - perfect for any budget
             score += 10
@@ -860,553 +789,986 @@ class CareerPathAdvisor:
         elif user_budget_idr >= estimated_cost_idr * 0.25:
             # Can afford at least quarter - minimal points
             score += 2
-        else:
-            # Cannot afford - no points
-            score += 0
 
         # --- 3. Timeline Match (Weight: 10%) ---
-        user_timeline = user_data['constraints'].get('timeline_months', 24)
-
-        if job_details.get('education_required') == 'doctorate' and user_timeline < 60:
-            score -= 5
-        elif job_details.get('education_required') == 'law_degree' and user_timeline < 48:
-            score -= 3
-        elif job_details.get('education_required') == 'bachelor_degree' and user_timeline < 36:
-            score -= 2
-        elif job_details.get('education_required') == 'associate_degree' and user_timeline < 24:
-            score -= 1
+        if (record.timeline_limit is not None
+                and user_context.timeline_months < record.timeline_limit):
+            score += record.timeline_penalty
         else:
-            score += 5
+            score += TIMELINE_BONUS
 
         # --- 4. Preference Match (Weight: 10%) ---
-        user_envs = set(user_data['preferences'].get('work_environment', []))
-        job_envs = set(job_details.get('work_environment', []))
-        if user_envs.intersection(job_envs) or not user_envs:
+        user_envs = user_context.environments
+        if not user_envs or not user_envs.isdisjoint(record.environments):
             score += 10
 
         return round(max(0, min(score, 100)), 1)
 
+    def _calculate_score(self, user_data, job_key, job_details):
+        """Calculates compatibility score (0-100) based on skills, preferences, constraints - INDONESIA CONTEXT"""
+        return self._score_record(self._job_record(job_key, job_details),
+                                  self._reused_user_context(user_data))
+
+    def _reused_user_context(self, user_data):
+        """_user_context, reused while consecutive calls pass an equal profile
+
+        _calculate_score is typically called for one user against every job; the
+        context (partial credit per job included) is then built once, not per job.
+        """
+        skills = user_data['skills']
+        constraints = user_data['constraints']
+        environments = user_data['preferences'].get('work_environment', [])
+        last = self._last_user_context
+        if (last is not None and last[0] == skills and last[1] == constraints
+                and last[2] == environments):
+            return last[3]
+        user_context = self._user_context(user_data)
+        # Salinan, supaya profil yang diubah di tempat tidak memakai context lama
+        self._last_user_context = (dict(skills), dict(constraints), list(environments),
+                                   user_context)
+        return user_context
+
+    def _build_recommendation(self, record, user_skills, match_score):
+        """Assemble a recommendation entry for one scored job (user_skills: names)"""
+        return {
+            'career': record.key,
+            'score': match_score,
+            'salary': record.details['avg_salary'],
+            # Urutan katalog (bukan urutan set) agar hasil sama di setiap proses
+            'missing_skills': [s for s in dict.fromkeys(record.details['required_skills'])
+                               if s not in user_skills],
+            'emerging_gaps': [s for s in record.emerging_skills if s not in user_skills],
+            'details': record.details
+        }
+
+    def _candidate_jobs(self, user_context):
+        """Positions of jobs sharing at least one skill with the user"""
+        candidates = set(self._unconditional_jobs)
+        for skill in user_context.skills:
+            candidates.update(self.skill_to_jobs.get(skill, ()))
+        return candidates
+
+
+    def enable_result_cache(self, cache=None, maxsize=10000, ttl=3600.0):
+        """Memoize recommend_paths/build_roadmap results keyed on profile fingerprints"""
+        self.result_cache = cache if cache is not None else ResultCache(maxsize, ttl)
+        return self.result_cache
+
+    def enable_instrumentation(self, instrumentation=None):
+        """Time the hot-path stages of this advisor (see career_metrics.INSTRUMENTED_STAGES)
+
+        Timed wrappers are installed on this instance only, so a disabled advisor runs
+        the plain methods with no overhead.
+        """
+        self.disable_instrumentation()
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        for stage in self.instrumentation.stages:
+            setattr(self, stage, self.instrumentation.wrap(stage, getattr(self, stage)))
+        return self.instrumentation
+
+    def disable_instrumentation(self):
+        """Remove the timed wrappers; returns the detached Instrumentation (or None)"""
+        instrumentation = self.__dict__.pop('instrumentation', None)
+        if instrumentation is not None:
+            for stage in instrumentation.stages:
+                self.__dict__.pop(stage, None)
+        return instrumentation
+
+    def profile_request(self, user_data, top_n=3, sort='cumulative', limit=30):
+        """Run recommend_paths plus every roadmap once under cProfile
+
+        Returns (roadmaps, pstats report text).
+        """
+        def request():
+            return [self.build_roadmap(user_data, recommendation)
+                    for recommendation in self.recommend_paths(user_data, top_n)]
+        return profile_call(request, sort=sort, limit=limit)
+
+    def _cached_result_store(self):
+        """The result cache bound to the current catalog version, or None"""
+        cache = self.result_cache
+        if cache is not None:
+            cache.bind_version(self.result_cache_version())
+        return cache
+
+    def result_cache_version(self):
+        """Version tag for cached results: catalog content plus scoring formula"""
+        return f"{self.catalog_version}:scoring-{SCORING_VERSION}"
+
+    @staticmethod
+    def _stored_recommendations(recommendations):
+        """Cache form of recommendations: job details dropped, lists copied"""
+        return [{key: (list(value) if key in ('missing_skills', 'emerging_gaps') else value)
+                 for key, value in rec.items() if key != 'details'}
+                for rec in recommendations]
+
+    def _loaded_recommendations(self, stored):
+        """Rebuild recommend_paths entries from the cache form"""
+        return [dict(rec, missing_skills=list(rec['missing_skills']),
+                     emerging_gaps=list(rec['emerging_gaps']),
+                     details=self.job_index[rec['career']].details)
+                for rec in stored]
+
+    def _paths_cache_key(self, user_data, top_n):
+        # Ranking non-default ikut di kunci; kunci default tetap sama seperti dulu
+        extra = list(self.ranking) if self.ranking.prior_weight else None
+        return ('paths', top_n, profile_fingerprint(self, user_data, extra))
+
     def recommend_paths(self, user_data, top_n=3):
-        recommendations = []
-        for job_key, job_details in self.job_market.items():
-            match_score = self._calculate_score(
-                user_data, job_key, job_details)
-            req_skills = set(job_details['required_skills'])
-            user_skills = set(user_data['skills'].keys())
-            missing_skills = list(req_skills - user_skills)
-            emerging_gaps = [s for s in job_details.get(
-                'emerging_skills', []) if s not in user_skills]
-
-            recommendations.append({
-                'career': job_key,
-                'score': match_score,
-                'salary': job_details['avg_salary'],
-                'missing_skills': missing_skills,
-                'emerging_gaps': emerging_gaps,
-                'details': job_details
-            })
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:top_n]
+        cache = self._cached_result_store()
+        if cache is None:
+            return self._rank_paths(user_data, top_n)
+
+        key = self._paths_cache_key(user_data, top_n)
+        stored = cache.get(key)
+        if stored is MISS:
+            recommendations = self._rank_paths(user_data, top_n)
+            cache.set(key, self._stored_recommendations(recommendations))
+            return recommendations
+        return self._loaded_recommendations(stored)
+
+    def _rank_paths(self, user_data, top_n=3):
+        """Uncached recommend_paths: prune with the inverted index, select with a heap"""
+        user_context = self._user_context(user_data)
+        records = self._job_records
+        if top_n < 1:
+            return []
+
+        candidates = self._candidate_jobs(user_context)
+        scores = {position: self._score_record(records[position], user_context)
+                  for position in candidates}
+
+        bonus = self.ranking_bonus()
+        if bonus is None:
+            def rank_key(item):
+                return item[1]
+        else:
+            def rank_key(item):
+                return item[1] + bonus[item[0]]
+
+        # Job di luar kandidat tidak punya skill yang cocok langsung: skill score-nya
+        # paling tinggi (total kredit parsial / jumlah skill), jadi skornya maksimal
+        # NO_SKILL_MATCH_SCORE_BOUND + 60 * itu (+ bonus prior). Job diperiksa dari
+        # batas atas tertinggi dan berhenti begitu batasnya di bawah skor ke-k.
+        credit_totals = user_context.job_credit
+        ceilings = []
+        for position, record in enumerate(records):
+            if position in scores:
+                continue
+            ceiling = (NO_SKILL_MATCH_SCORE_BOUND + PRUNING_ROUNDING_MARGIN
+                       + 60 * credit_totals[position] / record.required_count)
+            if bonus is not None:
+                ceiling += bonus[position]
+            ceilings.append((-ceiling, position))
+        ceilings.sort()
+
+        best = heapq.nlargest(top_n, map(rank_key, scores.items()))
+        best.reverse()      # min-heap berisi k rank key terbaik
+        for negative_ceiling, position in ceilings:
+            if len(best) == top_n and -negative_ceiling < best[0]:
+                break
+            score = scores[position] = self._score_record(records[position], user_context)
+            key = rank_key((position, score))
+            if len(best) < top_n:
+                heapq.heappush(best, key)
+            elif key > best[0]:
+                heapq.heapreplace(best, key)
+
+        # nlargest is stable like sort(reverse=True): ties keep catalog order
+        top = heapq.nlargest(top_n, sorted(scores.items()), key=rank_key)
+        return [self._build_recommendation(records[position], user_context.skills, score)
+                for position, score in top]
+
+    def _build_job_matrices(self):
+        """Encode job_index as NumPy arrays for batch scoring (cached)"""
+        cached = self._shared_cache.get('job_matrices')
+        if cached is not None and cached['source'] is self.job_index:
+            return cached
+
+        records = list(self.job_index.values())
+        env_vocab = sorted({env for record in records
+                            for env in record.environments})
+        env_ids = {env: i for i, env in enumerate(env_vocab)}
+
+        requirements = np.zeros((len(records), len(self.skill_ids)))
+        job_envs = np.zeros((len(records), len(env_vocab)))
+        timeline_limits = np.full(len(records), -np.inf)
+        timeline_penalties = np.full(len(records), float(TIMELINE_BONUS))
+        for j, record in enumerate(records):
+            for skill in record.skills:
+                requirements[j, self.skill_ids[skill]] = 1.0
+            for env in record.environments:
+                job_envs[j, env_ids[env]] = 1.0
+            if record.timeline_limit is not None:
+                timeline_limits[j] = record.timeline_limit
+                timeline_penalties[j] = record.timeline_penalty
+
+        self._shared_cache['job_matrices'] = {
+            'source': self.job_index,
+            'records': records,
+            'env_ids': env_ids,
+            'requirements': requirements,
+            'required_counts': requirements.sum(axis=1),
+            'job_envs': job_envs,
+            'costs': np.array([record.estimated_cost_idr for record in records], dtype=float),
+            'timeline_limits': timeline_limits,
+            'timeline_penalties': timeline_penalties,
+            'similarity': np.array(self.skill_similarity, dtype=float).reshape(
+                len(self.graph_skill_ids), len(self.skill_ids))
+        }
+        return self._shared_cache['job_matrices']
+
+    def _score_matrix(self, profiles, jobs=None):
+        """Score every profile against every job (or only the job positions in jobs)"""
+        matrices = self._build_job_matrices()
+        if jobs is not None:
+            jobs = np.asarray(jobs, dtype=int)
+            matrices = dict(matrices, **{
+                name: matrices[name][jobs]
+                for name in ('requirements', 'required_counts', 'job_envs', 'costs',
+                             'timeline_limits', 'timeline_penalties')})
+        skill_ids = self.skill_ids
+        env_ids = matrices['env_ids']
+        n_users = len(profiles)
+
+        graph_skill_ids = self.graph_skill_ids
+        similarity = matrices['similarity']
+        has_skill = np.zeros((n_users, len(skill_ids)))
+        low_skill = np.zeros((n_users, len(skill_ids)))
+        partial_credit = np.zeros((n_users, len(skill_ids)))
+        user_envs = np.zeros((n_users, len(env_ids)))
+        no_env_pref = np.zeros(n_users, dtype=bool)
+        budgets = np.empty(n_users)
+        timelines = np.empty(n_users)
+        for u, user_data in enumerate(profiles):
+            for skill, level in user_data['skills'].items():
+                idx = skill_ids.get(skill)
+                if idx is not None:
+                    has_skill[u, idx] = 1.0
+                    low_skill[u, idx] = 1.0 if level < 0.5 else 0.0
+            graph_rows = [graph_skill_ids[skill] for skill in user_data['skills']
+                          if skill in graph_skill_ids]
+            if graph_rows:
+                partial_credit[u] = similarity[graph_rows].max(axis=0)
+            envs = set(user_data['preferences'].get('work_environment', []))
+            no_env_pref[u] = not envs
+            for env in envs:
+                idx = env_ids.get(env)
+                if idx is not None:
+                    user_envs[u, idx] = 1.0
+            constraints = user_data['constraints']
+            budgets[u] = constraints.get('financial_investment', float('inf'))
+            timelines[u] = constraints.get('timeline_months', 24)
+
+        # --- 1. Skill Match ---
+        required_counts = matrices['required_counts']
+        # Kredit parsial kelipatan 1/1024 -> hasil matmul eksak seperti loop scalar
+        partial_credit[has_skill > 0] = 0.0
+        matched = (has_skill @ matrices['requirements'].T
+                   + partial_credit @ matrices['requirements'].T)
+        low_matched = (low_skill @ matrices['requirements'].T).astype(int)
+        penalty_steps = np.array(self._penalty_steps, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skill_score = np.maximum(
+                0, matched / required_counts - penalty_steps[low_matched] * 0.2)
+        skill_score = np.where(required_counts == 0, 1.0, skill_score)
+        score = skill_score * 60
+
+        # --- 2. Constraint Match ---
+        costs = matrices['costs']
+        budget = budgets[:, None]
+        budget_points = np.select(
+            [costs == 0, budget >= costs, budget >= costs * 0.5,
+             budget >= costs * 0.25],
+            [10, 10, 5, 2], default=0)
+        score = score + budget_points
+
+        # --- 3. Timeline Match ---
+        timeline_points = np.where(
+            timelines[:, None] < matrices['timeline_limits'],
+            matrices['timeline_penalties'], TIMELINE_BONUS)
+        score = score + timeline_points
+
+        # --- 4. Preference Match ---
+        env_overlap = (user_envs @ matrices['job_envs'].T) > 0
+        score = score + np.where(env_overlap | no_env_pref[:, None], 10, 0)
+
+        return np.clip(score, 0, 100)
+
+    def _rounded_score_matrix(self, profiles, jobs=None):
+        """_score_matrix rounded to 0.1 exactly like _score_record"""
+        width = len(self._job_records) if jobs is None else len(jobs)
+        if not profiles or not width:
+            return np.zeros((len(profiles), width))
+        # Python round() keeps the exact rounding of the scalar path
+        return np.array([[round(value, 1) for value in row]
+                         for row in self._score_matrix(profiles, jobs).tolist()])
+
+    def _rank_order(self, scores, top_n):
+        """Top-N job positions per row of a score matrix under the ranking model"""
+        bonus = self.ranking_bonus()
+        if bonus is not None:
+            # Penjumlahan float64 yang sama dengan rank_key di _rank_paths
+            scores = scores + np.array(bonus)
+        # top_n < 1 -> tidak ada rekomendasi (slice negatif akan memotong dari belakang)
+        return np.argsort(-scores, axis=1, kind='stable')[:, :max(top_n, 0)]
+
+    def recommend_paths_batch(self, profiles, top_n=3):
+        """Vectorized recommend_paths for many profiles at once"""
+        profiles = list(profiles)
+        cache = self._cached_result_store()
+        if cache is None:
+            return self._rank_paths_batch(profiles, top_n)
+
+        keys = [self._paths_cache_key(user_data, top_n) for user_data in profiles]
+        results = []
+        misses = []
+        for i, key in enumerate(keys):
+            stored = cache.get(key)
+            if stored is MISS:
+                misses.append(i)
+                results.append(None)
+            else:
+                results.append(self._loaded_recommendations(stored))
+        if misses:
+            fresh = self._rank_paths_batch([profiles[i] for i in misses], top_n)
+            for i, recommendations in zip(misses, fresh):
+                cache.set(keys[i], self._stored_recommendations(recommendations))
+                results[i] = recommendations
+        return results
+
+    def _rank_paths_batch(self, profiles, top_n=3):
+        """Uncached recommend_paths_batch (scalar fallback without NumPy)"""
+        if np is None:
+            return [self._rank_paths(user_data, top_n) for user_data in profiles]
+        if not profiles:
+            return []
+
+        records = self._build_job_matrices()['records']
+        scores = self._rounded_score_matrix(profiles)
+        order = self._rank_order(scores, top_n)
+
+        results = []
+        for u, user_data in enumerate(profiles):
+            user_skills = user_data['skills']
+            recommendations = []
+            for j in order[u].tolist():
+                recommendations.append(self._build_recommendation(
+                    records[j], user_skills, float(scores[u, j])))
+            results.append(recommendations)
+        return results
 
     def build_learning_resources(self):
         """Complete Database covering ALL related_skills in the graph"""
-        resources = {
-            # ==========================================
-            # 1. PROGRAMMING & TECH (Java, JS, SQL, etc.)
-            # ==========================================
-            'python': {
-                'steps': ['Master Syntax & Data Types', 'Learn OOP & Modules', 'Build 3 Mini-Projects', 'Virtual Environments'],
-                'resources': ['Course: CS50p (Harvard/EdX)', 'Video: Programming with Mosh', 'Book: Automate the Boring Stuff']
-            },
-            'javascript': {
-                'steps': ['ES6 Syntax (Arrow functions, etc.)', 'DOM Manipulation', 'Async/Await & Promises', 'Learn a Framework (React/Vue)'],
-                'resources': ['Site: JavaScript.info', 'Course: FreeCodeCamp JS Algorithms', 'Video: Traversy Media']
-            },
-            'java': {
-                'steps': ['JVM Fundamentals', 'Object-Oriented Programming', 'Java Collections Framework', 'Spring Boot Basics'],
-                'resources': ['Book: Head First Java', 'Course: MOOC.fi Java Programming', 'Site: Baeldung']
-            },
-            'sql': {
-                'steps': ['SELECT, FROM, WHERE basics', 'Joins (Inner, Outer, Left)', 'Aggregations (GROUP BY)', 'Database Normalization'],
-                'resources': ['Site: SQLZoo', 'Site: Mode Analytics SQL Tutorial', 'Video: Alex The Analyst']
-            },
-            'problem_solving': {
-                'steps': ['Decompose complex problems', 'Pattern Recognition', 'Algorithm Design', 'Debugging strategies'],
-                'resources': ['Book: Think Like a Programmer', 'Site: Project Euler', 'Method: The Rubber Duck Technique']
-            },
-            'algorithms': {
-                'steps': ['Big O Notation', 'Sorting & Searching', 'Trees & Graphs', 'Dynamic Programming'],
-                'resources': ['Book: Grokking Algorithms', 'Site: LeetCode', 'Video: NeetCode']
-            },
-            'cloud_computing': {
-                'steps': ['AWS/Azure Core Services', 'Docker/Containers', 'Serverless Functions', 'Networking Basics'],
-                'resources': ['Course: AWS Cloud Practitioner', 'Site: A Cloud Guru']
-            },
-
-            # ==========================================
-            # 2. DATA & ANALYTICS
-            # ==========================================
-            'data_analysis': {
-                'steps': ['Pandas/NumPy Mastery', 'Data Cleaning', 'Exploratory Analysis', 'Storytelling with Data'],
-                'resources': ['Book: Python for Data Analysis', 'Site: Kaggle Learn', 'Video: Keith Galli']
-            },
-            'statistics': {
-                'steps': ['Descriptive Stats', 'Probability Distributions', 'Hypothesis Testing (p-values)', 'Regression'],
-                'resources': ['Site: Khan Academy Stats', 'Book: Naked Statistics', 'Video: StatQuest']
-            },
-            'visualization': {
-                'steps': ['Chart Selection Theory', 'Tableau or PowerBI Basics', 'Matplotlib/Seaborn (Python)', 'Dashboard Design'],
-                'resources': ['Book: Storytelling with Data', 'Course: Tableau Public Resources', 'Site: Data Viz Catalogue']
-            },
-            'machine_learning': {
-                'steps': ['Supervised vs Unsupervised', 'Scikit-Learn', 'Model Evaluation metrics', 'Feature Engineering'],
-                'resources': ['Course: Andrew Ng ML', 'Book: Hands-On ML', 'Site: Hugging Face']
-            },
-            'linear_algebra': {
-                'steps': ['Vectors & Scalars', 'Matrix Multiplication', 'Eigenvalues/Eigenvectors', 'Dimensionality Reduction'],
-                'resources': ['Video: 3Blue1Brown Linear Algebra', 'Course: Khan Academy Linear Algebra']
-            },
-            'excel': {
-                'steps': ['VLOOKUP/XLOOKUP', 'Pivot Tables', 'Power Query', 'Macros/VBA'],
-                'resources': ['Video: ExcelIsFun', 'Site: MrExcel', 'Course: Microsoft Excel Certification']
-            },
-            'data_interpretation': {
-                'steps': ['Identifying Trends', 'Correlation vs Causation', 'Detecting Bias', 'Executive Summaries'],
-                'resources': ['Book: Keeping Up with the Quants', 'Article: HBR Data Literacy']
-            },
-            'reporting': {
-                'steps': ['KPI Definition', 'Automated Reporting', 'Slide Deck Design', 'Stakeholder Presentation'],
-                'resources': ['Book: Slide:ology', 'Tool: Google Looker Studio']
-            },
-
-            # ==========================================
-            # 3. BUSINESS & MANAGEMENT
-            # ==========================================
-            'project_management': {
-                'steps': ['Project Lifecycle', 'Risk Management', 'Budgeting', 'Scope Management'],
-                'resources': ['Course: Google PM Certificate', 'Book: PMBOK Guide']
-            },
-            'agile': {
-                'steps': ['Scrum Ceremonies', 'Kanban Boards', 'User Stories', 'Sprint Planning'],
-                'resources': ['Book: Scrum: The Art of Doing Twice the Work', 'Site: Atlassian Agile Coach']
-            },
-            'leadership': {
-                'steps': ['Delegation', 'Conflict Resolution', 'Emotional Intelligence', 'Team Motivation'],
-                'resources': ['Book: Leaders Eat Last', 'Video: Simon Sinek TED Talks', 'Book: Dare to Lead']
-            },
-            'planning': {
-                'steps': ['Gantt Charts', 'Critical Path Method', 'Resource Allocation', 'Goal Setting (SMART)'],
-                'resources': ['Tool: Asana Academy', 'Book: Getting Things Done']
-            },
-            'communication': {
-                'steps': ['Active Listening', 'Public Speaking', 'Business Writing', 'Non-verbal cues'],
-                'resources': ['Organization: Toastmasters', 'Book: Crucial Conversations', 'Book: Simply Said']
-            },
-            'organization': {
-                'steps': ['Digital File Management', 'Time Blocking', 'Inbox Zero', 'Prioritization Matrices'],
-                'resources': ['Book: The Life-Changing Magic of Tidying Up', 'Method: Eisenhower Matrix']
-            },
-
-            # ==========================================
-            # 4. MARKETING & DIGITAL
-            # ==========================================
-            'digital_marketing': {
-                'steps': ['Marketing Funnels', 'Customer Personas', 'Brand Voice', 'Campaign Analytics'],
-                'resources': ['Site: HubSpot Academy', 'Book: This is Marketing']
-            },
-            'seo': {
-                'steps': ['Keyword Research', 'On-Page Optimization', 'Backlink Strategy', 'Technical SEO'],
-                'resources': ['Site: Moz Beginner Guide to SEO', 'Tool: Google Search Console', 'Video: Ahrefs YouTube']
-            },
-            'content_creation': {
-                'steps': ['Copywriting', 'Basic Graphic Design', 'Video Editing', 'Storytelling'],
-                'resources': ['Book: Everybody Writes', 'Tool: Canva Design School', 'Software: CapCut/Premiere']
-            },
-            'social_media': {
-                'steps': ['Platform Algorithms', 'Content Calendars', 'Community Management', 'Social Analytics'],
-                'resources': ['Site: Social Media Examiner', 'Course: Meta Social Media Cert']
-            },
-            'analytics': {  # Marketing analytics
-                'steps': ['Google Analytics 4', 'Conversion Tracking', 'A/B Testing', 'Funnel Analysis'],
-                'resources': ['Course: Google Analytics Academy', 'Book: Web Analytics 2.0']
-            },
-
-            # ==========================================
-            # 5. HEALTHCARE & PATIENT CARE
-            # ==========================================
-            'patient_care': {
-                'steps': ['Vital Signs', 'Patient Hygiene', 'Infection Control', 'Documentation'],
-                'resources': ['Video: RegisteredNurseRN', 'Textbook: Fundamentals of Nursing']
-            },
-            'empathy': {
-                'steps': ['Perspective Taking', 'Active Listening', 'Compassionate Response', 'Managing Burnout'],
-                'resources': ['Book: I Hear You', 'Video: Brene Brown on Empathy']
-            },
-            'medical_knowledge': {
-                'steps': ['Anatomy', 'Medical Terminology', 'Pharmacology', 'Pathology Basics'],
-                'resources': ['Site: Kenhub', 'App: Epocrates', 'Video: Osmosis']
-            },
-
-            # ==========================================
-            # 6. ELECTRICAL & SOLAR
-            # ==========================================
-            'electrical_systems': {
-                'steps': ['Ohm\'s Law', 'Circuit Analysis', 'Wiring Methods', 'National Electric Code (NEC)'],
-                'resources': ['Book: Ugly\'s Electrical References', 'Video: Electrician U']
-            },
-            'safety_protocols': {
-                'steps': ['OSHA Standards', 'PPE Selection', 'Lockout/Tagout', 'First Aid Basics'],
-                'resources': ['Site: OSHA.gov', 'Course: OSHA 10-Hour']
-            },
-            'troubleshooting': {
-                'steps': ['Root Cause Analysis', 'Multimeter Usage', 'Schematic Tracing', 'Isolation Testing'],
-                'resources': ['Book: How to Diagnose and Fix Everything Electronic']
-            },
-            'blueprint_reading': {
-                'steps': ['Symbols & Legends', 'Scale Ratios', 'Floor Plans', 'Electrical Schedules'],
-                'resources': ['Book: Blueprint Reading for the Building Trades']
-            },
-            'solar_technology': {
-                'steps': ['Photovoltaic Physics', 'Inverters', 'Battery Systems', 'Grid Interconnection'],
-                'resources': ['Site: Solar Energy International', 'Book: Solar Electricity Handbook']
-            },
-            'installation': {
-                'steps': ['Racking Systems', 'Roof Penetrations', 'Wiring Management', 'Commissioning'],
-                'resources': ['Video: Solar Power World', 'Certification: NABCEP']
-            },
-
-            # ==========================================
-            # 7. DESIGN & CREATIVE
-            # ==========================================
-            'creativity': {
-                'steps': ['Brainstorming Techniques', 'Lateral Thinking', 'Mind Mapping', 'Iterative Design'],
-                'resources': ['Book: Steal Like an Artist', 'Method: SCAMPER']
-            },
-            'design_software': {
-                'steps': ['Photoshop Layers', 'Illustrator Vectors', 'InDesign Layouts', 'Figma Prototyping'],
-                'resources': ['Course: Adobe Creative Cloud Tutorials', 'Video: Piximperfect']
-            },
-            'visual_communication': {
-                'steps': ['Color Theory', 'Layout & Composition', 'Imagery Selection', 'Branding'],
-                'resources': ['Book: Thinking with Type', 'Site: Behance']
-            },
-            'typography': {
-                'steps': ['Typeface Families', 'Kerning/Leading/Tracking', 'Font Pairing', 'Hierarchy'],
-                'resources': ['Site: Google Fonts Knowledge', 'Book: The Elements of Typographic Style']
-            },
-
-            # ==========================================
-            # 8. EDUCATION
-            # ==========================================
-            'classroom_management': {
-                'steps': ['Establishing Rules', 'Behavior Intervention', 'Room Layout', 'Engagement Strategies'],
-                'resources': ['Book: The First Days of School', 'Site: Cult of Pedagogy']
-            },
-            'patience': {
-                'steps': ['Stress Management', 'Mindfulness', 'De-escalation Techniques', 'Perspective Taking'],
-                'resources': ['App: Headspace', 'Book: The Power of Patience']
-            },
-            'subject_knowledge': {
-                'steps': ['Curriculum Standards', 'Deep Dive into Topic', 'Pedagogical Content Knowledge'],
-                'resources': ['Site: Khan Academy', 'Site: Coursera']
-            },
-
-            # ==========================================
-            # 9. LEGAL
-            # ==========================================
-            'legal_research': {
-                'steps': ['Using Westlaw/Lexis', 'Finding Case Law', 'Shepardizing', 'Statutory Interpretation'],
-                'resources': ['Site: Cornell LII', 'Book: Legal Research in a Nutshell']
-            },
-            'legal_writing': {
-                'steps': ['IRAC Method', 'Drafting Memos', 'Citation (Bluebook)', 'Persuasive Arguments'],
-                'resources': ['Book: Point Made', 'Book: The Redbook']
-            },
-            'case_analysis': {
-                'steps': ['Briefing Cases', 'Identifying Holdings', 'Distinguishing Facts', 'Synthesizing Rules'],
-                'resources': ['Method: Case Briefing Templates', 'Site: Oyez']
-            },
-            'litigation': {
-                'steps': ['Civil Procedure', 'Discovery Process', 'Motions Practice', 'Settlement'],
-                'resources': ['Book: Civil Procedure: Examples & Explanations']
-            },
-            'trial_advocacy': {
-                'steps': ['Opening Statements', 'Direct/Cross Exam', 'Objections', 'Closing Arguments'],
-                'resources': ['Book: Mauet on Trial Techniques', 'Video: Mock Trial Competitions']
-            },
-            'evidence_law': {
-                'steps': ['Relevance', 'Hearsay Rules', 'Character Evidence', 'Authentication'],
-                'resources': ['Book: Evidence under the Rules', 'Flashcards: Law in a Flash']
-            },
-            'contract_law': {
-                'steps': ['Offer & Acceptance', 'Consideration', 'Breach of Contract', 'Remedies'],
-                'resources': ['Course: Harvard Contract Law Online', 'Book: Contracts E&E']
-            },
-            'negotiation': {
-                'steps': ['BATNA Analysis', 'Active Listening', 'Value Creation', 'Closing Deals'],
-                'resources': ['Book: Never Split the Difference', 'Book: Getting to Yes']
-            },
-            'business_law': {
-                'steps': ['Business Entities (LLC/Corp)', 'Corporate Governance', 'M&A Basics', 'Compliance'],
-                'resources': ['Site: SBA.gov', 'Book: Business Law Today']
-            },
-            'legal_analysis': {
-                'steps': ['Issue Spotting', 'Applying Legal Principles', 'Reasoning by Analogy', 'Policy Analysis'],
-                'resources': ['Book: Getting to Maybe', 'Course: Legal Analysis and Writing']
-            },
-            'legal_procedures': {
-                'steps': ['Court Filing Systems', 'Deadline Management', 'Document Preparation', 'Client Interaction'],
-                'resources': ['Book: The Legal Secretary\'s Handbook', 'Course: Paralegal Certification Programs']
-            },
-
-            # ==========================================
-            # 10. LAW ENFORCEMENT & MILITARY
-            # ==========================================
-            'law_enforcement': {
-                'steps': ['Constitutional Law', 'Patrol Procedures', 'Use of Force Continuum', 'Community Relations'],
-                'resources': ['Academy: Police Training Program', 'Book: Verbal Judo', 'Course: State Certification']
-            },
-            'criminal_investigation': {
-                'steps': ['Crime Scene Preservation', 'Evidence Collection', 'Witness Interviewing', 'Case File Preparation'],
-                'resources': ['Book: Criminal Investigation', 'Course: FBI National Academy', 'Training: Detective School']
-            },
-            'military_operations': {
-                'steps': ['Basic Training Completion', 'Weapons Proficiency', 'Tactical Movement', 'Team Coordination'],
-                'resources': ['Training: Boot Camp', 'Manual: Army Field Manuals', 'Course: Officer Candidate School']
-            },
-            'military_training': {
-                'steps': ['Physical Conditioning', 'Weapons Qualification', 'First Aid Certification', 'Leadership Development'],
-                'resources': ['Program: Basic Combat Training', 'Manual: Military Training Manuals', 'Course: NCO Academy']
-            },
-            'military_strategy': {
-                'steps': ['Study Military History', 'Learn Battlefield Tactics', 'Understand Chain of Command', 'Develop Leadership Skills'],
-                'resources': ['Book: The Art of War', 'Course: War College', 'Manual: Joint Publication 3-0']
-            },
-            'national_security': {
-                'steps': ['Study Intelligence Gathering', 'Learn Risk Assessment', 'Understand Geopolitics', 'Security Clearance Process'],
-                'resources': ['Book: Intelligence: From Secrets to Policy', 'Course: National Security Studies', 'Agency: DHS Training']
-            },
-            'physical_fitness': {
-                'steps': ['Cardiovascular Training', 'Strength Building', 'Endurance Exercises', 'Flexibility Work'],
-                'resources': ['Program: Military PT Standards', 'App: Nike Training Club', 'Guide: ACSM Fitness Guidelines']
-            },
-            'discipline': {
-                'steps': ['Time Management', 'Goal Setting', 'Self-Motivation Techniques', 'Routine Establishment'],
-                'resources': ['Book: The Power of Discipline', 'Method: Pomodoro Technique', 'App: Habitica']
-            },
-            'forensics': {
-                'steps': ['Evidence Collection Protocols', 'Laboratory Analysis', 'Digital Forensics', 'Expert Testimony Preparation'],
-                'resources': ['Course: Forensic Science Degree', 'Book: Criminalistics', 'Certification: IAI Programs']
-            },
-
-            # ==========================================
-            # 11. CULINARY & HOSPITALITY
-            # ==========================================
-            'culinary_skills': {
-                'steps': ['Knife Handling', 'Heat Control', 'Seasoning/Balancing', 'Plating'],
-                'resources': ['Book: The Professional Chef', 'Book: Salt, Fat, Acid, Heat']
-            },
-            'knife_skills': {
-                'steps': ['Sharpening/Honing', 'The Claw Grip', 'Precision Cuts (Julienne/Dice)', 'Speed'],
-                'resources': ['Video: Serious Eats Knife Skills', 'Video: Jacques Pépin Techniques']
-            },
-            'menu_planning': {
-                'steps': ['Costing & Pricing', 'Seasonality', 'Menu Engineering', 'Inventory Management'],
-                'resources': ['Book: Menu Design', 'Software: Toast POS Resources']
-            },
-            'nutrition': {
-                'steps': ['Macronutrients', 'Dietary Restrictions', 'Allergens', 'Healthy Substitutions'],
-                'resources': ['Textbook: Nutrition for Foodservice', 'Site: Nutrition.gov']
-            },
-            'cost_control': {
-                'steps': ['Portion Control', 'Waste Management', 'Supplier Negotiation', 'P&L Analysis'],
-                'resources': ['Book: Restaurant Financial Basics']
-            },
-            'food_safety': {
-                'steps': ['HACCP Plans', 'Time/Temp Control', 'Cross-Contamination', 'Personal Hygiene'],
-                'resources': ['Certification: ServSafe Manager', 'Site: FDA Food Code']
-            },
-            'sanitation_procedures': {
-                'steps': ['Chemical Handling', 'Equipment Cleaning', 'Pest Control', 'Inspection Prep'],
-                'resources': ['Checklist: Health Department Guides']
-            },
-            'culinary_management': {
-                'steps': ['Staff Scheduling', 'Vendor Management', 'Quality Control', 'Customer Service Standards'],
-                'resources': ['Book: Restaurant Success by the Numbers', 'Course: Hospitality Management']
-            },
-
-            # ==========================================
-            # 12. AGRICULTURE
-            # ==========================================
-            'agricultural_production': {
-                'steps': ['Soil Preparation', 'Crop Selection', 'Planting Techniques', 'Harvest Methods'],
-                'resources': ['Book: The Market Gardener', 'Program: USDA Extension Services', 'Course: Sustainable Agriculture']
-            },
-            'crop_management': {
-                'steps': ['Soil Testing', 'Pest Control', 'Irrigation Systems', 'Crop Rotation'],
-                'resources': ['Guide: University Extension Programs', 'Book: Crop Production Science', 'Tool: Soil Testing Kits']
-            },
-            'animal_husbandry': {
-                'steps': ['Animal Nutrition', 'Health Monitoring', 'Breeding Programs', 'Facility Management'],
-                'resources': ['Book: Storey\'s Guide to Raising Livestock', 'Course: Animal Science Programs', 'Vet: Consultation Services']
-            }
-        }
+        return self._catalog('learning_resources')
+
+    def get_learning_resources(self):
+        """Learning resource database, built lazily once and shared by all advisors"""
+        cls = type(self)
+        resources = cls.__dict__.get('_learning_resources_cache')
+        if resources is None:
+            with cls._learning_resources_lock:
+                resources = cls.__dict__.get('_learning_resources_cache')
+                if resources is None:
+                    resources = self.build_learning_resources()
+                    cls._learning_resources_cache = resources
         return resources
 
+    @classmethod
+    def reload_learning_resources(cls):
+        """Drop the shared learning resource database so it is rebuilt on next use"""
+        with cls._learning_resources_lock:
+            cls._learning_resources_cache = None
+
     def estimate_career_cost(self, career_details):
         """Estimate realistic education costs for a career in Indonesia"""
-        base_cost = 0
-
-        if career_details.get('education_required') == 'kedinasan':
-            base_cost = 0
-        elif career_details.get('education_required') == 'doctorate':
-            base_cost = 150000000  # 150 juta
-        elif career_details.get('education_required') == 'law_degree':
-            base_cost = 80000000   # 80 juta
-        elif career_details.get('education_required') == 'bachelor_degree':
-            base_cost = 50000000   # 50 juta
-        elif career_details.get('education_required') == 'associate_degree':
-            base_cost = 25000000   # 25 juta
-        elif career_details.get('education_required') == 'culinary_school':
-            base_cost = 30000000   # 30 juta
-        elif career_details.get('education_required') == 'apprenticeship':
-            base_cost = 5000000    # 5 juta
-        else:
-            base_cost = 10000000   # 10 juta default
+        base_cost = EDUCATION_COST_IDR.get(
+            career_details.get('education_required'), DEFAULT_EDUCATION_COST_IDR)
 
         if career_details.get('certification_required'):
-            base_cost += 5000000  # +5 juta untuk sertifikasi
+            base_cost += CERTIFICATION_COST_IDR
 
         return base_cost
 
-    def display_university_recommendations(self, recommendation, user_budget):
-        """Display Indonesian university recommendations with cost information dan jurusan"""
+    def _major_tokens(self, major):
+        """Normalized field tokens of a major name, with English equivalents"""
+        aliases = self.major_keywords['keyword_aliases']
+        stopwords = self.major_keywords['stopwords']
+        tokens = set()
+        for word in major.lower().replace('-', ' ').split():
+            if word in stopwords:
+                continue
+            tokens.add(word)
+            tokens.update(aliases.get(word, ()))
+        return tokens
+
+    def compile_university_relevance(self):
+        """Precompute career -> university -> UniversityRelevance for every pair
+
+        A strength is relevant when one of its tokens (or the whole strength key)
+        matches a token of a recommended major. The score sums, per strength, the
+        best MAJOR_RELEVANCE_WEIGHTS of the major lists it matches.
+        """
+        table = {}
+        for career_key in self.job_market:
+            majors = self.major_recommendations.get(career_key, {})
+            weighted = [(weight, set().union(*map(self._major_tokens, majors.get(field, ()))))
+                        for field, weight in MAJOR_RELEVANCE_WEIGHTS]
+            recommended = set().union(*map(self._major_tokens,
+                                           majors.get('recommended_majors', ())))
+            per_university = {}
+            for uni_key, uni in self.indonesian_universities.items():
+                strengths = []
+                score = 0.0
+                for strength in uni.get('strengths', ()):
+                    tokens = set(strength.split('_')) | {strength}
+                    if not tokens.isdisjoint(recommended):
+                        strengths.append(strength.replace('_', ' ').title())
+                    score += max((weight for weight, major_tokens in weighted
+                                  if not tokens.isdisjoint(major_tokens)), default=0.0)
+                per_university[uni_key] = UniversityRelevance(
+                    strengths=tuple(strengths), score=round(score, 2))
+            table[career_key] = MappingProxyType(per_university)
+        self.university_relevance = MappingProxyType(table)
+
+    def compile_university_index(self):
+        """Cost-sorted university lists (all + per career) and filter indexes for search"""
+        universities = self.indonesian_universities
+
+        def cost_sorted(uni_keys):
+            entries = sorted(
+                (universities[key].get('cost_per_semester', 0) * DEGREE_SEMESTERS, position, key)
+                for position, key in enumerate(uni_keys, 1) if key in universities)
+            return UniversityCostIndex(
+                costs=tuple(entry[0] for entry in entries),
+                numbers=tuple(entry[1] for entry in entries),
+                keys=tuple(entry[2] for entry in entries))
+
+        by_career = {career_key: cost_sorted(dict.fromkeys(details['indonesian_universities']))
+                     for career_key, details in self.job_market.items()
+                     if 'indonesian_universities' in details}
+        by_type = defaultdict(set)
+        by_location = defaultdict(set)
+        by_strength = defaultdict(set)
+        for key, uni in universities.items():
+            by_type[uni.get('type', '').lower()].add(key)
+            for token in _location_tokens(uni.get('location', '')):
+                by_location[token].add(key)
+            for strength in uni.get('strengths', ()):
+                by_strength[strength].add(key)
+
+        self.university_index = MappingProxyType({
+            'all': cost_sorted(universities),
+            'careers': MappingProxyType(by_career),
+            'type': MappingProxyType({k: frozenset(v) for k, v in by_type.items()}),
+            'location': MappingProxyType({k: frozenset(v) for k, v in by_location.items()}),
+            'strength': MappingProxyType({k: frozenset(v) for k, v in by_strength.items()}),
+        })
+
+    def _filtered_university_keys(self, types=None, location=None, strengths=None):
+        """Keys passing every given filter (None = no filter given)"""
+        index = self.university_index
+        selected = None
+
+        def narrow(keys):
+            return keys if selected is None else selected & keys
+
+        if types:
+            types = [types] if isinstance(types, str) else types
+            selected = narrow(frozenset().union(
+                *(index['type'].get(t.lower(), frozenset()) for t in types)))
+        for token in _location_tokens(location or ''):
+            selected = narrow(index['location'].get(token, frozenset()))
+        for strength in ([strengths] if isinstance(strengths, str) else strengths or ()):
+            selected = narrow(index['strength'].get(
+                strength.strip().lower().replace(' ', '_'), frozenset()))
+        return selected
+
+    def search_universities(self, career=None, max_total_cost=None, min_total_cost=None,
+                            types=None, location=None, strengths=None, sort='cost',
+                            page=1, page_size=10, user_budget=None):
+        """Paged university query, e.g. best data_scientist options under Rp 40 juta
+
+        Budget bounds apply to the total degree cost and are binary searches over the
+        cost-sorted index; types/location/strengths filter through precomputed sets
+        (location matches every word, strengths must all be present). sort is 'cost'
+        (cheapest first) or 'relevance' (needs career). Affordability is judged
+        against user_budget, defaulting to max_total_cost.
+        """
+        if sort not in ('cost', 'relevance'):
+            raise ValueError(f"Unknown sort '{sort}', choose 'cost' or 'relevance'")
+        if sort == 'relevance' and career is None:
+            raise ValueError("sort='relevance' needs a career")
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be >= 1")
+        if career is None:
+            cost_index = self.university_index['all']
+        else:
+            cost_index = self.university_index['careers'].get(career)
+            if cost_index is None:
+                cost_index = UniversityCostIndex((), (), ())
+
+        low = 0 if min_total_cost is None else bisect_left(cost_index.costs, min_total_cost)
+        high = (len(cost_index.costs) if max_total_cost is None
+                else bisect_right(cost_index.costs, max_total_cost))
+        allowed = self._filtered_university_keys(types, location, strengths)
+        matches = [(cost_index.keys[i], cost_index.numbers[i]) for i in range(low, high)
+                   if allowed is None or cost_index.keys[i] in allowed]
+        if sort == 'relevance':
+            # sort stabil: relevansi sama tetap termurah dulu
+            matches.sort(key=lambda match: -self._university_relevance(career, match[0]).score)
+
+        if user_budget is None:
+            user_budget = max_total_cost if max_total_cost is not None else float('inf')
+        start = (page - 1) * page_size
+        return UniversityPage(
+            items=[self._university_option(career, key, number, user_budget)
+                   for key, number in matches[start:start + page_size]],
+            total=len(matches),
+            page=page,
+            page_size=page_size
+        )
+
+    def _university_relevance(self, career_key, uni_key):
+        relevance = self.university_relevance.get(career_key, {}).get(uni_key)
+        return relevance if relevance is not None else UniversityRelevance((), 0.0)
+
+    @staticmethod
+    def _affordability(cost_per_semester, total_degree_cost, user_budget):
+        """Cost indicator of one university for a budget"""
+        if cost_per_semester == 0:
+            return 'free'
+        if user_budget >= total_degree_cost:
+            return 'affordable'
+        if user_budget >= total_degree_cost * 0.5:
+            return 'needs_scholarship'
+        return 'consider_alternatives'
+
+    def _university_option(self, career_key, uni_key, number, user_budget):
+        uni = self.indonesian_universities[uni_key]
+        cost_per_semester = uni.get('cost_per_semester', 0)
+        total_degree_cost = cost_per_semester * DEGREE_SEMESTERS
+        # Kekuatan yang relevan dengan jurusan yang direkomendasikan (tabel precomputed)
+        relevance = self._university_relevance(career_key, uni_key)
+        return UniversityOption(
+            key=uni_key, number=number, name=uni['name'], type=uni['type'],
+            location=uni['location'], ranking=uni['ranking'],
+            website=uni['website'], cost_per_semester=cost_per_semester,
+            total_degree_cost=total_degree_cost,
+            affordability=self._affordability(cost_per_semester, total_degree_cost, user_budget),
+            relevant_strengths=list(relevance.strengths),
+            relevance=relevance.score
+        )
+
+    def university_options(self, recommendation, user_budget, rank_by_relevance=False):
+        """Indonesian universities for a recommendation with cost information (None if unknown)"""
         career_key = recommendation['career']
-        career_name = career_key.replace('_', ' ').title()
-
-        print(
-            f"\n🎓 REKOMENDASI UNIVERSITAS & JURUSAN UNTUK {career_name.upper()}:")
-
-        # Tampilkan rekomendasi jurusan terlebih dahulu
-        self.display_major_recommendations(career_key)
-
-        print("\n   🏫 UNIVERSITAS TERKAIT:")
         career_details = recommendation['details']
-        if 'indonesian_universities' in career_details:
-            for i, uni_key in enumerate(career_details['indonesian_universities'], 1):
-                if uni_key in self.indonesian_universities:
-                    uni = self.indonesian_universities[uni_key]
-                    cost_per_semester = uni.get('cost_per_semester', 0)
-                    total_degree_cost = cost_per_semester * 8  # 8 semester for bachelor
-
-                    # Cost indicator
-                    if cost_per_semester == 0:
-                        cost_indicator = "🎓 GRATIS + TUNJANGAN"
-                    elif user_budget >= total_degree_cost:
-                        cost_indicator = "✅ Terjangkau"
-                    elif user_budget >= total_degree_cost * 0.5:
-                        cost_indicator = "⚠️ Butuh beasiswa"
-                    else:
-                        cost_indicator = "💡 Pertimbangkan alternatif"
-
-                    cost_formatted = f"Rp {cost_per_semester:,.0f}".replace(
-                        ',', '.')
-                    print(f"   {i}. {uni['name']} ({uni['type'].title()})")
-                    print(f"      📍 {uni['location']} | 🏆 {uni['ranking']}")
-                    print(
-                        f"      💰 {cost_formatted}/semester - {cost_indicator}")
-
-                    # Tampilkan kekuatan universitas yang relevan dengan karir
-                    relevant_strengths = []
-                    recommended_majors = self.major_recommendations.get(
-                        career_key, {}).get('recommended_majors', [])
-
-                    # Cari kekuatan universitas yang relevan dengan jurusan yang direkomendasikan
-                    for strength in uni.get('strengths', []):
-                        strength_name = strength.replace('_', ' ').title()
-                        # Cek apakah kekuatan universitas relevan dengan jurusan yang direkomendasikan
-                        for major in recommended_majors:
-                            if any(keyword in strength_name.lower() for keyword in major.lower().split()):
-                                relevant_strengths.append(strength_name)
-                                break
-
-                    if relevant_strengths:
-                        print(
-                            f"      ⭐ Kekuatan: {', '.join(relevant_strengths[:2])}")
-
-                    print(f"      🌐 {uni['website']}")
-                    print()
-        else:
-            print("   ⚠️ Informasi universitas belum tersedia untuk karir ini")
-
-    def generate_learning_roadmap(self, user_data, recommendation):
-        career_name = recommendation['career'].replace('_', ' ').title()
-        missing = recommendation['missing_skills']
-        resources_db = self.build_learning_resources()
+        if 'indonesian_universities' not in career_details:
+            return None
 
-        print(
-            f"\n🚀 ROADMAP TO: {career_name} (Match: {recommendation['score']}%)")
-        print("-" * 70)
+        options = [self._university_option(career_key, uni_key, i, user_budget)
+                   for i, uni_key in enumerate(career_details['indonesian_universities'], 1)
+                   if uni_key in self.indonesian_universities]
+        if rank_by_relevance:
+            # sort stabil: relevansi sama tetap urut katalog
+            options.sort(key=lambda option: -option.relevance)
+        return options
 
-        # 1. Market Data
+    def display_university_recommendations(self, recommendation, user_budget):
+        """Display Indonesian university recommendations with cost information dan jurusan"""
+        career_key = recommendation['career']
+        ConsoleRenderer().render_universities(
+            career_key, self.major_recommendation(career_key),
+            self.university_options(recommendation, user_budget))
+
+    def learning_dag(self, career_key):
+        """Prerequisite DAG of one career's required skills (cached per career)
+
+        Covers the required skills plus their transitive skill_graph prerequisites,
+        topologically sorted with prerequisites first; ties keep catalog order.
+        Skills on a prerequisite cycle are reported in `cycles` and placed last.
+        """
+        dags = self._shared_cache.setdefault('learning_dags', {})
+        dag = dags.get(career_key)
+        if dag is not None:
+            return dag
+
+        # Kumpulkan skill + prasyarat transitif; rank = urutan ditemukan (BFS)
+        rank = {}
+        prerequisites = {}
+        queue = deque(self.job_market[career_key]['required_skills'])
+        while queue:
+            skill = queue.popleft()
+            if skill in rank:
+                continue
+            rank[skill] = len(rank)
+            node = self.skill_graph.get(skill, {})
+            prerequisites[skill] = tuple(dict.fromkeys(
+                p for p in node.get('prerequisites', ()) if p != skill))
+            queue.extend(prerequisites[skill])
+
+        # Kahn's algorithm, antrian prioritas berdasarkan rank
+        dependents = defaultdict(list)
+        indegree = dict.fromkeys(rank, 0)
+        for skill, prereqs in prerequisites.items():
+            for prereq in prereqs:
+                dependents[prereq].append(skill)
+                indegree[skill] += 1
+        ready = [(rank[skill], skill) for skill, count in indegree.items() if not count]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, skill = heapq.heappop(ready)
+            order.append(skill)
+            for dependent in dependents[skill]:
+                indegree[dependent] -= 1
+                if not indegree[dependent]:
+                    heapq.heappush(ready, (rank[dependent], dependent))
+
+        blocked = sorted((skill for skill, count in indegree.items() if count),
+                         key=rank.__getitem__)
+        cycles = self._prerequisite_cycles(blocked, prerequisites)
+        dag = LearningDag(
+            career=career_key,
+            order=tuple(order + blocked),
+            prerequisites=MappingProxyType(prerequisites),
+            cycles=tuple(cycles)
+        )
+        dags[career_key] = dag
+        return dag
+
+    @staticmethod
+    def _prerequisite_cycles(blocked, prerequisites):
+        """Distinct cycles among the skills Kahn's algorithm could not order"""
+        remaining = set(blocked)
+        cycles = []
+        seen = set()
+        for start in blocked:
+            if start in seen:
+                continue
+            # Ikuti prasyarat yang juga terblokir sampai ada skill yang berulang
+            path, position = [], {}
+            skill = start
+            while skill not in position and skill not in seen:
+                position[skill] = len(path)
+                path.append(skill)
+                skill = next(p for p in prerequisites[skill] if p in remaining)
+            if skill in position:
+                cycles.append(tuple(path[position[skill]:]) + (skill,))
+            seen.update(path)
+        return cycles
+
+    def learning_plan(self, career_key, missing_skills, user_skills):
+        """Missing skills plus unmet prerequisites in learning order
+
+        Returns (skill, prerequisite_for) pairs; prerequisite_for lists the planned
+        skills that need it and is empty for the career's own missing skills.
+        """
+        dag = self.learning_dag(career_key)
+        needed_by = {skill: [] for skill in missing_skills}
+        stack = list(missing_skills)
+        while stack:
+            skill = stack.pop()
+            for prereq in dag.prerequisites.get(skill, ()):
+                if prereq in user_skills:
+                    continue
+                if prereq not in needed_by:
+                    needed_by[prereq] = []
+                    stack.append(prereq)
+                if skill not in needed_by[prereq] and prereq not in missing_skills:
+                    needed_by[prereq].append(skill)
+        return [(skill, sorted(needed_by[skill], key=dag.order.index))
+                for skill in dag.order if skill in needed_by]
+
+    @staticmethod
+    def learning_schedule(skill_hours, hours_per_week):
+        """Pack (skill, hours) pairs in order into months of hours_per_week study
+
+        Returns a list of LearningMonth, or None when hours_per_week is unknown.
+        """
+        if not hours_per_week or hours_per_week <= 0:
+            return None
+        capacity = hours_per_week * WEEKS_PER_MONTH
+        months = []
+        remaining = 0.0
+        for skill, hours in skill_hours:
+            left = hours
+            while left > 1e-9:
+                if remaining <= 1e-9:
+                    months.append(LearningMonth(month=len(months) + 1, hours=0.0, skills=[]))
+                    remaining = capacity
+                spent = min(left, remaining)
+                month = months[-1]
+                if skill not in month.skills:
+                    month.skills.append(skill)
+                month.hours = round(month.hours + spent, 2)
+                left -= spent
+                remaining -= spent
+        return months
+
+    def build_roadmap(self, user_data, recommendation):
+        """Compute the learning roadmap for one recommendation without printing
+
+        With a result cache enabled the returned Roadmap may be shared; treat it as read-only.
+        """
+        cache = self._cached_result_store()
+        if cache is None:
+            return self._build_roadmap(user_data, recommendation)
+
+        key = ('roadmap', recommendation['career'], recommendation['score'],
+               tuple(recommendation['missing_skills']),
+               tuple(recommendation['emerging_gaps']),
+               user_data['constraints'].get('time_availability'),
+               profile_fingerprint(self, user_data))
+        roadmap = cache.get(key)
+        if roadmap is MISS:
+            roadmap = self._build_roadmap(user_data, recommendation)
+            cache.set(key, roadmap)
+        return roadmap
+
+    def _build_roadmap(self, user_data, recommendation):
+        career_key = recommendation['career']
         details = recommendation['details']
-        salary_idr = details['avg_salary'] * \
-            15000  # Convert to approximate IDR
-        salary_formatted = f"Rp {salary_idr:,.0f}".replace(',', '.')
-        print(
-            f"💰 OUTLOOK: Gaji {salary_formatted}/tahun | Growth {details['growth_rate']*100:.1f}%")
 
         # Budget compatibility info
         user_budget = user_data['constraints']['financial_investment']
         estimated_cost = self.estimate_career_cost(details)
-
         if estimated_cost == 0:
-            cost_info = "🎓 GRATIS (Sekolah Kedinasan)"
+            budget_status = 'free'
         elif user_budget >= estimated_cost:
-            cost_info = "✅ Budget mencukupi"
+            budget_status = 'sufficient'
         elif user_budget >= estimated_cost * 0.5:
-            cost_info = "⚠️ Budget terbatas (perlu bantuan beasiswa)"
+            budget_status = 'limited'
         else:
-            cost_info = "❌ Budget tidak mencukupi (perlu alternatif)"
-
-        estimated_cost_formatted = f"Rp {estimated_cost:,.0f}".replace(
-            ',', '.')
-        print(f"💰 ESTIMASI BIAYA: {estimated_cost_formatted} - {cost_info}")
-
-        # REKOMENDASI JURUSAN DAN UNIVERSITAS - DIPINDAH KE SINI
-        self.display_university_recommendations(recommendation, user_budget)
-
-        if not missing:
-            print("\n✅ You have all the core required skills!")
-            print("👉 Focus on emerging skills:", ", ".join(
-                recommendation['emerging_gaps']))
+            budget_status = 'insufficient'
+
+        resources_db = self.get_learning_resources()
+        dag = self.learning_dag(career_key)
+        skill_plans = []
+        for skill, needed_by in self.learning_plan(
+                career_key, recommendation['missing_skills'], user_data['skills']):
+            data = resources_db.get(skill, {})
+            steps = list(data.get('steps', []))
+            skill_plans.append(SkillPlan(
+                skill=skill,
+                display_name=skill.replace('_', ' ').title(),
+                steps=steps,
+                resources=list(data.get('resources', [])),
+                hours=(len(steps) * STUDY_HOURS_PER_STEP if steps
+                       else DEFAULT_SKILL_STUDY_HOURS),
+                prerequisite_for=needed_by
+            ))
+
+        constraints = user_data['constraints']
+        schedule = self.learning_schedule(
+            [(plan.skill, plan.hours) for plan in skill_plans],
+            constraints.get('time_availability'))
+
+        return Roadmap(
+            career=career_key,
+            career_name=career_key.replace('_', ' ').title(),
+            score=recommendation['score'],
+            salary_idr=details['avg_salary'] * 15000,  # Convert to approximate IDR
+            growth_rate=details['growth_rate'],
+            estimated_cost_idr=estimated_cost,
+            budget_status=budget_status,
+            majors=self.major_recommendation(career_key),
+            universities=self.university_options(recommendation, user_budget),
+            skill_plans=skill_plans,
+            emerging_gaps=list(recommendation['emerging_gaps']),
+            schedule=schedule or [],
+            study_hours=sum(plan.hours for plan in skill_plans),
+            months_needed=len(schedule) if schedule is not None else None,
+            timeline_months=constraints.get('timeline_months'),
+            dependency_cycles=[list(cycle) for cycle in dag.cycles]
+        )
+
+    def generate_learning_roadmap(self, user_data, recommendation, renderer=None):
+        """Build the roadmap and render it (console by default); returns the Roadmap"""
+        roadmap = self.build_roadmap(user_data, recommendation)
+        (renderer or ConsoleRenderer()).render_roadmap(roadmap)
+        return roadmap
+
+
+def main(argv=None):
+    """Command line entry point: interactive advisor or non-interactive batch mode"""
+    parser = argparse.ArgumentParser(description="Career Path Advisor")
+    subcommands = parser.add_subparsers(dest='command')
+    batch = subcommands.add_parser(
+        'batch', help="score profiles from a JSONL file without prompts")
+    batch.add_argument('--in', dest='input', default='-',
+                       help="input JSONL file with one profile per line ('-' = stdin)")
+    batch.add_argument('--out', dest='output', default='-',
+                       help="output JSONL file for results ('-' = stdout)")
+    batch.add_argument('--top-n', type=int, default=3,
+                       help="number of recommendations per profile")
+    batch.add_argument('--chunk-size', type=int, default=1000,
+                       help="profiles scored per vectorized batch")
+    batch.add_argument('--progress-every', type=int, default=10000,
+                       help="report progress every N profiles (0 = off)")
+    batch.add_argument('--workers', type=int, default=1,
+                       help="worker processes (0 = one per CPU core)")
+    batch.add_argument('--result-cache', metavar='PATH',
+                       help="persistent SQLite result cache shared by all workers")
+    batch.add_argument('--prior-weight', type=float, default=0.0,
+                       help="blend the job market prior into the ranking (0 = match only)")
+    serve = subcommands.add_parser(
+        'serve', help="run the asyncio HTTP service (POST /recommend)")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8080)
+    serve.add_argument('--max-batch', type=int, default=256,
+                       help="maximum profiles coalesced into one scoring call")
+    serve.add_argument('--max-delay-ms', type=float, default=5.0,
+                       help="how long to wait for more requests before scoring")
+    serve.add_argument('--max-queue', type=int, default=4096,
+                       help="queued requests before answering 503")
+    serve.add_argument('--instrument', action='store_true',
+                       help="record per-stage timings (GET /metrics, /metrics/prometheus)")
+    profile = subcommands.add_parser(
+        'profile', help="run one profile through cProfile and print the hot spots")
+    profile.add_argument('--in', dest='input', required=True,
+                         help="JSON file with one profile (same shape as a batch line)")
+    profile.add_argument('--top-n', type=int, default=3)
+    profile.add_argument('--sort', default='cumulative',
+                         help="pstats sort key (cumulative, tottime, ncalls, ...)")
+    profile.add_argument('--limit', type=int, default=30, help="rows to print")
+    compact = subcommands.add_parser(
+        'cache-compact', help="drop stale entries from a SQLite result cache and VACUUM it")
+    compact.add_argument('--path', required=True, help="SQLite result cache file")
+    compact.add_argument('--max-entries', type=int, default=1000000)
+    extract = subcommands.add_parser(
+        'extract', help="extract a skills dict from a CV or transcript text file")
+    extract.add_argument('--in', dest='input', default='-',
+                         help="text file to scan ('-' = stdin)")
+    extract.add_argument('--chunk-size', type=int, default=1 << 20,
+                         help="characters read per chunk")
+    export = subcommands.add_parser(
+        'export', help="score a JSONL cohort into a columnar Arrow/Parquet/.npz file")
+    export.add_argument('--in', dest='input', default='-',
+                        help="input JSONL file with one profile per line ('-' = stdin)")
+    export.add_argument('--out', dest='output', required=True,
+                        help="output file (.arrow, .parquet or .npz)")
+    export.add_argument('--format', default='auto', choices=('auto', 'arrow', 'parquet', 'npz'))
+    export.add_argument('--top-n', type=int, default=3)
+    export.add_argument('--chunk-size', type=int, default=10000,
+                        help="profiles scored per vectorized batch")
+    export.add_argument('--prior-weight', type=float, default=0.0,
+                        help="blend the job market prior into the ranking (0 = match only)")
+    analytics = subcommands.add_parser(
+        'analytics', help="aggregate cohort files or batch output into career/skill-gap views")
+    analytics.add_argument('inputs', nargs='+',
+                           help="cohort files from 'export' or JSONL output from 'batch'")
+    analytics.add_argument('--state', metavar='PATH',
+                           help="saved aggregates (.npz); new inputs are added to it")
+    analytics.add_argument('--top-skills', type=int, default=10)
+    analytics.add_argument('--json', metavar='PATH', help="also write the report as JSON")
+    rescore = subcommands.add_parser(
+        'rescore', help="keep a per-profile score store in sync with catalog changes")
+    rescore.add_argument('--store', required=True, help="score store file (.npz)")
+    rescore.add_argument('--in', dest='input',
+                         help="build a new store from this profile JSONL file")
+    rescore.add_argument('--top-n', type=int, default=3)
+    rescore.add_argument('--prior-weight', type=float, default=0.0,
+                         help="blend the job market prior into the ranking (0 = match only)")
+    rescore.add_argument('--out', dest='output',
+                         help="also write every stored top-N as batch-style JSONL")
+    args = parser.parse_args(argv)
+
+    if args.command == 'rescore':
+        from career_batch import iter_profiles, serialize_recommendation
+        from career_rescore import ScoreStore
+        advisor = CareerPathAdvisor()
+        advisor.ranking = RankingModel(prior_weight=args.prior_weight)
+        if args.input:
+            profiles, ids = [], []
+            with open(args.input, encoding='utf-8') as f:
+                for _, profile in iter_profiles(f):
+                    if isinstance(profile, dict):
+                        profiles.append(advisor.normalize_profile(profile))
+                        ids.append(profile.get('id'))
+            store = ScoreStore.build(advisor, profiles, args.top_n, ids)
+            print(f"Scored {len(store)} profiles against {len(store.job_keys)} jobs")
         else:
-            print(
-                f"\n📋 DETAILED ACTION PLAN ({len(missing)} Skills to Learn):")
-
-            for i, skill in enumerate(missing, 1):
-                display_name = skill.replace('_', ' ').title()
-                print(f"\n   [{chr(64+i)}] SKILL: {display_name}")
-
-                if skill in resources_db:
-                    data = resources_db[skill]
-                    print("       🛠️  Steps to Master:")
-                    for step_idx, step in enumerate(data['steps'], 1):
-                        print(f"          {step_idx}. {step}")
-                    print("       📚 Recommended Resources:")
-                    for res in data['resources']:
-                        print(f"          • {res}")
-                else:
-                    print("       ⚠️  General Advice:")
-                    print(
-                        f"          1. Search for '{display_name} beginner course' on Udemy/Coursera")
-                    print(
-                        f"          2. Build a small project using {display_name}")
-
-        print("-" * 70)
-
+            store = ScoreStore.load(args.store)
+            stats = store.rescore(advisor)
+            print(f"{'Full' if stats['full'] else 'Delta'} re-score: "
+                  f"{len(stats['added'])} added, {len(stats['changed'])} changed, "
+                  f"{len(stats['removed'])} removed jobs; {stats['rescored_cells']} scores "
+                  f"recomputed, {stats['reranked_profiles']} of {len(store)} top-N lists re-ranked")
+        store.save(args.store)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                for index, profile_id in enumerate(store.profile_ids):
+                    recommendations = [serialize_recommendation(rec)
+                                       for rec in store.recommendations(advisor, index)]
+                    f.write(json.dumps({'id': profile_id, 'recommendations': recommendations},
+                                       ensure_ascii=False) + '\n')
+        return
+
+    if args.command == 'analytics':
+        from career_analytics import print_report, update_analytics
+        cohort = update_analytics(args.inputs, args.state, CareerPathAdvisor().job_market)
+        report = cohort.report(args.top_skills)
+        print_report(report)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        return
+
+    if args.command == 'export':
+        from career_batch import export_columnar
+        export_columnar(args.input, args.output, top_n=args.top_n,
+                        chunk_size=args.chunk_size, format=args.format,
+                        ranking=RankingModel(prior_weight=args.prior_weight))
+        return
+
+    if args.command == 'extract':
+        import sys
+        advisor = CareerPathAdvisor()
+        if args.input == '-':
+            stream = sys.stdin
+            skills = advisor.extract_skills(iter(lambda: stream.read(args.chunk_size), ''))
+        else:
+            skills = advisor.skill_extractor().extract_file(args.input, args.chunk_size)
+        print(json.dumps(skills, ensure_ascii=False, indent=2))
+        return
+
+    if args.command == 'cache-compact':
+        cache = SQLiteResultCache(args.path, max_entries=args.max_entries)
+        cache.bind_version(CareerPathAdvisor().result_cache_version())
+        removed = cache.compact()
+        print(f"Removed {removed} entries, {len(cache)} left in {args.path}")
+        return
+
+    if args.command == 'profile':
+        advisor = CareerPathAdvisor()
+        with open(args.input, encoding='utf-8') as f:
+            user_data = advisor.normalize_profile(json.load(f))
+        _, report = advisor.profile_request(user_data, args.top_n, args.sort, args.limit)
+        print(report)
+        return
+
+    if args.command == 'serve':
+        import asyncio
+        from career_service import serve as run_service
+        try:
+            asyncio.run(run_service(args.host, args.port, max_batch=args.max_batch,
+                                    max_delay=args.max_delay_ms / 1000,
+                                    max_queue=args.max_queue,
+                                    instrument=args.instrument))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.command == 'batch':
+        from career_batch import run_batch
+        run_batch(args.input, args.output, top_n=args.top_n,
+                  chunk_size=args.chunk_size, progress_every=args.progress_every,
+                  workers=args.workers, result_cache_path=args.result_cache,
+                  ranking=RankingModel(prior_weight=args.prior_weight))
+        return
 
-if __name__ == "__main__":
     advisor = CareerPathAdvisor()
 
     # Use real user input instead of mock data
@@ -1419,3 +1781,7 @@ if __name__ == "__main__":
 
     for i, match in enumerate(top_matches, 1):
         advisor.generate_learning_roadmap(user_profile, match)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from career_tc import CareerPathAdvisor  # noqa: E402
+
+
+@pytest.fixture
+def advisor():
+    return CareerPathAdvisor()
+
+
+@pytest.fixture
+def profile():
+    return {
+        'skills': {'python': 0.8, 'sql': 0.6, 'statistics': 0.5},
+        'experience': {'python': 2},
+        'interests': ['technology'],
+        'career_goals': ['growth'],
+        'constraints': {'time_availability': 20, 'financial_investment': 5000000,
+                        'timeline_months': 12},
+        'preferences': {'work_environment': ['remote']},
+    }
+
+
+@pytest.fixture
+def profiles(advisor):
+    """Seeded synthetic cohort: random skills/levels, budgets, timelines, environments"""
+    vocabulary = sorted({skill for job in advisor.job_market.values()
+                         for skill in job['required_skills']} | set(advisor.skill_graph)
+                        | {'unknown_skill'})
+    environments = ['office', 'remote', 'hybrid', 'flexible', 'field_work']
+    rng = random.Random(7)
+    return [{
+        'skills': {skill: rng.choice([0.0, 0.3, 0.49, 0.5, 0.6, 0.9, 1.0])
+                   for skill in rng.sample(vocabulary, rng.randint(0, 8))},
+        'experience': {},
+        'interests': [],
+        'career_goals': [],
+        'constraints': {'time_availability': rng.choice([5, 10, 20]),
+                        'financial_investment': rng.choice([0, 1e6, 6e6, 1.5e7, 3e7, 1e8]),
+                        'timeline_months': rng.choice([6, 12, 24, 36, 60])},
+        'preferences': {'work_environment': rng.sample(environments, rng.randint(0, 2))},
+    } for _ in range(150)]
@@ -0,0 +1,68 @@
+import io
+import json
+import shutil
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from career_analytics import CohortAnalytics, update_analytics  # noqa: E402
+from career_batch import export_columnar  # noqa: E402
+
+
+def write_cohort(advisor, profiles, path):
+    source = path.with_suffix('.jsonl')
+    source.write_text("".join(json.dumps(user_data) + "\n" for user_data in profiles))
+    export_columnar(str(source), str(path), format='npz', progress_every=0,
+                    advisor=advisor, progress_stream=io.StringIO())
+    return path
+
+
+def test_same_name_from_another_directory(advisor, profiles, tmp_path):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+    first = write_cohort(advisor, profiles[:60], tmp_path / 'a' / 'day.npz')
+    second = write_cohort(advisor, profiles[60:], tmp_path / 'b' / 'day.npz')
+    state = tmp_path / 'state.npz'
+    update_analytics([str(first)], state, advisor.job_market, io.StringIO())
+    analytics = update_analytics([str(second)], state, advisor.job_market, io.StringIO())
+    assert analytics.students == len(profiles)
+    assert len({batch['label'] for batch in analytics.batches}) == 2
+
+
+def test_duplicate_content_is_skipped(advisor, profiles, tmp_path):
+    first = write_cohort(advisor, profiles[:60], tmp_path / 'day.npz')
+    copy = tmp_path / 'copy.npz'
+    shutil.copy(first, copy)
+    state = tmp_path / 'state.npz'
+    update_analytics([str(first)], state, advisor.job_market, io.StringIO())
+    log = io.StringIO()
+    analytics = update_analytics([str(first), str(copy)], state, advisor.job_market, log)
+    assert analytics.students == 60
+    assert log.getvalue().count('[skip]') == 2
+
+
+def test_incremental_matches_one_shot(advisor, profiles, tmp_path):
+    parts = [write_cohort(advisor, profiles[i:i + 50], tmp_path / f'day{i}.npz')
+             for i in range(0, len(profiles), 50)]
+    state = tmp_path / 'state.npz'
+    for part in parts:
+        incremental = update_analytics([str(part)], state, advisor.job_market, io.StringIO())
+    whole = update_analytics([str(part) for part in parts], None, advisor.job_market,
+                             io.StringIO())
+    report, expected = incremental.report(), whole.report()
+    assert report['careers'] == pytest.approx(expected['careers'])
+    assert report['skill_gaps'] == expected['skill_gaps']
+    assert report['budget_coverage'] == expected['budget_coverage']
+
+
+def test_results_and_cohort_agree(advisor, profiles, tmp_path):
+    cohort = write_cohort(advisor, profiles, tmp_path / 'day.npz')
+    from_file = update_analytics([str(cohort)], None, advisor.job_market, io.StringIO())
+    from_results = CohortAnalytics(advisor.job_market)
+    from_results.add_results({'recommendations': recommendations}
+                             for recommendations in advisor.recommend_paths_batch(
+                                 [advisor.normalize_profile(p) for p in profiles]))
+    assert [(row['career'], row['recommendations']) for row in from_file.career_demand()] == \
+        [(row['career'], row['recommendations']) for row in from_results.career_demand()]
+    assert from_file.students == from_results.students == len(profiles)
@@ -0,0 +1,85 @@
+import io
+import json
+
+import pytest
+
+from career_batch import recommend_paths_parallel, run_batch
+from career_tc import RankingModel, main
+
+
+@pytest.fixture
+def jsonl(tmp_path, profiles):
+    lines = [json.dumps(dict(user_data, id=f"p{i}")) for i, user_data in enumerate(profiles)]
+    lines[5] = '{not json'
+    lines[9] = '[1, 2]'
+    lines.insert(20, '')
+    lines[30] = json.dumps({'id': 'broken', 'skills': 42})
+    path = tmp_path / 'profiles.jsonl'
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return path
+
+
+def read_results(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def batch_output(advisor, jsonl, tmp_path, **options):
+    output = tmp_path / f"out-{len(list(tmp_path.iterdir()))}.jsonl"
+    progress = run_batch(str(jsonl), str(output), advisor=advisor, progress_every=0,
+                         progress_stream=io.StringIO(), **options)
+    return progress, read_results(output)
+
+
+def test_results_follow_input_order(advisor, jsonl, tmp_path, profiles):
+    progress, results = batch_output(advisor, jsonl, tmp_path)
+    assert progress.count == len(profiles)
+    assert progress.errors == 3
+    assert [result['line'] for result in results] == \
+        [i for i in range(1, len(profiles) + 2) if i != 21]
+    errors = {result['line']: result['error'] for result in results if 'error' in result}
+    assert errors[6].startswith('invalid JSON')
+    assert errors[10] == 'profile must be a JSON object'
+    assert errors[31].startswith('invalid profile')
+
+
+def test_recommendations_match_advisor(advisor, jsonl, tmp_path):
+    _, results = batch_output(advisor, jsonl, tmp_path, top_n=4)
+    for result, line in zip(results, [line for line in jsonl.read_text().splitlines() if line]):
+        if 'error' in result:
+            continue
+        expected = advisor.recommend_paths(advisor.normalize_profile(json.loads(line)), 4)
+        assert result['id'] == json.loads(line)['id']
+        # missing_skills tetap dalam urutan katalog, bukan diurutkan ulang
+        assert [(rec['career'], rec['score'], rec['missing_skills'], rec['emerging_gaps'])
+                for rec in result['recommendations']] == \
+            [(rec['career'], rec['score'], list(rec['missing_skills']),
+              list(rec['emerging_gaps'])) for rec in expected]
+
+
+def test_chunk_size_does_not_change_output(advisor, jsonl, tmp_path):
+    _, whole = batch_output(advisor, jsonl, tmp_path, chunk_size=1000)
+    _, small = batch_output(advisor, jsonl, tmp_path, chunk_size=7)
+    assert small == whole
+    with pytest.raises(ValueError):
+        batch_output(advisor, jsonl, tmp_path, chunk_size=0)
+
+
+def test_cli(advisor, jsonl, tmp_path, capsys):
+    output = tmp_path / 'cli.jsonl'
+    main(['batch', '--in', str(jsonl), '--out', str(output), '--progress-every', '0'])
+    _, expected = batch_output(advisor, jsonl, tmp_path)
+    assert read_results(output) == expected
+
+
+def test_workers_match_serial_output(advisor, jsonl, tmp_path):
+    _, serial = batch_output(advisor, jsonl, tmp_path, chunk_size=16)
+    _, parallel = batch_output(None, jsonl, tmp_path, chunk_size=16, workers=2)
+    assert parallel == serial
+
+
+def test_recommend_paths_parallel(advisor, profiles):
+    user_profiles = [advisor.normalize_profile(user_data) for user_data in profiles]
+    advisor.ranking = RankingModel(prior_weight=0.05)
+    assert recommend_paths_parallel(user_profiles, 3, chunk_size=20, workers=2,
+                                    advisor=advisor) == \
+        advisor.recommend_paths_batch(user_profiles, 3)
@@ -0,0 +1,29 @@
+import pytest
+
+from career_tc import RankingModel
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.mark.parametrize('top_n', [1, 3, 5, 40])
+def test_batch_matches_scalar(advisor, profiles, top_n):
+    batch = advisor.recommend_paths_batch(profiles, top_n)
+    assert batch == [advisor.recommend_paths(user_data, top_n) for user_data in profiles]
+
+
+def test_batch_matches_scalar_with_market_prior(advisor, profiles):
+    advisor.ranking = RankingModel(prior_weight=0.05)
+    batch = advisor.recommend_paths_batch(profiles, 5)
+    assert batch == [advisor.recommend_paths(user_data, 5) for user_data in profiles]
+
+
+@pytest.mark.parametrize('top_n', [0, -1, -20])
+def test_non_positive_top_n_returns_nothing(advisor, profiles, top_n):
+    assert advisor.recommend_paths(profiles[0], top_n) == []
+    assert advisor.recommend_paths_batch(profiles[:3], top_n) == [[], [], []]
+
+
+def test_scores_are_ordered(advisor, profiles):
+    for recommendations in advisor.recommend_paths_batch(profiles, 10):
+        scores = [recommendation['score'] for recommendation in recommendations]
+        assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from career_bench import latency_stats, run_suite, synthetic_profiles
+
+
+def test_synthetic_cohort_is_reproducible(advisor):
+    first = list(synthetic_profiles(advisor, 50, seed=3))
+    assert list(synthetic_profiles(advisor, 50, seed=3)) == first
+    assert list(synthetic_profiles(advisor, 50, seed=4)) != first
+    for user_data in first:
+        assert advisor.normalize_profile(user_data)['skills']
+
+
+def test_benchmarked_paths_agree(advisor):
+    # Benchmark hanya berarti jika jalur yang diukur memberi hasil yang sama
+    cohort = list(synthetic_profiles(advisor, 200, seed=0))
+    assert advisor.recommend_paths_batch(cohort) == \
+        [advisor.recommend_paths(user_data) for user_data in cohort]
+
+
+def test_latency_stats():
+    stats = latency_stats([0.003, 0.001, 0.002, 0.004])
+    assert stats['calls'] == 4
+    assert stats['p50_us'] == pytest.approx(3000)
+    assert stats['max_us'] == pytest.approx(4000)
+    assert latency_stats([]) == {'calls': 0}
+
+
+def test_small_suite_report():
+    report = run_suite(profiles=20, sizes=(100,), chunk_size=30, rounds=1)
+    json.dumps(report)
+    assert report['meta']['profiles'] == 20
+    assert report['throughput']['100']['profiles'] == 100
+    assert set(report['latency']) == {'_calculate_score', 'recommend_paths',
+                                      'generate_learning_roadmap'}
+    assert all(stats['calls'] > 0 for stats in report['latency'].values())
@@ -0,0 +1,138 @@
+import copy
+import sqlite3
+
+from career_cache import MISS, ResultCache, SQLiteResultCache, profile_fingerprint
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cached_results_equal_fresh_results(advisor, profiles):
+    fresh = [advisor.recommend_paths(user_data, 3) for user_data in profiles[:30]]
+    cache = advisor.enable_result_cache()
+    first = [advisor.recommend_paths(user_data, 3) for user_data in profiles[:30]]
+    second = [advisor.recommend_paths(user_data, 3) for user_data in profiles[:30]]
+    assert first == second == fresh
+    assert cache.hits >= 30
+
+
+def test_fingerprint_ignores_irrelevant_details(advisor, profile):
+    reordered = copy.deepcopy(profile)
+    reordered['skills'] = dict(reversed(list(profile['skills'].items())))
+    reordered['skills']['not_a_skill_anywhere'] = 0.9
+    assert profile_fingerprint(advisor, reordered) == profile_fingerprint(advisor, profile)
+    changed = copy.deepcopy(profile)
+    changed['skills']['python'] = 0.2
+    assert profile_fingerprint(advisor, changed) != profile_fingerprint(advisor, profile)
+
+
+def test_catalog_edit_invalidates_cache(advisor, profile):
+    advisor.enable_result_cache()
+    before = advisor.recommend_paths(profile, 3)
+    with advisor.edit_catalog('job_market') as job_market:
+        job_market.pop(before[0]['career'])
+    after = advisor.recommend_paths(profile, 3)
+    assert before[0]['career'] not in [rec['career'] for rec in after]
+    assert advisor.result_cache.invalidations == 1
+
+
+def test_lru_and_ttl():
+    clock = FakeClock()
+    cache = ResultCache(maxsize=2, ttl=10, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is MISS
+    assert cache.evictions == 1
+    clock.now = 11
+    assert cache.get('a') is MISS
+    assert cache.expirations == 1
+
+
+def test_sqlite_cache_is_shared_between_instances(advisor, profiles, tmp_path):
+    path = tmp_path / 'results.sqlite'
+    writer = type(advisor)()
+    writer.enable_result_cache(SQLiteResultCache(path))
+    expected = [writer.recommend_paths(user_data, 3) for user_data in profiles[:20]]
+
+    reader = type(advisor)()
+    cache = reader.enable_result_cache(SQLiteResultCache(path))
+    assert [reader.recommend_paths(user_data, 3) for user_data in profiles[:20]] == expected
+    assert cache.hits == 20 and cache.misses == 0
+
+
+def test_sqlite_cache_separates_catalog_versions(advisor, profile, tmp_path):
+    path = tmp_path / 'results.sqlite'
+    advisor.enable_result_cache(SQLiteResultCache(path))
+    advisor.recommend_paths(profile, 3)
+    edited = type(advisor)()
+    cache = edited.enable_result_cache(SQLiteResultCache(path))
+    with edited.edit_catalog('job_market') as job_market:
+        job_market.popitem()
+    edited.recommend_paths(profile, 3)
+    assert cache.hits == 0
+    assert cache.compact() == 1
+    assert len(cache) == 1
+
+
+def test_sqlite_cache_trims_to_max_entries(tmp_path):
+    cache = SQLiteResultCache(tmp_path / 'results.sqlite', max_entries=3)
+    cache.bind_version('v1')
+    for i in range(5):
+        cache.set(['key', i], i)
+    assert cache.trim() == 2
+    assert len(cache) == 3
+    assert cache.get(['key', 4]) == 4
+
+
+def test_sqlite_cache_hits_do_not_write(tmp_path):
+    cache = SQLiteResultCache(tmp_path / 'results.sqlite', touch_interval=3600)
+    cache.bind_version('v1')
+    cache.set('key', 1)
+    conn = cache._connection()
+    before = conn.total_changes
+    for _ in range(10):
+        assert cache.get('key') == 1
+    assert conn.total_changes == before
+
+
+def test_sqlite_cache_survives_a_locked_database(tmp_path):
+    path = tmp_path / 'results.sqlite'
+    cache = SQLiteResultCache(path, timeout=0.05, touch_interval=0, max_entries=1)
+    cache.bind_version('v1')
+    cache.set('stored', 1)
+    cache.set('other', 2)
+
+    # Koneksi kedua memegang write lock selama cache dipakai
+    holder = sqlite3.connect(str(path), isolation_level=None)
+    holder.execute('BEGIN IMMEDIATE')
+    try:
+        cache.set('new', 3)
+        assert cache.trim() == 0
+        assert cache.get('stored') == 1
+        assert cache.stats()['busy'] == 3
+    finally:
+        holder.execute('ROLLBACK')
+        holder.close()
+    assert cache.get('new') is MISS
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_treats_a_failed_read_as_a_miss(tmp_path, monkeypatch):
+    cache = SQLiteResultCache(tmp_path / 'results.sqlite')
+    cache.bind_version('v1')
+    cache.set('key', 1)
+
+    class LockedConnection:
+        def execute(self, *args):
+            raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(cache, '_connection', LockedConnection)
+    assert cache.get('key') is MISS
+    assert (cache.misses, cache.busy) == (1, 1)
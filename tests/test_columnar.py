@@ -0,0 +1,99 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from career_columnar import MAX_RANK, CohortWriter, open_cohort, pa, resolve_format  # noqa: E402
+
+def formats():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return ['npz']
+    return ['npz', 'arrow', 'parquet']
+
+
+def read_back(table):
+    """Per-profile [(career, score, missing_skills, emerging_gaps), ...] from a cohort file"""
+    careers = table.decode('career', table.columns['career'])
+    lists = {}
+    for name, (offsets, values) in table.lists.items():
+        skills = table.decode('skill', values)
+        lists[name] = [skills[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+    profiles = {}
+    for row, profile_index in enumerate(table.columns['profile_index'].tolist()):
+        profiles.setdefault(profile_index, []).append((
+            careers[row], float(table.columns['score'][row]),
+            lists['missing_skills'][row], lists['emerging_gaps'][row]))
+    return [profiles.get(i, []) for i in range(table.meta['profiles'])]
+
+
+@pytest.mark.parametrize('format', formats())
+def test_round_trip(advisor, profiles, tmp_path, format):
+    user_profiles = [advisor.normalize_profile(user_data) for user_data in profiles]
+    results = advisor.recommend_paths_batch(user_profiles, 4)
+    path = tmp_path / f'cohort.{format}'
+    with CohortWriter(path, advisor, format) as writer:
+        for i, (user_data, recommendations) in enumerate(zip(user_profiles, results)):
+            writer.add(user_data, recommendations, profile_id=f"p{i}",
+                       region='jawa' if i % 2 else None)
+    table = open_cohort(path)
+    assert table.meta['profiles'] == len(profiles)
+    assert table.meta['catalog_version'] == advisor.catalog_version
+    assert read_back(table) == [
+        [(rec['career'], rec['score'], rec['missing_skills'], rec['emerging_gaps'])
+         for rec in recommendations] for recommendations in results]
+    assert set(table.feasibility_by_region()) == {None, 'jawa'}
+
+
+def test_unknown_skills_stay_in_the_writer(advisor, profile, tmp_path):
+    size = len(advisor.skill_vocabulary)
+    recommendation = dict(advisor.recommend_paths(profile, 1)[0],
+                          missing_skills=['basket_weaving'], emerging_gaps=['juggling'])
+    path = tmp_path / 'cohort.npz'
+    with CohortWriter(path, advisor) as writer:
+        writer.add(profile, [recommendation])
+    assert len(advisor.skill_vocabulary) == size
+    table = open_cohort(path)
+    assert read_back(table)[0][0][2:] == (['basket_weaving'], ['juggling'])
+
+
+def test_counts(advisor, profiles, tmp_path):
+    user_profiles = [advisor.normalize_profile(user_data) for user_data in profiles]
+    results = advisor.recommend_paths_batch(user_profiles, 3)
+    path = tmp_path / 'cohort.npz'
+    with CohortWriter(path, advisor) as writer:
+        for user_data, recommendations in zip(user_profiles, results):
+            writer.add(user_data, recommendations)
+    table = open_cohort(path)
+    top = {}
+    for recommendations in results:
+        top[recommendations[0]['career']] = top.get(recommendations[0]['career'], 0) + 1
+    assert table.career_counts(rank=1) == top
+    assert sum(count for _, count in table.missing_skill_counts()) == \
+        sum(len(rec['missing_skills']) for recs in results for rec in recs)
+
+
+@pytest.mark.parametrize('format', formats())
+def test_wide_ranks_and_many_regions(advisor, profile, tmp_path, format):
+    recommendation = advisor.recommend_paths(profile, 1)[0]
+    path = tmp_path / f'cohort.{format}'
+    with CohortWriter(path, advisor, format) as writer:
+        # Lebih dari 255 rank dan 65535 region tidak boleh overflow
+        writer.add(profile, [recommendation] * 300, region='jawa')
+        for i in range(70000):
+            writer.add(profile, [recommendation], region=f'region-{i}')
+        with pytest.raises(ValueError, match='at most'):
+            writer.add(profile, [recommendation] * (MAX_RANK + 1))
+    table = open_cohort(path)
+    assert table.columns['rank'][:300].tolist() == list(range(1, 301))
+    assert table.decode('region', table.columns['region'][-1:]) == ['region-69999']
+    assert len(table) == 300 + 70000
+
+
+def test_resolve_format():
+    assert resolve_format('cohort.npz') == 'npz'
+    with pytest.raises(ValueError):
+        resolve_format('cohort.bin', 'csv')
+    if pa is None:
+        with pytest.raises(ImportError):
+            resolve_format('cohort.parquet')
@@ -0,0 +1,100 @@
+import json
+import pickle
+import shutil
+
+import pytest
+
+from career_data import DATA_DIR, CatalogError, Catalogs, load_catalogs
+from career_tc import CareerPathAdvisor
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    target = tmp_path / 'data'
+    shutil.copytree(DATA_DIR, target, ignore=shutil.ignore_patterns('.cache'))
+    return target
+
+
+def test_cache_round_trip(data_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    fresh = load_catalogs(data_dir, cache_dir)
+    assert isinstance(fresh, Catalogs)
+    assert len(list(cache_dir.glob('catalogs-*.pickle'))) == 1
+    cached = load_catalogs(data_dir, cache_dir)
+    assert cached == fresh
+    assert load_catalogs(data_dir, use_cache=False) == fresh
+
+
+def test_version_follows_content(data_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    before = load_catalogs(data_dir, cache_dir)
+    path = data_dir / 'job_market.json'
+    job_market = json.loads(path.read_text(encoding='utf-8'))
+    next(iter(job_market.values()))['demand_score'] = 0.123
+    path.write_text(json.dumps(job_market), encoding='utf-8')
+    after = load_catalogs(data_dir, cache_dir)
+    assert after.version != before.version
+    assert next(iter(after.data['job_market'].values()))['demand_score'] == 0.123
+    # Cache versi lama dihapus
+    assert len(list(cache_dir.glob('catalogs-*.pickle'))) == 1
+
+
+def test_corrupt_cache_is_rebuilt(data_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    fresh = load_catalogs(data_dir, cache_dir)
+    for path in cache_dir.glob('catalogs-*.pickle'):
+        path.write_bytes(b'not a pickle')
+    assert load_catalogs(data_dir, cache_dir) == fresh
+
+
+class BrokenCatalogs:
+    """Unpickles into Catalogs(version) without data -> TypeError"""
+
+    def __reduce__(self):
+        return (Catalogs, ('stale',))
+
+
+@pytest.mark.parametrize('payload', [
+    b'cno_such_module\nCatalogs\n.',      # ModuleNotFoundError
+    pickle.dumps(BrokenCatalogs()),         # TypeError
+])
+def test_any_unpickling_error_rebuilds_the_cache(data_dir, tmp_path, payload):
+    cache_dir = tmp_path / 'cache'
+    fresh = load_catalogs(data_dir, cache_dir)
+    (cache_path,) = cache_dir.glob('catalogs-*.pickle')
+    cache_path.write_bytes(payload)
+    assert load_catalogs(data_dir, cache_dir) == fresh
+    # Cache yang rusak diganti dengan hasil build ulang
+    with open(cache_path, 'rb') as f:
+        assert pickle.load(f) == fresh
+
+
+def test_malformed_catalog(data_dir, tmp_path):
+    path = data_dir / 'job_market.json'
+    job_market = json.loads(path.read_text(encoding='utf-8'))
+    del next(iter(job_market.values()))['required_skills']
+    path.write_text(json.dumps(job_market), encoding='utf-8')
+    with pytest.raises(CatalogError, match='required_skills'):
+        load_catalogs(data_dir, tmp_path / 'cache')
+    (data_dir / 'job_market.json').write_text('{', encoding='utf-8')
+    with pytest.raises(CatalogError, match='invalid JSON'):
+        load_catalogs(data_dir, tmp_path / 'cache')
+
+
+def test_major_keywords_are_a_versioned_catalog(data_dir, tmp_path):
+    before = load_catalogs(data_dir, tmp_path / 'cache')
+    path = data_dir / 'major_keywords.json'
+    keywords = json.loads(path.read_text(encoding='utf-8'))
+    del keywords['keyword_aliases']['informatika']
+    keywords['stopwords'].append('komputer')
+    path.write_text(json.dumps(keywords), encoding='utf-8')
+    after = load_catalogs(data_dir, tmp_path / 'cache')
+    assert after.version != before.version
+
+    # Subclass punya snapshot sendiri yang dibaca dari data_dir salinan
+    edited = type('EditedAdvisor', (CareerPathAdvisor,), {'data_dir': data_dir})()
+    base = CareerPathAdvisor()
+    assert edited.catalog_version != base.catalog_version
+    assert 'computer' in base._major_tokens('Teknik Informatika')
+    assert edited._major_tokens('Ilmu Komputer') == set()
+    assert edited.university_relevance != base.university_relevance
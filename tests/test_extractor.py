@@ -0,0 +1,37 @@
+import pytest
+
+CV = (
+    "Experienced in Python (advanced) and machine learning. Basic SQL; intermediate "
+    "project management.\nBeginner at data-analysis. Expert communication skills.\n"
+    "Coding since 2015, some web development; excellent Excel.\n"
+)
+
+
+def chunks(text, size):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+def test_extracts_skills_and_levels(advisor):
+    skills = advisor.extract_skills(CV)
+    assert skills['python'] == 0.9
+    assert skills['sql'] == 0.3
+    assert skills['project_management'] == 0.6
+    assert skills['machine_learning'] == 0.5
+    assert skills['communication'] == 0.9
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 5, 7, 16, 64])
+def test_chunking_does_not_change_the_result(advisor, size):
+    assert advisor.extract_skills(chunks(CV, size)) == advisor.extract_skills(CV)
+
+
+def test_extract_file(advisor, tmp_path):
+    path = tmp_path / 'cv.txt'
+    path.write_text(CV * 50, encoding='utf-8')
+    extractor = advisor.skill_extractor()
+    assert extractor.extract_file(path, chunk_size=11) == advisor.extract_skills(CV * 50)
+
+
+def test_level_words_do_not_cross_sentences(advisor):
+    skills = advisor.extract_skills("I know Python. Expert\nin nothing else")
+    assert skills['python'] == 0.5
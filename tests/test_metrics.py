@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from career_metrics import Instrumentation
+from career_service import CareerService, InProcessClient
+
+
+def test_instrumented_results_are_unchanged(advisor, profiles):
+    expected = [advisor.recommend_paths(user_data) for user_data in profiles[:20]]
+    instrumentation = advisor.enable_instrumentation()
+    assert [advisor.recommend_paths(user_data) for user_data in profiles[:20]] == expected
+    snapshot = instrumentation.snapshot()
+    assert snapshot['recommend_paths']['calls'] == 20
+    assert snapshot['_score_record']['calls'] >= 20
+
+
+def test_disable_removes_the_wrappers(advisor, profile):
+    instrumentation = advisor.enable_instrumentation()
+    assert advisor.disable_instrumentation() is instrumentation
+    advisor.recommend_paths(profile)
+    assert instrumentation.snapshot() == {}
+    assert 'recommend_paths' not in advisor.__dict__
+
+
+def test_errors_are_counted(advisor):
+    instrumentation = advisor.enable_instrumentation()
+    with pytest.raises(KeyError):
+        advisor.recommend_paths({'skills': {}})
+    assert instrumentation.snapshot()['recommend_paths']['errors'] == 1
+
+
+def test_prometheus_histogram():
+    instrumentation = Instrumentation(stages=('stage',))
+    for seconds in (0.00002, 0.0002, 0.2):
+        instrumentation.record('stage', seconds)
+    text = instrumentation.to_prometheus()
+    assert 'career_advisor_stage_seconds_bucket{stage="stage",le="+Inf"} 3' in text
+    assert 'career_advisor_stage_seconds_count{stage="stage"} 3' in text
+
+
+def test_service_exposes_stages(advisor, profile):
+    client = InProcessClient(CareerService(advisor, instrument=True))
+    asyncio.run(client.post('/recommend', {'profile': profile, 'roadmap': False}))
+    status, payload = asyncio.run(client.get('/metrics'))
+    assert status == 200 and payload['stages']['recommend_paths_batch']['calls'] == 1
+    status, text = asyncio.run(client.get('/metrics/prometheus'))
+    assert status == 200 and 'recommend_paths_batch' in text
@@ -0,0 +1,48 @@
+from career_tc import SIMILARITY_RESOLUTION
+
+
+def test_sparse_credit_matches_dense_matrix(advisor):
+    skill_names = list(advisor.skill_ids)
+    for source, row_id in advisor.graph_skill_ids.items():
+        dense = {skill_names[i]: credit
+                 for i, credit in enumerate(advisor.skill_similarity[row_id]) if credit}
+        assert dict(advisor.skill_credit.get(source, ())) == dense
+
+
+def test_credit_is_floored_and_bounded(advisor):
+    for credits in advisor.skill_credit.values():
+        for _, credit in credits:
+            assert 0 < credit < 1
+            assert credit * SIMILARITY_RESOLUTION == int(credit * SIMILARITY_RESOLUTION)
+
+
+def test_partial_credit_only_for_missing_skills(advisor):
+    credit = advisor._partial_credit({'python': 1.0, 'programming': 0.7})
+    assert 'python' not in credit and 'programming' not in credit
+    assert credit['data_analysis'] > 0
+
+
+def test_related_skill_raises_the_score(advisor, profile):
+    profile['skills'] = {}
+    without = {rec['career']: rec['score']
+               for rec in advisor.recommend_paths(profile, len(advisor.job_index))}
+    profile['skills'] = {'python': 1.0}
+    with_related = {rec['career']: rec['score']
+                    for rec in advisor.recommend_paths(profile, len(advisor.job_index))}
+    gaining = [career for career, record in advisor.job_index.items()
+               if 'python' not in record.skills
+               and any(skill in advisor._partial_credit({'python': 1.0})
+                       for skill in record.skills)]
+    assert gaining
+    for career in gaining:
+        assert with_related[career] > without[career]
+
+
+def test_direct_match_beats_partial_credit(advisor, profile):
+    record = next(record for record in advisor.job_index.values()
+                  if 'programming' in record.skills)
+    profile['skills'] = {'python': 1.0}
+    related = advisor._score_record(record, advisor._user_context(profile))
+    profile['skills'] = {'python': 1.0, 'programming': 1.0}
+    direct = advisor._score_record(record, advisor._user_context(profile))
+    assert direct > related
@@ -0,0 +1,53 @@
+import pytest
+
+from career_tc import PRIOR_SCALE, RankingModel
+
+
+def test_priors_are_weighted_components(advisor):
+    priors = advisor.job_priors()
+    assert len(priors) == len(advisor._job_records)
+    assert all(0.0 <= prior <= 1.0 for prior in priors)
+    demand_only = advisor.job_priors(RankingModel(demand=1, growth=0, salary=0, trend=0))
+    for record, prior in zip(advisor._job_records, demand_only):
+        assert prior == pytest.approx(min(1.0, max(0.0, record.details['demand_score'])))
+    assert advisor.job_priors() is priors
+
+
+def test_default_ranking_is_match_only(advisor, profile):
+    assert advisor.ranking_bonus() is None
+    recommendations = advisor.recommend_paths(profile, 5)
+    scores = [rec['score'] for rec in recommendations]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_prior_blends_into_the_order(advisor, profile):
+    ranking = RankingModel(prior_weight=0.1)
+    bonus = advisor.ranking_bonus(ranking)
+    assert bonus == pytest.approx([0.1 * PRIOR_SCALE * prior
+                                   for prior in advisor.job_priors(ranking)])
+    advisor.ranking = ranking
+    recommendations = advisor.recommend_paths(profile, len(advisor.job_index))
+    keys = [rec['score'] + bonus[advisor.job_ids[rec['career']]] for rec in recommendations]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_market_edit_changes_the_prior(advisor):
+    ranking = RankingModel(prior_weight=0.1)
+    career = next(iter(advisor.job_market))
+    before = advisor.job_prior(career, ranking)
+    with advisor.edit_catalog('job_market') as job_market:
+        job_market[career]['demand_score'] = 0.0
+    assert advisor.job_prior(career, ranking) < before
+
+
+def test_ranking_is_part_of_the_cache_key(advisor, profile):
+    default_key = advisor._paths_cache_key(profile, 3)
+    advisor.ranking = RankingModel(prior_weight=0.1)
+    assert advisor._paths_cache_key(profile, 3) != default_key
+    advisor.enable_result_cache()
+    blended = advisor.recommend_paths(profile, 3)
+    advisor.ranking = RankingModel()
+    assert advisor._paths_cache_key(profile, 3) == default_key
+    assert advisor.recommend_paths(profile, 3) == type(advisor)().recommend_paths(profile, 3)
+    advisor.ranking = RankingModel(prior_weight=0.1)
+    assert advisor.recommend_paths(profile, 3) == blended
@@ -0,0 +1,38 @@
+from career_records import UNKNOWN_SKILL_ID
+
+
+def test_compact_profile_round_trip(advisor, profile):
+    assert advisor.expand_profile(advisor.compact_profile(profile)) == profile
+
+
+def test_unknown_skills_keep_their_order(advisor, profile):
+    profile['skills'] = {'python': 0.8, 'basket_weaving': 0.3, 'sql': 0.6, 'juggling': 0.1}
+    profile['experience'] = {'juggling': 4, 'python': 2}
+    compact = advisor.compact_profile(profile)
+    assert UNKNOWN_SKILL_ID in compact.skill_ids
+    expanded = advisor.expand_profile(compact)
+    assert list(expanded['skills'].items()) == list(profile['skills'].items())
+    assert list(expanded['experience'].items()) == list(profile['experience'].items())
+
+
+def test_shared_vocabulary_does_not_grow(advisor):
+    vocabulary = advisor.skill_vocabulary
+    size = len(vocabulary)
+    for i in range(70000):
+        assert vocabulary.id_of(f"unknown-{i}") == UNKNOWN_SKILL_ID
+    assert len(vocabulary) == size
+    assert len(advisor.shared_reference_data()['skill_vocabulary']) == size
+
+
+def test_extended_vocabulary_is_private(advisor):
+    extended = advisor.skill_vocabulary.extended()
+    skill_id = extended.id_of('basket_weaving')
+    assert skill_id == len(advisor.skill_vocabulary)
+    assert extended.name_of(skill_id) == 'basket_weaving'
+    assert advisor.skill_vocabulary.get('basket_weaving') is None
+
+
+def test_compact_recommendations_round_trip(advisor, profile):
+    recommendations = advisor.recommend_paths(profile)
+    compact = advisor.compact_recommendations(recommendations)
+    assert advisor.expand_recommendations(compact) == recommendations
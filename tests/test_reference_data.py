@@ -0,0 +1,37 @@
+import pytest
+
+from career_tc import CareerPathAdvisor
+
+
+def test_advisors_share_one_snapshot(advisor):
+    other = CareerPathAdvisor()
+    assert other.job_index is advisor.job_index
+    assert other.job_market is advisor.job_market
+    assert other.skill_vocabulary is advisor.skill_vocabulary
+
+
+def test_catalogs_are_read_only(advisor):
+    job_key = next(iter(advisor.job_market))
+    with pytest.raises(TypeError):
+        advisor.job_market[job_key] = {}
+    with pytest.raises((TypeError, AttributeError)):
+        advisor.job_market[job_key]['required_skills'].append('python')
+
+
+def test_edit_catalog_is_private_to_one_advisor(advisor, profile):
+    other = CareerPathAdvisor()
+    before = other.recommend_paths(profile)
+    version = advisor.catalog_version
+    with advisor.edit_catalog('job_market') as job_market:
+        job_market.pop(before[0]['career'])
+    assert advisor.catalog_version != version
+    assert before[0]['career'] not in advisor.job_index
+    assert before[0]['career'] not in [rec['career'] for rec in advisor.recommend_paths(profile)]
+    assert other.recommend_paths(profile) == before
+    assert CareerPathAdvisor().job_index is other.job_index
+
+
+def test_unknown_catalog_edit(advisor):
+    with pytest.raises(KeyError):
+        with advisor.edit_catalog('weather'):
+            pass
@@ -0,0 +1,42 @@
+import io
+import json
+from contextlib import redirect_stdout
+from dataclasses import asdict
+
+import pytest
+
+from career_report import ConsoleRenderer, get_renderer
+
+
+def test_building_a_roadmap_prints_nothing(advisor, profile, capsys):
+    recommendation = advisor.recommend_paths(profile, 1)[0]
+    advisor.build_roadmap(profile, recommendation)
+    assert capsys.readouterr().out == ""
+
+
+def test_text_renderers_agree(advisor, profile):
+    recommendation = advisor.recommend_paths(profile, 1)[0]
+    console = io.StringIO()
+    with redirect_stdout(console):
+        roadmap = advisor.generate_learning_roadmap(profile, recommendation)
+    buffered = get_renderer('text')
+    assert advisor.generate_learning_roadmap(profile, recommendation, buffered) == roadmap
+    assert buffered.getvalue() == console.getvalue()
+    assert roadmap.career_name in console.getvalue()
+
+    stream = io.StringIO()
+    advisor.generate_learning_roadmap(profile, recommendation, ConsoleRenderer(stream))
+    assert stream.getvalue() == console.getvalue()
+
+
+def test_json_renderer(advisor, profile):
+    recommendation = advisor.recommend_paths(profile, 1)[0]
+    stream = io.StringIO()
+    roadmap = advisor.generate_learning_roadmap(profile, recommendation,
+                                                get_renderer('json', stream))
+    assert json.loads(stream.getvalue()) == json.loads(json.dumps(asdict(roadmap)))
+
+
+def test_unknown_renderer():
+    with pytest.raises(ValueError, match='Unknown renderer'):
+        get_renderer('pdf')
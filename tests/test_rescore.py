@@ -0,0 +1,75 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from career_rescore import ScoreStore  # noqa: E402
+from career_tc import RankingModel  # noqa: E402
+
+
+@pytest.fixture
+def user_profiles(advisor, profiles):
+    return [advisor.normalize_profile(user_data) for user_data in profiles]
+
+
+def assert_same_store(store, fresh):
+    assert store.job_keys == fresh.job_keys
+    assert np.array_equal(store.scores, fresh.scores)
+    assert np.array_equal(store.top, fresh.top)
+
+
+def edit_jobs(advisor):
+    with advisor.edit_catalog('job_market') as job_market:
+        keys = list(job_market)
+        job_market[keys[0]]['required_skills'] = ['python', 'sql', 'statistics']
+        job_market[keys[1]]['work_environment'] = ['field_work']
+        job_market['data_engineer_test'] = dict(job_market[keys[2]],
+                                                required_skills=['python', 'sql'])
+        del job_market[keys[3]]
+
+
+def test_delta_rescore_matches_full_rebuild(advisor, user_profiles):
+    store = ScoreStore.build(advisor, user_profiles, top_n=3)
+    edit_jobs(advisor)
+    summary = store.rescore(advisor, chunk_size=40)
+    assert not summary['full']
+    assert summary['added'] == ['data_engineer_test']
+    assert len(summary['removed']) == 1 and len(summary['changed']) == 2
+    assert summary['rescored_cells'] == len(user_profiles) * 3
+    assert_same_store(store, ScoreStore.build(advisor, user_profiles, top_n=3))
+
+
+def test_unchanged_catalog_rescores_nothing(advisor, user_profiles):
+    store = ScoreStore.build(advisor, user_profiles)
+    summary = store.rescore(advisor)
+    assert summary['rescored_cells'] == 0 and summary['reranked_profiles'] == 0
+
+
+def test_prior_change_only_reranks(advisor, user_profiles):
+    advisor.ranking = RankingModel(prior_weight=0.05)
+    store = ScoreStore.build(advisor, user_profiles, top_n=5)
+    with advisor.edit_catalog('job_market') as job_market:
+        next(iter(job_market.values()))['demand_score'] = 0.01
+    summary = store.rescore(advisor)
+    assert summary['rescored_cells'] == 0
+    assert_same_store(store, ScoreStore.build(advisor, user_profiles, top_n=5))
+
+
+def test_store_matches_recommend_paths(advisor, user_profiles):
+    store = ScoreStore.build(advisor, user_profiles, top_n=3)
+    for i, user_data in enumerate(user_profiles):
+        assert store.recommendations(advisor, i) == advisor.recommend_paths(user_data, 3)
+    edit_jobs(advisor)
+    with pytest.raises(ValueError):
+        store.recommendations(advisor, 0)
+
+
+def test_save_and_load(advisor, user_profiles, tmp_path):
+    store = ScoreStore.build(advisor, user_profiles, top_n=3,
+                             profile_ids=[f"p{i}" for i in range(len(user_profiles))])
+    store.save(tmp_path / 'store.npz')
+    loaded = ScoreStore.load(tmp_path / 'store.npz')
+    assert_same_store(loaded, store)
+    assert loaded.profiles == store.profiles and loaded.profile_ids == store.profile_ids
+    edit_jobs(advisor)
+    loaded.rescore(advisor)
+    assert_same_store(loaded, ScoreStore.build(advisor, user_profiles, top_n=3))
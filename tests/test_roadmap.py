@@ -0,0 +1,98 @@
+import pytest
+
+from career_cache import SQLiteResultCache
+from career_tc import SCORING_VERSION
+
+
+def recommendation_with_gaps(advisor, profile):
+    for recommendation in advisor.recommend_paths(profile, len(advisor.job_index)):
+        if recommendation['missing_skills']:
+            return recommendation
+    raise AssertionError("every career is already covered by the profile")
+
+
+def test_skill_plans_follow_prerequisites(advisor, profile):
+    roadmap = advisor.build_roadmap(profile, recommendation_with_gaps(advisor, profile))
+    order = [plan.skill for plan in roadmap.skill_plans]
+    assert len(order) == len(set(order))
+    dag = advisor.learning_dag(roadmap.career)
+    for plan in roadmap.skill_plans:
+        if any(plan.skill in cycle for cycle in dag.cycles):
+            continue
+        for prerequisite in advisor.skill_graph.get(plan.skill, {}).get('prerequisites', ()):
+            if prerequisite in order and prerequisite != plan.skill:
+                assert order.index(prerequisite) < order.index(plan.skill)
+
+
+def test_prerequisite_cycle_is_reported_and_placed_last(advisor, profile):
+    career = 'software_developer'
+    with advisor.edit_catalog('skill_graph') as skill_graph:
+        for skill, prerequisite in (('algorithms', 'problem_solving'),
+                                    ('problem_solving', 'algorithms')):
+            node = skill_graph.setdefault(
+                skill, {'related_skills': [], 'prerequisites': [], 'weight': 1.0})
+            node['prerequisites'] = [prerequisite]
+    profile['skills'] = {}
+    recommendation = next(rec for rec in advisor.recommend_paths(profile, len(advisor.job_index))
+                          if rec['career'] == career)
+    roadmap = advisor.build_roadmap(profile, recommendation)
+
+    cyclic = {'algorithms', 'problem_solving'}
+    assert len(roadmap.dependency_cycles) == 1
+    cycle = roadmap.dependency_cycles[0]
+    assert set(cycle) == cyclic and cycle[0] == cycle[-1]
+
+    order = [plan.skill for plan in roadmap.skill_plans]
+    assert cyclic <= set(order)
+    acyclic = [order.index(skill) for skill in order if skill not in cyclic]
+    assert acyclic and max(acyclic) < min(order.index(skill) for skill in cyclic)
+    scheduled = [skill for month in roadmap.schedule for skill in month.skills]
+    assert max(scheduled.index(skill) for skill in order if skill not in cyclic) < \
+        min(scheduled.index(skill) for skill in cyclic)
+
+
+def test_schedule_respects_time_availability(advisor, profile):
+    roadmap = advisor.build_roadmap(profile, recommendation_with_gaps(advisor, profile))
+    monthly_hours = profile['constraints']['time_availability'] * 4
+    assert roadmap.schedule
+    assert [month.month for month in roadmap.schedule] == \
+        list(range(1, len(roadmap.schedule) + 1))
+    for month in roadmap.schedule:
+        assert month.hours <= monthly_hours + 1e-9
+    assert sum(month.hours for month in roadmap.schedule) == \
+        pytest.approx(roadmap.study_hours)
+    assert roadmap.months_needed == len(roadmap.schedule)
+
+
+def test_roadmap_cache_ignores_older_scoring_versions(advisor, profile, tmp_path):
+    recommendation = recommendation_with_gaps(advisor, profile)
+    fresh = advisor.build_roadmap(profile, recommendation)
+    cache = SQLiteResultCache(tmp_path / 'results.sqlite')
+
+    # Roadmap dari versi skor lama di file cache yang sama
+    old = type(advisor)()
+    old.result_cache = cache
+    old.result_cache_version = lambda: advisor.result_cache_version().replace(
+        f"scoring-{SCORING_VERSION}", f"scoring-{SCORING_VERSION - 1}")
+    old._build_roadmap = lambda user_data, recommendation: 'old roadmap'
+    assert old.build_roadmap(profile, recommendation) == 'old roadmap'
+
+    advisor.result_cache = cache
+    assert advisor.build_roadmap(profile, recommendation) == fresh
+
+
+def test_learning_resources_are_built_once(advisor):
+    resources = advisor.get_learning_resources()
+    assert type(advisor)().get_learning_resources() is resources
+    type(advisor).reload_learning_resources()
+    rebuilt = advisor.get_learning_resources()
+    assert rebuilt is not resources
+    assert rebuilt == resources
+
+
+def test_roadmaps_use_the_shared_resources(advisor, profile):
+    roadmap = advisor.build_roadmap(profile, recommendation_with_gaps(advisor, profile))
+    resources = advisor.get_learning_resources()
+    for plan in roadmap.skill_plans:
+        if plan.skill in resources:
+            assert list(plan.steps) == list(resources[plan.skill]['steps'])
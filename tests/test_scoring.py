@@ -0,0 +1,59 @@
+import pytest
+
+from career_tc import RankingModel
+
+
+def test_calculate_score_matches_ranking(advisor, profiles):
+    for user_data in profiles[:40]:
+        user_data = advisor.normalize_profile(user_data)
+        expected = {rec['career']: rec['score']
+                    for rec in advisor.recommend_paths(user_data, len(advisor.job_index))}
+        for job_key, details in advisor.job_market.items():
+            assert advisor._calculate_score(user_data, job_key, details) == expected[job_key]
+
+
+def test_calculate_score_sees_in_place_edits(advisor, profile):
+    job_key, details = next(iter(advisor.job_market.items()))
+    before = advisor._calculate_score(profile, job_key, details)
+    for skill in details['required_skills']:
+        profile['skills'][skill] = 1.0
+    after = advisor._calculate_score(profile, job_key, details)
+    assert after > before
+    assert after == advisor._score_record(advisor.job_index[job_key],
+                                          advisor._user_context(profile))
+
+
+def test_calculate_score_after_catalog_edit(advisor, profile):
+    job_key, details = next(iter(advisor.job_market.items()))
+    advisor._calculate_score(profile, job_key, details)
+    with advisor.edit_catalog('job_market') as job_market:
+        job_market[job_key]['required_skills'] = ['python', 'sql']
+    details = advisor.job_market[job_key]
+    assert advisor._calculate_score(profile, job_key, details) == advisor._score_record(
+        advisor.job_index[job_key], advisor._user_context(profile))
+
+
+def brute_force_ranking(advisor, user_data, top_n):
+    user_context = advisor._user_context(user_data)
+    bonus = advisor.ranking_bonus() or [0.0] * len(advisor._job_records)
+    scored = [(advisor._score_record(record, user_context), position)
+              for position, record in enumerate(advisor._job_records)]
+    # sort stabil: skor sama tetap urut katalog
+    scored.sort(key=lambda item: -(item[0] + bonus[item[1]]))
+    return [(advisor._job_records[position].key, score) for score, position in scored[:top_n]]
+
+
+@pytest.mark.parametrize('top_n', [1, 3, 5])
+def test_pruned_ranking_matches_exhaustive_scan(advisor, profiles, top_n):
+    for user_data in profiles:
+        assert [(rec['career'], rec['score'])
+                for rec in advisor.recommend_paths(user_data, top_n)] == \
+            brute_force_ranking(advisor, user_data, top_n)
+
+
+def test_pruned_ranking_with_market_prior(advisor, profiles):
+    advisor.ranking = RankingModel(prior_weight=0.05)
+    for user_data in profiles:
+        assert [(rec['career'], rec['score'])
+                for rec in advisor.recommend_paths(user_data, 3)] == \
+            brute_force_ranking(advisor, user_data, 3)
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from career_service import CareerService, InProcessClient
+
+
+@pytest.fixture
+def client(advisor):
+    return InProcessClient(CareerService(advisor, max_delay=0.001))
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_health(client, advisor):
+    status, payload = run(client.get('/health'))
+    assert status == 200
+    assert payload == {'status': 'ok', 'catalog_version': advisor.catalog_version}
+
+
+def test_recommend_matches_advisor(client, advisor, profile):
+    status, payload = run(client.post('/recommend', {'profile': profile, 'top_n': 2}))
+    assert status == 200
+    expected = advisor.recommend_paths(advisor.normalize_profile(profile), 2)
+    assert [rec['career'] for rec in payload['recommendations']] == \
+        [rec['career'] for rec in expected]
+    assert len(payload['roadmaps']) == 2
+
+
+@pytest.mark.parametrize('top_n', [0, -1, 'many'])
+def test_recommend_rejects_bad_top_n(client, profile, top_n):
+    status, payload = run(client.post('/recommend', {'profile': profile, 'top_n': top_n}))
+    assert status == 400
+    assert 'error' in payload
+
+
+def test_recommend_caps_top_n_at_catalog_size(client, advisor, profile):
+    status, payload = run(client.post('/recommend', {'profile': profile, 'top_n': 10 ** 6,
+                                                     'roadmap': False}))
+    assert status == 200
+    assert len(payload['recommendations']) == len(advisor.job_index)
+
+
+def test_mixed_top_n_batch(client, advisor, profiles):
+    async def requests():
+        return await asyncio.gather(*(
+            client.post('/recommend', {'profile': user_data, 'top_n': 1 + i % 4,
+                                       'roadmap': False})
+            for i, user_data in enumerate(profiles[:20])))
+
+    responses = run(requests())
+    for i, (status, payload) in enumerate(responses):
+        assert status == 200
+        expected = advisor.recommend_paths(advisor.normalize_profile(profiles[i]), 1 + i % 4)
+        assert [rec['career'] for rec in payload['recommendations']] == \
+            [rec['career'] for rec in expected]
+
+
+def test_roadmap_needs_budget(client, profile):
+    del profile['constraints']['financial_investment']
+    status, _ = run(client.post('/recommend', {'profile': profile}))
+    assert status == 400
+
+
+def test_error_codes(client):
+    assert run(client.get('/recommend'))[0] == 405
+    assert run(client.get('/nowhere'))[0] == 404
+    assert run(client.get('/metrics/prometheus'))[0] == 404
+    assert run(client.service.handle('POST', '/recommend', b'{not json'))[0] == 400
+    assert run(client.service.handle('POST', '/recommend', b'[1, 2]'))[0] == 400
+
+
+def test_universities(client):
+    status, payload = run(client.get('/universities?page_size=5'))
+    assert status == 200
+    assert len(payload['items']) <= 5
+    assert payload['pages'] >= 1
+    assert run(client.get('/universities?sort=fame'))[0] == 400
+
+
+def test_metrics_count_requests(client):
+    run(client.get('/health'))
+    run(client.get('/nowhere'))
+    status, payload = run(client.get('/metrics'))
+    assert status == 200
+    assert payload['requests'] == 2
@@ -0,0 +1,76 @@
+import pytest
+
+from career_skills import SkillNormalizer, bounded_edit_distance, skill_key
+
+
+@pytest.fixture
+def normalizer():
+    return SkillNormalizer(['python', 'machine_learning', 'data_analysis', 'sql', 'java',
+                            'javascript'],
+                           {'ML': 'machine_learning', 'coding': 'python'})
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('Python', ('python', 'exact')),
+    ('Data-Analysis', ('data_analysis', 'exact')),
+    ('ml', ('machine_learning', 'exact')),
+    ('machine learn', ('machine_learning', 'prefix')),
+    ('pyhton', ('python', 'fuzzy')),
+    ('javscript', ('javascript', 'fuzzy')),
+    ('jav', (None, 'unknown')),
+    ('basket weaving', (None, 'unknown')),
+])
+def test_match(normalizer, name, expected):
+    assert normalizer.match(name) == expected
+
+
+def test_ambiguous_prefix_is_not_completed(normalizer):
+    # 'java' cocok persis; prefix 'javas' hanya mengarah ke javascript
+    assert normalizer.normalize('java') == 'java'
+    assert normalizer.normalize('javas') == 'javascript'
+
+
+def test_unknown_names_come_back_as_keys(normalizer):
+    assert normalizer.normalize('  Basket  Weaving ') == 'basket_weaving'
+    assert skill_key('Machine-Learning/AI') == 'machine_learning_ai'
+
+
+def test_edit_distance_bound():
+    assert bounded_edit_distance('python', 'pyhton', 2) == 1
+    assert bounded_edit_distance('python', 'java', 2) == 3
+    assert bounded_edit_distance('sql', 'sql', 0) == 0
+
+
+@pytest.mark.parametrize('word', ['laws', 'driving', 'printing', 'diving', 'geology', 'resign',
+                                  'reaching', 'expel', 'readership'])
+def test_ordinary_words_are_not_skills(advisor, word):
+    assert advisor.skill_normalizer.match(word) == (None, 'unknown')
+    assert advisor.normalize_skill_name(word) == word
+
+
+@pytest.mark.parametrize('typo, skill', [
+    ('pythn', 'python'),
+    ('excell', 'excel'),
+    ('comunication', 'communication'),
+    ('leadrship', 'leadership'),
+    ('statistcs', 'statistics'),
+    ('machne learning', 'machine_learning'),
+])
+def test_catalog_typos(advisor, typo, skill):
+    assert advisor.skill_normalizer.match(typo) == (skill, 'fuzzy')
+
+
+def test_short_terms_need_an_exact_match():
+    normalizer = SkillNormalizer(['aws', 'sql', 'excel', 'cloud_computing'],
+                                 {'aws': 'cloud_computing'})
+    assert normalizer.match('laws') == (None, 'unknown')
+    assert normalizer.match('sqll') == (None, 'unknown')
+    assert normalizer.match('expel') == (None, 'unknown')
+    assert normalizer.match('exel') == (None, 'unknown')
+    assert normalizer.match('excell') == ('excel', 'fuzzy')
+
+
+def test_advisor_normalizes_catalog_synonyms(advisor):
+    for synonym, skill in list(advisor.skill_synonyms.items())[:50]:
+        assert advisor.normalize_skill_name(synonym) == skill
+    assert advisor.normalize_skill_name('pyhton') == 'python'
@@ -0,0 +1,99 @@
+import pytest
+
+
+def options(advisor, career, rank_by_relevance=False):
+    recommendation = {'career': career, 'details': advisor.job_market[career]}
+    return advisor.university_options(recommendation, 5e7, rank_by_relevance)
+
+
+def test_indonesian_major_names_match_strengths(advisor):
+    relevant = [option for option in options(advisor, 'software_developer')
+                if option.relevant_strengths]
+    assert relevant
+    assert any('Computer Science' in option.relevant_strengths for option in relevant)
+
+
+def test_relevance_order_is_stable(advisor):
+    catalog = options(advisor, 'software_developer')
+    ranked = options(advisor, 'software_developer', rank_by_relevance=True)
+    assert [option.number for option in catalog] == list(range(1, len(catalog) + 1))
+    assert sorted(catalog, key=lambda option: -option.relevance) == ranked
+
+
+def test_options_read_the_precomputed_table(advisor):
+    for career in advisor.job_market:
+        for option in options(advisor, career) or ():
+            relevance = advisor.university_relevance[career].get(option.key)
+            if relevance is None:
+                assert option.relevant_strengths == [] and option.relevance == 0
+            else:
+                assert option.relevant_strengths == list(relevance.strengths)
+                assert option.relevance == relevance.score
+
+
+def test_search_by_cost_and_relevance(advisor):
+    page = advisor.search_universities(career='software_developer', max_total_cost=4e7)
+    costs = [option.total_degree_cost for option in page.items]
+    assert costs == sorted(costs) and all(cost <= 4e7 for cost in costs)
+    page = advisor.search_universities(career='software_developer', sort='relevance')
+    scores = [option.relevance for option in page.items]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_search_rejects_bad_arguments(advisor):
+    with pytest.raises(ValueError):
+        advisor.search_universities(sort='relevance')
+    with pytest.raises(ValueError):
+        advisor.search_universities(page=0)
+
+
+def scan_universities(advisor, max_total_cost=None, min_total_cost=None, types=None,
+                      location=None, strengths=()):
+    """Linear scan over the catalog with the same filters as search_universities"""
+    matches = []
+    for position, (key, uni) in enumerate(advisor.indonesian_universities.items(), 1):
+        cost = uni.get('cost_per_semester', 0) * 8
+        words = set(uni['location'].lower().replace('&', ' ').replace(',', ' ').split())
+        if ((max_total_cost is None or cost <= max_total_cost)
+                and (min_total_cost is None or cost >= min_total_cost)
+                and (types is None or uni['type'] in types)
+                and (location is None or set(location.lower().split()) <= words)
+                and set(strengths) <= set(uni.get('strengths', ()))):
+            matches.append((cost, position, key))
+    return [key for _, _, key in sorted(matches)]
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'max_total_cost': 4e7},
+    {'min_total_cost': 2e7, 'max_total_cost': 1e8},
+    {'types': ['negeri']},
+    {'location': 'jakarta'},
+    {'strengths': ['engineering']},
+    {'types': ['negeri'], 'strengths': ['engineering', 'computer_science'],
+     'max_total_cost': 8e7},
+])
+def test_search_matches_a_linear_scan(advisor, filters):
+    expected = scan_universities(advisor, **filters)
+    page = advisor.search_universities(page_size=1000, **filters)
+    assert page.total == len(expected)
+    assert [option.key for option in page.items] == expected
+
+
+def test_search_pages(advisor):
+    everything = advisor.search_universities(page_size=1000).items
+    pages = [advisor.search_universities(page=page, page_size=4)
+             for page in range(1, -(-len(everything) // 4) + 1)]
+    assert pages[0].pages == len(pages)
+    assert [option.key for page in pages for option in page.items] == \
+        [option.key for option in everything]
+    assert advisor.search_universities(page=len(pages) + 1, page_size=4).items == []
+
+
+def test_affordability_uses_the_budget(advisor):
+    page = advisor.search_universities(max_total_cost=5e7, page_size=1000)
+    for option in page.items:
+        assert option.affordability in ('free', 'affordable')
+    page = advisor.search_universities(user_budget=0, page_size=1000)
+    assert {option.affordability for option in page.items} <= {'free',
+                                                                'consider_alternatives'}